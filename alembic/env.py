@@ -3,6 +3,7 @@ from sqlalchemy import engine_from_config, pool
 import app.models.application
 import app.models.application_event
 import app.models.user
+import app.models.user_status_count
 from alembic import context
 from app.core.config import settings
 from app.models.base import Base
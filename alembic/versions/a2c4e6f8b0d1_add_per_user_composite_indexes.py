@@ -0,0 +1,72 @@
+"""add per-user composite indexes on applications
+
+Revision ID: a2c4e6f8b0d1
+Revises: f1b3d5c7a9e2
+Create Date: 2026-10-18 00:50:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "a2c4e6f8b0d1"
+down_revision: str | Sequence[str] | None = "f1b3d5c7a9e2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+COMPOSITE_INDEXES = [
+    ("ix_applications_user_created_at", ["user_id", "created_at"], None),
+    ("ix_applications_user_status", ["user_id", "status"], None),
+    (
+        "ix_applications_user_follow_up_at",
+        ["user_id", "follow_up_at"],
+        "follow_up_at IS NOT NULL",
+    ),
+    (
+        "ix_applications_user_recruiter_email",
+        ["user_id", sa.text("lower(trim(recruiter_email))")],
+        None,
+    ),
+]
+
+
+def upgrade() -> None:
+    concurrently = op.get_bind().dialect.name == "postgresql"
+
+    for name, columns, where in COMPOSITE_INDEXES:
+        kwargs = {"if_not_exists": True}
+        if where is not None:
+            kwargs["postgresql_where"] = sa.text(where)
+            kwargs["sqlite_where"] = sa.text(where)
+
+        if concurrently:
+            # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+            with op.get_context().autocommit_block():
+                op.create_index(
+                    name,
+                    "applications",
+                    columns,
+                    postgresql_concurrently=True,
+                    **kwargs,
+                )
+        else:
+            op.create_index(name, "applications", columns, **kwargs)
+
+
+def downgrade() -> None:
+    concurrently = op.get_bind().dialect.name == "postgresql"
+
+    for name, _, _ in reversed(COMPOSITE_INDEXES):
+        if concurrently:
+            with op.get_context().autocommit_block():
+                op.drop_index(
+                    name,
+                    table_name="applications",
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
+        else:
+            op.drop_index(name, table_name="applications", if_exists=True)
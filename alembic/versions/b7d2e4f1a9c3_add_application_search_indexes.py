@@ -0,0 +1,130 @@
+"""add application search indexes
+
+Revision ID: b7d2e4f1a9c3
+Revises: e29f7a9f5c31
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "b7d2e4f1a9c3"
+down_revision: str | Sequence[str] | None = "e29f7a9f5c31"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+TRIGRAM_INDEXED_COLUMNS = ["company_name", "position", "recruiter_email"]
+
+SQLITE_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS applications_fts USING fts5(
+        company_name,
+        position,
+        recruiter_email,
+        content='applications',
+        content_rowid='id',
+        tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_ai
+    AFTER INSERT ON applications BEGIN
+        INSERT INTO applications_fts(
+            rowid, company_name, position, recruiter_email
+        )
+        VALUES (
+            new.id, new.company_name, new.position, new.recruiter_email
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_ad
+    AFTER DELETE ON applications BEGIN
+        INSERT INTO applications_fts(
+            applications_fts, rowid, company_name, position, recruiter_email
+        )
+        VALUES (
+            'delete',
+            old.id,
+            old.company_name,
+            old.position,
+            old.recruiter_email
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_au
+    AFTER UPDATE OF company_name, position, recruiter_email ON applications
+    BEGIN
+        INSERT INTO applications_fts(
+            applications_fts, rowid, company_name, position, recruiter_email
+        )
+        VALUES (
+            'delete',
+            old.id,
+            old.company_name,
+            old.position,
+            old.recruiter_email
+        );
+        INSERT INTO applications_fts(
+            rowid, company_name, position, recruiter_email
+        )
+        VALUES (
+            new.id, new.company_name, new.position, new.recruiter_email
+        );
+    END
+    """,
+    "INSERT INTO applications_fts(applications_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+        indexes = {
+            index["name"]
+            for index in sa.inspect(bind).get_indexes("applications")
+        }
+        for column_name in TRIGRAM_INDEXED_COLUMNS:
+            index_name = f"ix_applications_{column_name}_trgm"
+            if index_name not in indexes:
+                op.create_index(
+                    index_name,
+                    "applications",
+                    [column_name],
+                    postgresql_using="gin",
+                    postgresql_ops={column_name: "gin_trgm_ops"},
+                )
+
+    if (
+        bind.dialect.name == "sqlite"
+        and (bind.dialect.server_version_info or ()) >= (3, 34, 0)
+    ):
+        for statement in SQLITE_FTS_DDL:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        for column_name in TRIGRAM_INDEXED_COLUMNS:
+            op.execute(
+                f"DROP INDEX IF EXISTS ix_applications_{column_name}_trgm"
+            )
+
+    if bind.dialect.name == "sqlite":
+        for trigger_name in [
+            "applications_fts_ai",
+            "applications_fts_ad",
+            "applications_fts_au",
+        ]:
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
+        op.execute("DROP TABLE IF EXISTS applications_fts")
@@ -0,0 +1,72 @@
+"""add user status counts rollup
+
+Revision ID: c3f8a1d5e7b2
+Revises: b7d2e4f1a9c3
+Create Date: 2026-10-18 00:10:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "c3f8a1d5e7b2"
+down_revision: str | Sequence[str] | None = "b7d2e4f1a9c3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+APPLICATION_STATUS_ENUM = postgresql.ENUM(
+    "applied",
+    "screening",
+    "interview",
+    "offer",
+    "accepted",
+    "rejected",
+    name="applicationstatus",
+    create_type=False,
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if "user_status_counts" not in inspector.get_table_names():
+        op.create_table(
+            "user_status_counts",
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("status", APPLICATION_STATUS_ENUM, nullable=False),
+            sa.Column(
+                "count",
+                sa.Integer(),
+                nullable=False,
+                server_default="0",
+            ),
+            sa.ForeignKeyConstraint(
+                ["user_id"],
+                ["users.id"],
+                ondelete="CASCADE",
+            ),
+            sa.PrimaryKeyConstraint("user_id", "status"),
+        )
+
+    op.execute("DELETE FROM user_status_counts")
+    op.execute(
+        """
+        INSERT INTO user_status_counts (user_id, status, count)
+        SELECT user_id, status, count(*)
+        FROM applications
+        GROUP BY user_id, status
+        """
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if "user_status_counts" in inspector.get_table_names():
+        op.drop_table("user_status_counts")
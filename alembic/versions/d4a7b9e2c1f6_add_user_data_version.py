@@ -0,0 +1,43 @@
+"""add user data version
+
+Revision ID: d4a7b9e2c1f6
+Revises: c3f8a1d5e7b2
+Create Date: 2026-10-18 00:20:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "d4a7b9e2c1f6"
+down_revision: str | Sequence[str] | None = "c3f8a1d5e7b2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = {column["name"] for column in inspector.get_columns("users")}
+
+    if "data_version" not in columns:
+        op.add_column(
+            "users",
+            sa.Column(
+                "data_version",
+                sa.Integer(),
+                nullable=False,
+                server_default="0",
+            ),
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = {column["name"] for column in inspector.get_columns("users")}
+
+    if "data_version" in columns:
+        op.drop_column("users", "data_version")
@@ -0,0 +1,87 @@
+"""add application updated_at and row version
+
+Revision ID: e8c2f4a6b1d3
+Revises: d4a7b9e2c1f6
+Create Date: 2026-10-18 00:30:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "e8c2f4a6b1d3"
+down_revision: str | Sequence[str] | None = "d4a7b9e2c1f6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _sqlite_triggers(bind, table_name: str) -> list[str]:
+    if bind.dialect.name != "sqlite":
+        return []
+    return list(
+        bind.scalars(
+            sa.text(
+                "SELECT sql FROM sqlite_master "
+                "WHERE type = 'trigger' AND tbl_name = :table_name"
+            ),
+            {"table_name": table_name},
+        )
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = {
+        column["name"] for column in inspector.get_columns("applications")
+    }
+
+    if "updated_at" not in columns:
+        # SQLite cannot ADD COLUMN with a non-constant default, so add the
+        # column bare, backfill it, then attach the default and NOT NULL.
+        op.add_column(
+            "applications",
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        )
+        op.execute(
+            "UPDATE applications SET updated_at = "
+            "COALESCE(status_updated_at, created_at, CURRENT_TIMESTAMP)"
+        )
+        # Batch mode rebuilds the table on SQLite, which drops its triggers
+        # (the FTS sync triggers among them); recreate them afterwards.
+        triggers = _sqlite_triggers(bind, "applications")
+        with op.batch_alter_table("applications") as batch_op:
+            batch_op.alter_column(
+                "updated_at",
+                existing_type=sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.text("CURRENT_TIMESTAMP"),
+            )
+        for statement in triggers:
+            op.execute(statement)
+
+    if "version" not in columns:
+        op.add_column(
+            "applications",
+            sa.Column(
+                "version",
+                sa.Integer(),
+                nullable=False,
+                server_default="1",
+            ),
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = {
+        column["name"] for column in inspector.get_columns("applications")
+    }
+
+    if "version" in columns:
+        op.drop_column("applications", "version")
+    if "updated_at" in columns:
+        op.drop_column("applications", "updated_at")
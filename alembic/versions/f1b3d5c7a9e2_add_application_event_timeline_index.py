@@ -0,0 +1,49 @@
+"""add application event timeline index
+
+Revision ID: f1b3d5c7a9e2
+Revises: e8c2f4a6b1d3
+Create Date: 2026-10-18 00:40:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "f1b3d5c7a9e2"
+down_revision: str | Sequence[str] | None = "e8c2f4a6b1d3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TIMELINE_INDEX = "ix_application_events_timeline"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    indexes = {
+        index["name"] for index in inspector.get_indexes("application_events")
+    }
+
+    if TIMELINE_INDEX not in indexes:
+        op.create_index(
+            TIMELINE_INDEX,
+            "application_events",
+            [
+                "application_id",
+                sa.text("created_at DESC"),
+                sa.text("id DESC"),
+            ],
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    indexes = {
+        index["name"] for index in inspector.get_indexes("application_events")
+    }
+
+    if TIMELINE_INDEX in indexes:
+        op.drop_index(TIMELINE_INDEX, table_name="application_events")
@@ -1,26 +1,28 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from jose import JWTError
 
 from app.core.config import settings
-from app.core.database import get_db
-from app.models.user import User
+from app.core.database import (
+    DbSession,
+    get_db,
+    get_replica_db,
+    is_pinned_to_primary,
+    run_db,
+)
+from app.core.security import decode_access_token
+from app.schemas.auth import CurrentUser
+from app.services.user_service import get_cached_principal, get_principal
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
-ALGORITHM = "HS256"
 
 
-def get_current_user(
-    db: Session = Depends(get_db),
+async def get_current_user(
+    db: DbSession = Depends(get_db),
     token: str = Depends(oauth2_scheme),
-) -> User:
+) -> CurrentUser:
     try:
-        payload = jwt.decode(
-            token,
-            settings.secret_key,
-            algorithms=[ALGORITHM],
-        )
+        payload = decode_access_token(token)
         email: str | None = payload.get("sub")
         if not email:
             raise ValueError
@@ -30,10 +32,33 @@ def get_current_user(
             detail="Invalid token",
         ) from err
 
-    user = db.query(User).filter(User.email == email).first()
+    user_id = payload.get("uid")
+    if settings.auth_trust_token_user_id and isinstance(user_id, int):
+        return CurrentUser(id=user_id, email=email)
+
+    user = get_cached_principal(email)
+    if user is None:
+        user = await run_db(db, get_principal, email=email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
     return user
+
+
+def get_read_db(
+    request: Request,
+    db: DbSession = Depends(get_db),
+    replica: DbSession | None = Depends(get_replica_db),
+    user: CurrentUser = Depends(get_current_user),
+) -> DbSession:
+    """Session for read-only endpoints that tolerate replica lag.
+
+    Uses the replica when one is configured, except for clients whose
+    read-your-writes cookie shows a commit within the last
+    ``read_your_writes_seconds``.
+    """
+    if replica is None or is_pinned_to_primary(request.cookies):
+        return db
+    return replica
@@ -1,15 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 
-from app.api.deps import get_current_user
-from app.core.database import get_db
-from app.models.application_event import ApplicationEventType
-from app.models.user import User
+from app.api.deps import get_current_user, get_read_db
+from app.core.database import DbSession, get_db, run_db
+from app.core.etag import etag_matches, make_etag
+from app.core.pagination import InvalidCursorError
 from app.schemas.application_event import ApplicationEventOut
 from app.schemas.application_note import ApplicationNoteCreate
+from app.schemas.auth import CurrentUser
 from app.services.application_event_service import (
-    create_event,
+    create_application_note,
     get_application_timeline,
+    get_timeline_version,
 )
 from app.services.application_service import get_application_by_id
 
@@ -20,41 +21,68 @@ router = APIRouter(
 
 
 @router.get("/timeline", response_model=list[ApplicationEventOut])
-def application_timeline(
+async def application_timeline(
     app_id: int,
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    response: Response,
+    limit: int | None = Query(default=None, ge=1, le=200),
+    before: str | None = None,
+    if_none_match: str | None = Header(default=None),
+    db: DbSession = Depends(get_read_db),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    application = get_application_by_id(db=db, user_id=user.id, app_id=app_id)
-    if application is None:
-        raise HTTPException(status_code=404, detail="Application not found")
-
-    return get_application_timeline(
-        db=db,
+    latest_event_id = await run_db(
+        db,
+        get_timeline_version,
         user_id=user.id,
         application_id=app_id,
     )
+    if latest_event_id is None:
+        raise HTTPException(status_code=404, detail="Application not found")
+
+    headers = {
+        "ETag": make_etag("timeline", app_id, latest_event_id, limit, before),
+        "Cache-Control": "private, no-cache",
+    }
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    try:
+        events, next_cursor = await run_db(
+            db,
+            get_application_timeline,
+            user_id=user.id,
+            application_id=app_id,
+            limit=limit,
+            before=before,
+        )
+    except InvalidCursorError as err:
+        raise HTTPException(status_code=400, detail=str(err)) from err
+
+    response.headers.update(headers)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return events
 
 
 @router.post("/notes", response_model=ApplicationEventOut, status_code=201)
-def create_application_note(
+async def create_application_note_endpoint(
     app_id: int,
     payload: ApplicationNoteCreate,
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    db: DbSession = Depends(get_db),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    application = get_application_by_id(db=db, user_id=user.id, app_id=app_id)
+    application = await run_db(
+        db,
+        get_application_by_id,
+        user_id=user.id,
+        app_id=app_id,
+    )
     if application is None:
         raise HTTPException(status_code=404, detail="Application not found")
 
-    event = create_event(
-        db=db,
-        user_id=application.user_id,
-        application_id=application.id,
-        event_type=ApplicationEventType.note,
+    return await run_db(
+        db,
+        create_application_note,
+        application=application,
         note=payload.note,
     )
-
-    db.commit()
-    db.refresh(event)
-    return event
@@ -1,44 +1,92 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import datetime
+from typing import Literal
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
-from app.core.database import get_db
+from app.api.deps import get_current_user, get_read_db
+from app.api.v1.applications_analytics import cached_analytics_response
+from app.core.database import DbSession, get_db, run_db
+from app.core.etag import etag_matches, http_date, make_etag
+from app.core.pagination import InvalidCursorError
 from app.models.application import ApplicationStatus
-from app.models.user import User
 from app.schemas.analytics import StatusDurationOut
 from app.schemas.application import (
+    ApplicationBulkUpdate,
+    ApplicationBulkUpdateResult,
     ApplicationCreate,
+    ApplicationImportResult,
     ApplicationOut,
     ApplicationUpdate,
+    CursorPaginatedApplications,
     PaginatedApplications,
 )
+from app.schemas.auth import CurrentUser
 from app.services.application_analytics_service import (
     get_status_duration_metrics,
 )
+from app.services.application_export_service import (
+    EXPORT_MEDIA_TYPES,
+    aiter_export,
+    iter_export,
+)
+from app.services.application_import_service import (
+    IMPORT_CONTENT_TYPES,
+    import_applications,
+)
 from app.services.application_service import (
+    bulk_update_applications,
+    count_user_applications,
     create_application,
     delete_application,
     get_application_by_id,
     get_application_conflict_detail,
+    get_application_version,
     get_due_followups,
     get_user_applications,
+    get_user_applications_by_cursor,
     update_application,
 )
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
 
+def _application_headers(
+    app_id: int,
+    version: int,
+    updated_at: datetime,
+) -> dict[str, str]:
+    return {
+        "ETag": make_etag("application", app_id, version),
+        "Last-Modified": http_date(updated_at),
+        "Cache-Control": "private, no-cache",
+    }
+
+
 @router.post("", response_model=ApplicationOut, status_code=201)
-def create_application_endpoint(
+async def create_application_endpoint(
     payload: ApplicationCreate,
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    db: DbSession = Depends(get_db),
+    user: CurrentUser = Depends(get_current_user),
 ):
     try:
-        return create_application(db=db, user_id=user.id, payload=payload)
+        return await run_db(
+            db,
+            create_application,
+            user_id=user.id,
+            payload=payload,
+        )
     except IntegrityError as err:
-        db.rollback()
         detail = get_application_conflict_detail(err)
         if detail is not None:
             raise HTTPException(status_code=409, detail=detail) from err
@@ -48,19 +96,50 @@ def create_application_endpoint(
         ) from err
 
 
-@router.get("", response_model=PaginatedApplications)
-def list_applications(
+@router.get(
+    "",
+    response_model=PaginatedApplications | CursorPaginatedApplications,
+)
+async def list_applications(
+    response: Response,
     status: ApplicationStatus | None = Query(default=None),
     company: str | None = Query(default=None),
     q: str | None = Query(default=None),
     sort: str = Query(default="-created_at"),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    pagination: Literal["offset", "cursor"] = Query(default="offset"),
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=True),
+    estimate_total: bool = Query(default=False),
+    db: DbSession = Depends(get_read_db),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    items, total = get_user_applications(
-        db=db,
+    if pagination == "cursor" or cursor is not None:
+        try:
+            items, next_cursor = await run_db(
+                db,
+                get_user_applications_by_cursor,
+                user_id=user.id,
+                status=status,
+                company=company,
+                q=q,
+                sort=sort,
+                cursor=cursor,
+                page_size=page_size,
+            )
+        except InvalidCursorError as err:
+            raise HTTPException(status_code=400, detail=str(err)) from err
+
+        return {
+            "items": items,
+            "next_cursor": next_cursor,
+            "page_size": page_size,
+        }
+
+    items, total = await run_db(
+        db,
+        get_user_applications,
         user_id=user.id,
         status=status,
         company=company,
@@ -68,8 +147,22 @@ def list_applications(
         sort=sort,
         page=page,
         page_size=page_size,
+        include_total=include_total and not estimate_total,
     )
 
+    if include_total and estimate_total:
+        total, is_estimate = await run_db(
+            db,
+            count_user_applications,
+            user_id=user.id,
+            status=status,
+            company=company,
+            q=q,
+            estimate=True,
+        )
+        if is_estimate:
+            response.headers["X-Total-Estimated"] = "true"
+
     return {
         "items": items,
         "total": total,
@@ -78,50 +171,156 @@ def list_applications(
     }
 
 
+@router.post("/import", response_model=ApplicationImportResult)
+async def import_applications_endpoint(
+    request: Request,
+    format: Literal["csv", "jsonl"] | None = None,
+    db: DbSession = Depends(get_db),
+    user: CurrentUser = Depends(get_current_user),
+):
+    content_type = request.headers.get("content-type", "")
+    import_format = format or IMPORT_CONTENT_TYPES.get(
+        content_type.split(";")[0].strip().lower()
+    )
+    if import_format is None:
+        raise HTTPException(
+            status_code=415,
+            detail="Send text/csv or application/x-ndjson, or pass ?format=",
+        )
+
+    try:
+        return await import_applications(
+            db=db,
+            user_id=user.id,
+            chunks=request.stream(),
+            import_format=import_format,
+        )
+    except UnicodeDecodeError as err:
+        raise HTTPException(
+            status_code=400,
+            detail="Import must be UTF-8 encoded",
+        ) from err
+
+
+@router.patch("", response_model=ApplicationBulkUpdateResult)
+async def bulk_update_applications_endpoint(
+    payload: ApplicationBulkUpdate,
+    db: DbSession = Depends(get_db),
+    user: CurrentUser = Depends(get_current_user),
+):
+    try:
+        return await run_db(
+            db,
+            bulk_update_applications,
+            user_id=user.id,
+            payload=payload.update,
+            ids=payload.ids,
+            filters=payload.filter,
+        )
+    except ValueError as err:
+        raise HTTPException(status_code=422, detail=str(err)) from err
+
+
+@router.get("/export")
+async def export_applications_endpoint(
+    format: Literal["csv", "ndjson"] = "ndjson",
+    gzip: bool = False,
+    db: DbSession = Depends(get_db),
+    user: CurrentUser = Depends(get_current_user),
+):
+    export = aiter_export if isinstance(db, AsyncSession) else iter_export
+    headers = {
+        "Content-Disposition": f'attachment; filename="applications.{format}"',
+    }
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+
+    # Needs FastAPI >= 0.118, which closes ``db`` only after the body is sent.
+    return StreamingResponse(
+        export(db=db, user_id=user.id, export_format=format, compress=gzip),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers=headers,
+    )
+
+
 @router.get("/followups", response_model=list[ApplicationOut])
-def upcoming_followups(
+async def upcoming_followups(
     days: int = Query(default=3, ge=1, le=30),
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    db: DbSession = Depends(get_read_db),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    return get_due_followups(db=db, user_id=user.id, days=days)
+    return await run_db(db, get_due_followups, user_id=user.id, days=days)
 
 
 @router.get("/{app_id}", response_model=ApplicationOut)
-def get_application(
+async def get_application(
     app_id: int,
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    db: DbSession = Depends(get_db),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    application = get_application_by_id(db=db, user_id=user.id, app_id=app_id)
+    if if_none_match is not None:
+        version = await run_db(
+            db,
+            get_application_version,
+            user_id=user.id,
+            app_id=app_id,
+        )
+        if version is None:
+            raise HTTPException(status_code=404, detail="Application not found")
+        headers = _application_headers(app_id, *version)
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+    application = await run_db(
+        db,
+        get_application_by_id,
+        user_id=user.id,
+        app_id=app_id,
+    )
 
     if application is None:
         raise HTTPException(status_code=404, detail="Application not found")
 
+    response.headers.update(
+        _application_headers(
+            application.id,
+            application.version,
+            application.updated_at,
+        )
+    )
     return application
 
 
 @router.patch("/{app_id}", response_model=ApplicationOut)
-def update_application_endpoint(
+async def update_application_endpoint(
     app_id: int,
     payload: ApplicationUpdate,
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    response: Response,
+    db: DbSession = Depends(get_db),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    application = get_application_by_id(db=db, user_id=user.id, app_id=app_id)
+    application = await run_db(
+        db,
+        get_application_by_id,
+        user_id=user.id,
+        app_id=app_id,
+        for_update=True,
+    )
 
     if application is None:
         raise HTTPException(status_code=404, detail="Application not found")
 
     try:
-        return update_application(
-            db=db,
+        application = await run_db(
+            db,
+            update_application,
             user_id=user.id,
             application=application,
             payload=payload,
         )
     except IntegrityError as err:
-        db.rollback()
         detail = get_application_conflict_detail(err)
         if detail is not None:
             raise HTTPException(status_code=409, detail=detail) from err
@@ -130,27 +329,50 @@ def update_application_endpoint(
             detail="Application data conflict",
         ) from err
     except ValueError as err:
-        db.rollback()
         raise HTTPException(status_code=422, detail=str(err)) from err
 
+    response.headers.update(
+        _application_headers(
+            application.id,
+            application.version,
+            application.updated_at,
+        )
+    )
+    return application
+
 
 @router.delete("/{app_id}", status_code=204)
-def delete_application_endpoint(
+async def delete_application_endpoint(
     app_id: int,
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    db: DbSession = Depends(get_db),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    application = get_application_by_id(db=db, user_id=user.id, app_id=app_id)
+    application = await run_db(
+        db,
+        get_application_by_id,
+        user_id=user.id,
+        app_id=app_id,
+        for_update=True,
+    )
 
     if application is None:
         raise HTTPException(status_code=404, detail="Application not found")
 
-    delete_application(db=db, application=application)
+    await run_db(db, delete_application, application=application)
 
 
 @router.get("/analytics/status-duration", response_model=StatusDurationOut)
-def application_status_duration_analytics(
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+async def application_status_duration_analytics(
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    db: DbSession = Depends(get_read_db),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    return get_status_duration_metrics(db=db, user_id=user.id)
+    return await cached_analytics_response(
+        db=db,
+        user=user,
+        response=response,
+        if_none_match=if_none_match,
+        key="status-duration",
+        compute=get_status_duration_metrics,
+    )
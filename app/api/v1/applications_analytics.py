@@ -1,17 +1,23 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from collections.abc import Callable
+from functools import partial
 
-from app.api.deps import get_current_user
-from app.core.database import get_db
-from app.models.user import User
+from fastapi import APIRouter, Depends, Header, Query, Response
+
+from app.api.deps import get_current_user, get_read_db
+from app.core.database import DbSession, run_db
 from app.schemas.analytics import (
+    AnalyticsDashboardOut,
     ApplicationsFunnelOut,
     ApplicationsSummaryOut,
+    DashboardSection,
     RecruiterPerformanceOut,
     RecruiterPerformanceV2Out,
     TimeToStatusOut,
 )
+from app.schemas.auth import CurrentUser
+from app.services.analytics_cache_service import get_cached_analytics
 from app.services.application_analytics_service import (
+    get_analytics_dashboard,
     get_applications_summary,
     get_funnel,
     get_recruiter_performance,
@@ -25,44 +31,136 @@ router = APIRouter(
 )
 
 
+async def cached_analytics_response(
+    *,
+    db: DbSession,
+    user: CurrentUser,
+    response: Response,
+    if_none_match: str | None,
+    key: str,
+    compute: Callable[..., dict],
+) -> dict | Response:
+    etag, payload = await run_db(
+        db,
+        get_cached_analytics,
+        user_id=user.id,
+        key=key,
+        compute=compute,
+        if_none_match=if_none_match,
+    )
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if payload is None:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return payload
+
+
 @router.get("/summary", response_model=ApplicationsSummaryOut)
-def applications_summary(
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+async def applications_summary(
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    db: DbSession = Depends(get_read_db),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    return get_applications_summary(db=db, user_id=user.id)
+    return await cached_analytics_response(
+        db=db,
+        user=user,
+        response=response,
+        if_none_match=if_none_match,
+        key="summary",
+        compute=get_applications_summary,
+    )
 
 
 @router.get("/time-to-status", response_model=TimeToStatusOut)
-def applications_time_to_status(
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+async def applications_time_to_status(
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    db: DbSession = Depends(get_read_db),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    return get_time_to_status(db=db, user_id=user.id)
+    return await cached_analytics_response(
+        db=db,
+        user=user,
+        response=response,
+        if_none_match=if_none_match,
+        key="time-to-status",
+        compute=get_time_to_status,
+    )
 
 
 @router.get("/funnel", response_model=ApplicationsFunnelOut)
-def applications_funnel(
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+async def applications_funnel(
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    db: DbSession = Depends(get_read_db),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    return get_funnel(db=db, user_id=user.id)
+    return await cached_analytics_response(
+        db=db,
+        user=user,
+        response=response,
+        if_none_match=if_none_match,
+        key="funnel",
+        compute=get_funnel,
+    )
 
 
 @router.get("/recruiter-performance", response_model=RecruiterPerformanceOut)
-def applications_recruiter_performance(
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+async def applications_recruiter_performance(
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    db: DbSession = Depends(get_read_db),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    return get_recruiter_performance(db=db, user_id=user.id)
+    return await cached_analytics_response(
+        db=db,
+        user=user,
+        response=response,
+        if_none_match=if_none_match,
+        key="recruiter-performance",
+        compute=get_recruiter_performance,
+    )
 
 
 @router.get(
     "/recruiter-performance-v2",
     response_model=RecruiterPerformanceV2Out,
 )
-def applications_recruiter_performance_v2(
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+async def applications_recruiter_performance_v2(
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    db: DbSession = Depends(get_read_db),
+    user: CurrentUser = Depends(get_current_user),
+):
+    return await cached_analytics_response(
+        db=db,
+        user=user,
+        response=response,
+        if_none_match=if_none_match,
+        key="recruiter-performance-v2",
+        compute=get_recruiter_performance_v2,
+    )
+
+
+@router.get(
+    "/dashboard",
+    response_model=AnalyticsDashboardOut,
+    response_model_exclude_unset=True,
+)
+async def applications_dashboard(
+    response: Response,
+    sections: list[DashboardSection] | None = Query(default=None),
+    if_none_match: str | None = Header(default=None),
+    db: DbSession = Depends(get_read_db),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    return get_recruiter_performance_v2(db=db, user_id=user.id)
+    requested = set(sections or DashboardSection)
+    return await cached_analytics_response(
+        db=db,
+        user=user,
+        response=response,
+        if_none_match=if_none_match,
+        key="dashboard:" + ",".join(sorted(requested)),
+        compute=partial(get_analytics_dashboard, sections=requested),
+    )
@@ -1,61 +1,93 @@
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import DbSession, get_db, run_db
 from app.core.rate_limiter import rate_limit
 from app.core.security import (
+    PasswordHasherBusyError,
     create_access_token,
-    hash_password,
-    verify_password,
+    password_hasher,
 )
-from app.models.user import User
 from app.schemas.auth import RegisterIn, TokenOut
+from app.services.user_service import (
+    create_user,
+    get_user_by_email,
+    update_user_password_hash,
+)
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def _hasher_busy(err: PasswordHasherBusyError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(err),
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/register", response_model=TokenOut, status_code=201)
-def register(
+async def register(
     request: Request,
     payload: RegisterIn,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
 ):
     ip = request.client.host if request.client else "unknown"
-    rate_limit(key=f"ip:{ip}:register", limit=10, window_seconds=60)
+    await rate_limit(key=f"ip:{ip}:register", limit=10, window_seconds=60)
 
-    exists = db.query(User).filter(User.email == payload.email).first()
+    exists = await run_db(db, get_user_by_email, email=payload.email)
     if exists:
         raise HTTPException(status_code=400, detail="User already exists")
 
-    user = User(
+    try:
+        hashed_password = await password_hasher.hash(payload.password)
+    except PasswordHasherBusyError as err:
+        raise _hasher_busy(err) from err
+
+    user = await run_db(
+        db,
+        create_user,
         email=payload.email,
-        hashed_password=hash_password(payload.password),
+        hashed_password=hashed_password,
     )
 
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-
-    token = create_access_token(subject=user.email)
+    token = create_access_token(subject=user.email, user_id=user.id)
     return {"access_token": token, "token_type": "bearer"}
 
 
 @router.post("/login", response_model=TokenOut)
-def login(
+async def login(
     request: Request,
     form: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
 ):
     ip = request.client.host if request.client else "unknown"
-    rate_limit(key=f"ip:{ip}:login", limit=20, window_seconds=60)
+    await rate_limit(key=f"ip:{ip}:login", limit=20, window_seconds=60)
+
+    user = await run_db(db, get_user_by_email, email=form.username)
+    valid, new_hash = False, None
+    if user:
+        try:
+            valid, new_hash = await password_hasher.verify_and_rehash(
+                form.password,
+                user.hashed_password,
+            )
+        except PasswordHasherBusyError as err:
+            raise _hasher_busy(err) from err
 
-    user = db.query(User).filter(User.email == form.username).first()
-    if not user or not verify_password(form.password, user.hashed_password):
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
         )
 
-    token = create_access_token(subject=user.email)
+    if new_hash is not None:
+        await run_db(
+            db,
+            update_user_password_hash,
+            user=user,
+            hashed_password=new_hash,
+        )
+
+    token = create_access_token(subject=user.email, user_id=user.id)
     return {"access_token": token, "token_type": "bearer"}
@@ -0,0 +1,51 @@
+"""Maintenance commands.
+
+    python -m app.cli status-rollup check [--user-id ID]
+    python -m app.cli status-rollup rebuild [--user-id ID]
+"""
+
+import argparse
+import sys
+
+from app.core.database import SessionLocal
+from app.services.status_rollup_service import (
+    check_status_rollup,
+    rebuild_status_rollup,
+)
+
+
+def status_rollup(args: argparse.Namespace) -> int:
+    with SessionLocal() as db:
+        if args.action == "rebuild":
+            written = rebuild_status_rollup(db=db, user_id=args.user_id)
+            print(f"Rebuilt status rollup: {written} rows")
+            return 0
+
+        mismatches = check_status_rollup(db=db, user_id=args.user_id)
+        for mismatch in mismatches:
+            print(
+                f"user={mismatch['user_id']} status={mismatch['status'].value} "
+                f"expected={mismatch['expected']} stored={mismatch['stored']}"
+            )
+        print(f"{len(mismatches)} mismatched rows")
+        return 1 if mismatches else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rollup = commands.add_parser(
+        "status-rollup",
+        help="Check or rebuild the per-user status counts",
+    )
+    rollup.add_argument("action", choices=["check", "rebuild"])
+    rollup.add_argument("--user-id", type=int, default=None)
+    rollup.set_defaults(handler=status_rollup)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -5,6 +7,23 @@ class Settings(BaseSettings):
     app_name: str = "Job Tracker API"
     secret_key: str
     access_token_expire_minutes: int = 60
+    auth_trust_token_user_id: bool = False
+    principal_cache_ttl_seconds: float = 60.0
+    principal_cache_max_entries: int = 10_000
+    token_cache_enabled: bool = True
+    token_cache_max_entries: int = 10_000
+
+    rate_limit_backend: Literal["memory", "sqlite", "redis"] = "memory"
+    rate_limit_sqlite_path: str = "/tmp/job-tracker-rate-limits.sqlite3"
+    rate_limit_redis_url: str = "redis://localhost:6379/0"
+    rate_limit_shards: int = 16
+    rate_limit_max_keys: int = 100_000
+    rate_limit_sweep_interval_seconds: float = 60.0
+
+    bcrypt_rounds: int = 12
+    password_hash_executor: Literal["thread", "process"] = "thread"
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 32
 
     postgres_host: str = "db"
     postgres_port: int = 5432
@@ -12,14 +31,61 @@ class Settings(BaseSettings):
     postgres_user: str = "jobtracker"
     postgres_password: str = "jobtracker"
 
-    @property
-    def database_url(self) -> str:
+    database_mode: Literal["sync", "async"] = "sync"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 2.0
+    db_pool_recycle_seconds: int = 1_800
+    db_pool_pre_ping: bool = True
+    db_statement_timeout_ms: int = 0
+    db_retry_after_seconds: int = 1
+    db_pgbouncer: bool = False
+
+    postgres_replica_host: str | None = None
+    read_your_writes_seconds: float = 5.0
+
+    count_cache_ttl_seconds: float = 30.0
+    count_cache_max_users: int = 10_000
+    count_estimate_sample_size: int = 5_000
+
+    bulk_update_max_items: int = 1_000
+    import_batch_size: int = 1_000
+    import_max_reported_errors: int = 1_000
+    import_max_record_chars: int = 65_536
+
+    analytics_cache_ttl_seconds: float = 300.0
+    analytics_cache_max_entries: int = 10_000
+
+    server_timing_enabled: bool = True
+    metrics_enabled: bool = True
+
+    def _postgres_url(self, driver: str, host: str) -> str:
         return (
-            f"postgresql+psycopg2://"
+            f"postgresql+{driver}://"
             f"{self.postgres_user}:{self.postgres_password}"
-            f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
+            f"@{host}:{self.postgres_port}/{self.postgres_db}"
         )
 
+    @property
+    def database_url(self) -> str:
+        return self._postgres_url("psycopg2", self.postgres_host)
+
+    @property
+    def async_database_url(self) -> str:
+        return self._postgres_url("asyncpg", self.postgres_host)
+
+    @property
+    def replica_database_url(self) -> str | None:
+        if self.postgres_replica_host is None:
+            return None
+        return self._postgres_url("psycopg2", self.postgres_replica_host)
+
+    @property
+    def async_replica_database_url(self) -> str | None:
+        if self.postgres_replica_host is None:
+            return None
+        return self._postgres_url("asyncpg", self.postgres_replica_host)
+
     class Config:
         env_file = ".env"
         extra = "ignore"
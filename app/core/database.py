@@ -1,23 +1,288 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import math
+import time
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
+from contextvars import ContextVar
+from typing import Any, TypeVar
+from uuid import uuid4
 
-from app.core.config import settings
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import Settings, settings
+from app.core.sql_instrumentation import (
+    TimedAsyncAdaptedQueuePool,
+    TimedQueuePool,
+    instrument_engine,
+)
+
+T = TypeVar("T")
+
+DbSession = Session | AsyncSession
+
+
+def engine_options(config: Settings, *, is_async: bool) -> dict[str, Any]:
+    """Pool and connection arguments for ``create_engine``/``create_async_engine``.
+
+    In PgBouncer transaction-pooling mode consecutive transactions may run
+    on different server connections, so nothing may rely on session state:
+    asyncpg's prepared statement caches are disabled and
+    ``statement_timeout`` is applied per transaction (see
+    ``apply_statement_timeout``) instead of as a startup option.
+    """
+    url = config.async_database_url if is_async else config.database_url
+    connect_args: dict[str, Any] = {}
+    timeout_ms = config.db_statement_timeout_ms
+
+    if url.startswith("sqlite"):
+        if not is_async:
+            connect_args["check_same_thread"] = False
+    elif config.db_pgbouncer:
+        if is_async:
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+            connect_args["prepared_statement_name_func"] = (
+                lambda: f"__asyncpg_{uuid4()}__"
+            )
+    elif timeout_ms > 0:
+        if is_async:
+            connect_args["server_settings"] = {
+                "statement_timeout": str(timeout_ms),
+            }
+        else:
+            connect_args["options"] = f"-c statement_timeout={timeout_ms}"
+
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+        "pool_size": config.db_pool_size,
+        "max_overflow": config.db_max_overflow,
+        "pool_timeout": config.db_pool_timeout_seconds,
+        "pool_recycle": config.db_pool_recycle_seconds,
+        "pool_pre_ping": config.db_pool_pre_ping,
+        "connect_args": connect_args,
+    }
+
+
+def apply_statement_timeout(engine: Engine, config: Settings) -> None:
+    """Set ``statement_timeout`` at the start of every transaction.
+
+    Only needed behind PgBouncer, where startup options are not passed
+    through; it costs one extra statement per transaction.
+    """
+    if not config.db_pgbouncer or config.db_statement_timeout_ms <= 0:
+        return
+    statement = f"SET LOCAL statement_timeout = {config.db_statement_timeout_ms}"
+
+    @event.listens_for(engine, "begin")
+    def set_statement_timeout(conn) -> None:
+        conn.exec_driver_sql(statement)
 
-connect_args = {}
-if settings.database_url.startswith("sqlite"):
-    connect_args = {"check_same_thread": False}
 
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,
-    connect_args=connect_args,
+    **engine_options(settings, is_async=False),
+)
+instrument_engine(engine)
+apply_statement_timeout(engine, settings)
+SessionLocal = sessionmaker(
+    bind=engine,
+    autoflush=False,
+    autocommit=False,
+    expire_on_commit=False,
+)
+
+async_engine = None
+AsyncSessionLocal = None
+if settings.database_mode == "async":
+    async_engine = create_async_engine(
+        settings.async_database_url,
+        **engine_options(settings, is_async=True),
+    )
+    instrument_engine(async_engine.sync_engine)
+    apply_statement_timeout(async_engine.sync_engine, settings)
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+# Optional read replica for list and analytics reads, see get_read_db.
+replica_engine = None
+ReplicaSessionLocal = None
+AsyncReplicaSessionLocal = None
+if settings.replica_database_url is not None:
+    if settings.database_mode == "async":
+        replica_engine = create_async_engine(
+            settings.async_replica_database_url,
+            **engine_options(settings, is_async=True),
+        )
+        instrument_engine(replica_engine.sync_engine)
+        apply_statement_timeout(replica_engine.sync_engine, settings)
+        AsyncReplicaSessionLocal = async_sessionmaker(
+            bind=replica_engine,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    else:
+        replica_engine = create_engine(
+            settings.replica_database_url,
+            **engine_options(settings, is_async=False),
+        )
+        instrument_engine(replica_engine)
+        apply_statement_timeout(replica_engine, settings)
+        ReplicaSessionLocal = sessionmaker(
+            bind=replica_engine,
+            autoflush=False,
+            autocommit=False,
+            expire_on_commit=False,
+        )
+
+READ_YOUR_WRITES_COOKIE = "rw_pin"
+_PENDING_WRITE_KEY = "read_your_writes_pending"
+
+
+class _WriteTracker:
+    __slots__ = ("committed_at",)
+
+    def __init__(self) -> None:
+        self.committed_at: float | None = None
+
+
+_current_writes: ContextVar[_WriteTracker | None] = ContextVar(
+    "read_your_writes",
+    default=None,
 )
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
 
-def get_db():
+def pin_to_primary(db: Session) -> None:
+    """Route the client's reads to the primary once ``db`` commits.
+
+    The pin travels with the client as a short-lived cookie, so it holds
+    whichever worker serves the next request.
+    """
+    db.info[_PENDING_WRITE_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _record_committed_write(session: Session) -> None:
+    if session.info.pop(_PENDING_WRITE_KEY, False):
+        tracker = _current_writes.get()
+        if tracker is not None:
+            tracker.committed_at = time.time()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_write(session: Session) -> None:
+    session.info.pop(_PENDING_WRITE_KEY, None)
+
+
+def is_pinned_to_primary(cookies: Mapping[str, str]) -> bool:
+    try:
+        written_at = float(cookies.get(READ_YOUR_WRITES_COOKIE, ""))
+    except ValueError:
+        return False
+    return 0 <= time.time() - written_at < settings.read_your_writes_seconds
+
+
+class ReadYourWritesMiddleware:
+    """Set the read-your-writes cookie on responses to committed writes."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        tracker = _WriteTracker()
+        token = _current_writes.set(tracker)
+
+        async def send_with_pin(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and tracker.committed_at is not None
+            ):
+                MutableHeaders(scope=message).append(
+                    "Set-Cookie",
+                    f"{READ_YOUR_WRITES_COOKIE}={tracker.committed_at:.3f}; "
+                    f"Max-Age={math.ceil(settings.read_your_writes_seconds)}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_pin)
+        finally:
+            _current_writes.reset(token)
+
+
+def get_sync_db() -> Iterator[Session]:
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+get_db = get_async_db if settings.database_mode == "async" else get_sync_db
+
+
+def get_sync_replica_db() -> Iterator[Session | None]:
+    if ReplicaSessionLocal is None:
+        yield None
+        return
+    db = ReplicaSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_replica_db() -> AsyncIterator[AsyncSession | None]:
+    if AsyncReplicaSessionLocal is None:
+        yield None
+        return
+    async with AsyncReplicaSessionLocal() as db:
+        yield db
+
+
+get_replica_db = (
+    get_async_replica_db
+    if settings.database_mode == "async"
+    else get_sync_replica_db
+)
+
+
+async def run_db(db: DbSession, fn: Callable[..., T], /, **kwargs: Any) -> T:
+    """Run a sync service function against either session flavour.
+
+    Services are written against ``Session``. With an ``AsyncSession`` they
+    run via ``run_sync`` so DB I/O is awaited on the event loop; with a plain
+    ``Session`` they run in the threadpool. The session is rolled back if the
+    function raises.
+    """
+    if isinstance(db, AsyncSession):
+        try:
+            return await db.run_sync(lambda session: fn(db=session, **kwargs))
+        except Exception:
+            await db.rollback()
+            raise
+
+    try:
+        return await run_in_threadpool(fn, db=db, **kwargs)
+    except Exception:
+        await run_in_threadpool(db.rollback)
+        raise
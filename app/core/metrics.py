@@ -0,0 +1,263 @@
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0,
+)
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"'
+        for name, value in zip(names, values, strict=True)
+    )
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Prometheus histogram whose hot path takes no lock.
+
+    Each thread observes into its own cells; ``collect`` sums the cells of
+    every thread at scrape time. Only the first observation from a new
+    thread takes the registration lock.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        *,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        self._local = threading.local()
+        self._shards: list[dict[tuple[str, ...], list[float]]] = []
+        self._lock = threading.Lock()
+
+    def _shard(self) -> dict[tuple[str, ...], list[float]]:
+        try:
+            return self._local.cells
+        except AttributeError:
+            cells: dict[tuple[str, ...], list[float]] = {}
+            with self._lock:
+                self._shards.append(cells)
+            self._local.cells = cells
+            return cells
+
+    def observe(self, value: float, labels: tuple[str, ...] = ()) -> None:
+        cells = self._shard()
+        cell = cells.get(labels)
+        if cell is None:
+            # One count per bucket, one for +Inf, then the running sum.
+            cell = cells[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        cell[bisect_left(self.buckets, value)] += 1
+        cell[-1] += value
+
+    def collect(self) -> dict[tuple[str, ...], list[float]]:
+        with self._lock:
+            shards = list(self._shards)
+        totals: dict[tuple[str, ...], list[float]] = {}
+        for cells in shards:
+            for labels, cell in list(cells.items()):
+                total = totals.get(labels)
+                if total is None:
+                    totals[labels] = list(cell)
+                else:
+                    for i, value in enumerate(cell):
+                        total[i] += value
+        return totals
+
+    def clear(self) -> None:
+        with self._lock:
+            for cells in self._shards:
+                cells.clear()
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for labels, cell in sorted(self.collect().items()):
+            cumulative = 0
+            bounds = (*self.buckets, float("inf"))
+            for bound, count in zip(bounds, cell[:-1], strict=True):
+                cumulative += count
+                bucket_labels = _format_labels(
+                    (*self.labelnames, "le"),
+                    (*labels, _format_value(bound)),
+                )
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(cell[-1])}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class CallbackMetric:
+    """Gauge or counter read from a callback at scrape time."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], float | None],
+        *,
+        kind: str = "gauge",
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.callback = callback
+        self.kind = kind
+
+    def render(self) -> list[str]:
+        value = self.callback()
+        if value is None:
+            return []
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            f"{self.name} {_format_value(value)}",
+        ]
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Histogram | CallbackMetric] = {}
+
+    def register(self, metric):
+        self._metrics[metric.name] = metric
+        return metric
+
+    def gauge(self, name: str, documentation: str, callback) -> CallbackMetric:
+        return self.register(CallbackMetric(name, documentation, callback))
+
+    def counter(self, name: str, documentation: str, callback) -> CallbackMetric:
+        return self.register(
+            CallbackMetric(name, documentation, callback, kind="counter")
+        )
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+request_latency = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by route template and status code.",
+        labelnames=("method", "route", "status"),
+    )
+)
+pool_wait = registry.register(
+    Histogram(
+        "db_pool_wait_seconds",
+        "Time spent waiting to check a connection out of the pool.",
+        buckets=POOL_WAIT_BUCKETS,
+    )
+)
+
+
+def register_pool_metrics(engine) -> None:
+    """Expose pool occupancy gauges for ``engine``'s current pool."""
+
+    def read(method: str) -> Callable[[], float | None]:
+        def callback() -> float | None:
+            fn = getattr(engine.pool, method, None)
+            return fn() if fn is not None else None
+
+        return callback
+
+    registry.gauge("db_pool_size", "Configured pool size.", read("size"))
+    registry.gauge(
+        "db_pool_checked_out",
+        "Connections currently checked out of the pool.",
+        read("checkedout"),
+    )
+    registry.gauge(
+        "db_pool_checked_in",
+        "Idle connections held in the pool.",
+        read("checkedin"),
+    )
+    registry.gauge(
+        "db_pool_overflow",
+        "Connections open beyond pool_size; negative while below it.",
+        read("overflow"),
+    )
+
+
+def route_template(scope: Scope) -> str:
+    """Return the matched route's path template, including router prefixes."""
+    route = scope.get("route")
+    template = getattr(route, "path_format", None)
+    if template is None:
+        return "unmatched"
+    path = scope["path"]
+    try:
+        rendered = template.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return template
+    if path.endswith(rendered):
+        return path[: len(path) - len(rendered)] + template
+    return template
+
+
+class MetricsMiddleware:
+    """Record request latency and the number of requests in flight."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.in_flight = 0
+        registry.gauge(
+            "http_requests_in_flight",
+            "Requests currently being served by this worker.",
+            lambda: self.in_flight,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.in_flight -= 1
+            request_latency.observe(
+                perf_counter() - start,
+                (scope["method"], route_template(scope), str(status_code)),
+            )
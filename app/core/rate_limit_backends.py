@@ -0,0 +1,281 @@
+import hashlib
+import logging
+import socket
+import sqlite3
+import threading
+import time
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+def sliding_window_count(
+    previous: int,
+    current: int,
+    now: float,
+    window_seconds: int,
+) -> float:
+    elapsed = now / window_seconds - int(now // window_seconds)
+    return previous * (1 - elapsed) + current
+
+
+class _Counter:
+    """Counter safe to bump from threadpool workers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def increment(self) -> None:
+        with self._lock:
+            self.value += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.value = 0
+
+
+class SQLiteRateLimiter:
+    """Sliding-window counters in a SQLite file shared by local workers.
+
+    Each check is one ``BEGIN IMMEDIATE`` transaction: an upsert that bumps
+    the current bucket and a read of the previous one. Rejected requests are
+    rolled back so they do not consume quota.
+    """
+
+    def __init__(self, path: str, *, sweep_interval_seconds: float = 60.0):
+        self._path = path
+        self._sweep_interval_seconds = sweep_interval_seconds
+        self._last_sweep = time.time()
+        self._local = threading.local()
+        self._rejections = _Counter()
+
+    def allow(self, key: str, limit: int, window_seconds: int) -> bool:
+        now = time.time()
+        bucket = int(now // window_seconds)
+        conn = self._connection()
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            (current,) = conn.execute(
+                "INSERT INTO rate_limits (key, bucket, count, expires_at) "
+                "VALUES (?, ?, 1, ?) "
+                "ON CONFLICT (key, bucket) DO UPDATE SET count = count + 1 "
+                "RETURNING count",
+                (key, bucket, (bucket + 2) * window_seconds),
+            ).fetchone()
+            row = conn.execute(
+                "SELECT count FROM rate_limits WHERE key = ? AND bucket = ?",
+                (key, bucket - 1),
+            ).fetchone()
+            previous = row[0] if row else 0
+
+            estimated = sliding_window_count(
+                previous,
+                current - 1,
+                now,
+                window_seconds,
+            )
+            if estimated >= limit:
+                conn.execute("ROLLBACK")
+                self._rejections.increment()
+                return False
+
+            if now - self._last_sweep >= self._sweep_interval_seconds:
+                conn.execute(
+                    "DELETE FROM rate_limits WHERE expires_at < ?",
+                    (now,),
+                )
+                self._last_sweep = now
+            conn.execute("COMMIT")
+            return True
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    @property
+    def rejections(self) -> int:
+        return self._rejections.value
+
+    def reset(self) -> None:
+        self._connection().execute("DELETE FROM rate_limits")
+        self._rejections.reset()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits ("
+                "key TEXT NOT NULL, "
+                "bucket INTEGER NOT NULL, "
+                "count INTEGER NOT NULL, "
+                "expires_at REAL NOT NULL, "
+                "PRIMARY KEY (key, bucket)"
+                ") WITHOUT ROWID"
+            )
+            self._local.conn = conn
+        return conn
+
+
+class RedisError(RuntimeError):
+    pass
+
+
+class _RespConnection:
+    def __init__(self, host: str, port: int, timeout: float) -> None:
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._sock.makefile("rb")
+
+    def pipeline(self, *commands: tuple) -> list:
+        payload = b"".join(_encode_command(command) for command in commands)
+        self._sock.sendall(payload)
+        return [self._read_reply() for _ in commands]
+
+    def close(self) -> None:
+        self._reader.close()
+        self._sock.close()
+
+    def _read_reply(self):
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Redis connection closed")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body.decode()
+        if kind == b"-":
+            raise RedisError(body.decode())
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(body)
+            if length < 0:
+                return None
+            return [self._read_reply() for _ in range(length)]
+        raise RedisError(f"Unexpected reply: {line!r}")
+
+
+def _encode_command(command: tuple) -> bytes:
+    parts = [f"*{len(command)}\r\n".encode()]
+    for arg in command:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+# KEYS: current bucket, previous bucket.
+# ARGV: weight of the previous bucket, limit, bucket TTL in seconds.
+_REDIS_ALLOW_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+if previous * tonumber(ARGV[1]) + current >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+_REDIS_ALLOW_SHA = hashlib.sha1(_REDIS_ALLOW_SCRIPT.encode()).hexdigest()
+
+
+class RedisRateLimiter:
+    """Sliding-window counters in any server speaking the Redis protocol.
+
+    A check is one ``EVALSHA`` round trip (``EVAL`` the first time a server
+    has not seen the script): the script reads both buckets and only
+    increments the current one when the request is allowed, so the check
+    and the increment are atomic and rejections consume no quota.
+    Connection errors fail open so auth keeps working when the limiter
+    store is down.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        key_prefix: str = "rl:",
+        timeout: float = 0.5,
+    ) -> None:
+        parsed = urlparse(url)
+        self._host = parsed.hostname or "localhost"
+        self._port = parsed.port or 6379
+        self._password = parsed.password
+        self._db = int(parsed.path.lstrip("/") or 0)
+        self._key_prefix = key_prefix
+        self._timeout = timeout
+        self._local = threading.local()
+        self._rejections = _Counter()
+
+    def allow(self, key: str, limit: int, window_seconds: int) -> bool:
+        now = time.time()
+        bucket = int(now // window_seconds)
+        # The hash tag keeps both buckets in one cluster slot for EVAL.
+        current_key = f"{self._key_prefix}{{{key}}}:{bucket}"
+        previous_key = f"{self._key_prefix}{{{key}}}:{bucket - 1}"
+        # Share of the previous window still covered by the sliding window.
+        previous_weight = sliding_window_count(1, 0, now, window_seconds)
+
+        arguments = (
+            2,
+            current_key,
+            previous_key,
+            repr(previous_weight),
+            limit,
+            window_seconds * 2,
+        )
+
+        try:
+            conn = self._connection()
+            try:
+                (allowed,) = conn.pipeline(("EVALSHA", _REDIS_ALLOW_SHA, *arguments))
+            except RedisError as err:
+                if not str(err).startswith("NOSCRIPT"):
+                    raise
+                (allowed,) = conn.pipeline(("EVAL", _REDIS_ALLOW_SCRIPT, *arguments))
+            if not allowed:
+                self._rejections.increment()
+                return False
+            return True
+        except (OSError, RedisError) as err:
+            self._drop_connection()
+            logger.warning("Rate limiter backend unavailable: %s", err)
+            return True
+
+    @property
+    def rejections(self) -> int:
+        return self._rejections.value
+
+    def reset(self) -> None:
+        self._rejections.reset()
+
+    def _connection(self) -> _RespConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = _RespConnection(self._host, self._port, self._timeout)
+            setup = []
+            if self._password:
+                setup.append(("AUTH", self._password))
+            if self._db:
+                setup.append(("SELECT", self._db))
+            if setup:
+                conn.pipeline(*setup)
+            self._local.conn = conn
+        return conn
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            try:
+                conn.close()
+            except OSError:
+                pass
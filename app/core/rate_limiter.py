@@ -1,38 +1,181 @@
 import time
-from collections import deque
+from collections import OrderedDict
 from threading import Lock
+from typing import Protocol
 
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.rate_limit_backends import (
+    RedisRateLimiter,
+    SQLiteRateLimiter,
+    sliding_window_count,
+)
+
+
+class RateLimiterBackend(Protocol):
+    @property
+    def rejections(self) -> int: ...
+
+    def allow(self, key: str, limit: int, window_seconds: int) -> bool: ...
+
+    def reset(self) -> None: ...
+
+
+class _WindowState:
+    __slots__ = ("window_seconds", "window", "current", "previous")
+
+    def __init__(self, window_seconds: int, window: int) -> None:
+        self.window_seconds = window_seconds
+        self.window = window
+        self.current = 0
+        self.previous = 0
+
+
+class _Shard:
+    __slots__ = ("lock", "states", "rejections")
 
-class SimpleRateLimiter:
     def __init__(self) -> None:
-        self._buckets: dict[str, deque[float]] = {}
-        self._lock = Lock()
+        self.lock = Lock()
+        self.states: OrderedDict[str, _WindowState] = OrderedDict()
+        self.rejections = 0
 
-    def allow(self, key: str, limit: int, window_seconds: int) -> bool:
-        now = time.time()
-        cutoff = now - window_seconds
 
-        with self._lock:
-            bucket = self._buckets.get(key)
-            if bucket is None:
-                bucket = deque()
-                self._buckets[key] = bucket
+class SlidingWindowRateLimiter:
+    """Sliding-window counter limiter with O(1) state per key.
+
+    Each key keeps the counts of the current and previous fixed windows and
+    estimates the sliding count as ``previous * overlap + current``. Keys are
+    striped across independently locked shards. A periodic sweep drops keys
+    idle for two windows from every shard, and each shard evicts its least
+    recently used key once it holds more than its share of ``max_keys``.
+    """
+
+    def __init__(
+        self,
+        *,
+        shards: int = 16,
+        max_keys: int = 100_000,
+        sweep_interval_seconds: float = 60.0,
+    ) -> None:
+        self._shards = [_Shard() for _ in range(shards)]
+        self._max_keys_per_shard = max(1, max_keys // shards)
+        self._sweep_interval_seconds = sweep_interval_seconds
+        self._sweep_lock = Lock()
+        self._last_sweep = time.monotonic()
 
-            while bucket and bucket[0] < cutoff:
-                bucket.popleft()
+    def allow(self, key: str, limit: int, window_seconds: int) -> bool:
+        now = time.monotonic()
+        window = int(now // window_seconds)
+        if now - self._last_sweep >= self._sweep_interval_seconds:
+            self._sweep(now)
+        shard = self._shards[hash(key) % len(self._shards)]
+
+        with shard.lock:
+            state = shard.states.get(key)
+            if state is None:
+                state = _WindowState(window_seconds, window)
+                shard.states[key] = state
+                if len(shard.states) > self._max_keys_per_shard:
+                    shard.states.popitem(last=False)
+            else:
+                shard.states.move_to_end(key)
+                if state.window != window:
+                    state.previous = (
+                        state.current if state.window == window - 1 else 0
+                    )
+                    state.current = 0
+                    state.window = window
 
-            if len(bucket) >= limit:
+            estimated = sliding_window_count(
+                state.previous,
+                state.current,
+                now,
+                window_seconds,
+            )
+            if estimated >= limit:
+                shard.rejections += 1
                 return False
 
-            bucket.append(now)
+            state.current += 1
             return True
 
+    @property
+    def rejections(self) -> int:
+        return sum(shard.rejections for shard in self._shards)
+
+    def tracked_keys(self) -> int:
+        return sum(len(shard.states) for shard in self._shards)
+
+    def reset(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.states.clear()
+                shard.rejections = 0
+
+    def _sweep(self, now: float) -> None:
+        # One caller sweeps; the others carry on instead of queueing behind it.
+        if not self._sweep_lock.acquire(blocking=False):
+            return
+        try:
+            if now - self._last_sweep < self._sweep_interval_seconds:
+                return
+            self._last_sweep = now
+            for shard in self._shards:
+                with shard.lock:
+                    stale = [
+                        key
+                        for key, state in shard.states.items()
+                        if state.window < int(now // state.window_seconds) - 1
+                    ]
+                    for key in stale:
+                        del shard.states[key]
+        finally:
+            self._sweep_lock.release()
+
+
+def create_rate_limiter() -> RateLimiterBackend:
+    if settings.rate_limit_backend == "sqlite":
+        return SQLiteRateLimiter(
+            settings.rate_limit_sqlite_path,
+            sweep_interval_seconds=settings.rate_limit_sweep_interval_seconds,
+        )
+    if settings.rate_limit_backend == "redis":
+        return RedisRateLimiter(settings.rate_limit_redis_url)
+    return SlidingWindowRateLimiter(
+        shards=settings.rate_limit_shards,
+        max_keys=settings.rate_limit_max_keys,
+        sweep_interval_seconds=settings.rate_limit_sweep_interval_seconds,
+    )
+
+
+_limiter = create_rate_limiter()
+
+
+def reset_rate_limits() -> None:
+    _limiter.reset()
+
+
+def rate_limit_rejections() -> int:
+    return _limiter.rejections
 
-_limiter = SimpleRateLimiter()
 
+async def rate_limit(*, key: str, limit: int, window_seconds: int) -> None:
+    """Raise 429 once ``key`` exceeds ``limit`` requests per window.
 
-def rate_limit(*, key: str, limit: int, window_seconds: int) -> None:
+    Only the in-memory limiter is cheap enough to call on the event loop;
+    the SQLite and Redis backends block on I/O and run in the threadpool.
+    """
     from fastapi import HTTPException
 
-    if not _limiter.allow(key, limit, window_seconds):
+    if isinstance(_limiter, SlidingWindowRateLimiter):
+        allowed = _limiter.allow(key, limit, window_seconds)
+    else:
+        allowed = await run_in_threadpool(
+            _limiter.allow,
+            key,
+            limit,
+            window_seconds,
+        )
+    if not allowed:
         raise HTTPException(status_code=429, detail="Too many requests")
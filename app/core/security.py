@@ -1,14 +1,30 @@
+import asyncio
+import hashlib
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from threading import Lock
+from typing import Any
 
 from jose import jwt
 from passlib.context import CryptContext
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.bcrypt_rounds,
+)
 ALGORITHM = "HS256"
 
 
+class PasswordHasherBusyError(RuntimeError):
+    pass
+
+
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
@@ -17,9 +33,167 @@ def verify_password(password: str, hashed: str) -> bool:
     return pwd_context.verify(password, hashed)
 
 
-def create_access_token(subject: str) -> str:
+def verify_and_rehash_password(
+    password: str,
+    hashed: str,
+) -> tuple[bool, str | None]:
+    if not pwd_context.verify(password, hashed):
+        return False, None
+    if pwd_context.needs_update(hashed):
+        return True, pwd_context.hash(password)
+    return True, None
+
+
+class PasswordHasher:
+    """Runs bcrypt on a dedicated, size-limited executor.
+
+    Calls beyond ``max_pending`` in-flight hashes fail fast with
+    ``PasswordHasherBusyError`` instead of queueing behind the pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        max_pending: int,
+        use_processes: bool = False,
+    ) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self.use_processes = use_processes
+        self._executor: Executor | None = None
+        self._pending = 0
+        self._lock = Lock()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(hash_password, password)
+
+    async def verify_and_rehash(
+        self,
+        password: str,
+        hashed: str,
+    ) -> tuple[bool, str | None]:
+        return await self._submit(verify_and_rehash_password, password, hashed)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _submit(self, fn, *args):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise PasswordHasherBusyError("Password hashing is saturated")
+            self._pending += 1
+            if self._executor is None:
+                self._executor = self._create_executor()
+            executor = self._executor
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, fn, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _create_executor(self) -> Executor:
+        if self.use_processes:
+            return ProcessPoolExecutor(max_workers=self.workers)
+        return ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix="password-hasher",
+        )
+
+
+password_hasher = PasswordHasher(
+    workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+    use_processes=settings.password_hash_executor == "process",
+)
+
+
+def create_access_token(subject: str, user_id: int | None = None) -> str:
     expire = datetime.now(UTC) + timedelta(
         minutes=settings.access_token_expire_minutes
     )
     payload = {"sub": subject, "exp": expire}
+    if user_id is not None:
+        payload["uid"] = user_id
     return jwt.encode(payload, settings.secret_key, algorithm=ALGORITHM)
+
+
+class TokenCache:
+    """Maps token digests to verified claims until the token's ``exp``.
+
+    Entries never outlive the token. The cache holds no revocation state:
+    a token stays valid until its ``exp`` on every worker.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        self._claims: TTLCache[str, dict[str, Any]] = TTLCache(
+            maxsize=maxsize,
+            ttl_seconds=0,
+            clock=clock,
+        )
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def decode(self, token: str) -> dict[str, Any]:
+        digest = _token_digest(token)
+        claims = self._claims.get(digest)
+        if claims is not None:
+            with self._lock:
+                self.hits += 1
+            return claims
+
+        with self._lock:
+            self.misses += 1
+        claims = jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
+        expires_at = self._expiry(claims)
+        if expires_at is not None:
+            self._claims.set(digest, claims, expires_at=expires_at)
+        return claims
+
+    def _expiry(self, claims: dict[str, Any]) -> float | None:
+        """Translate the wall-clock ``exp`` claim onto ``clock``."""
+        exp = claims.get("exp")
+        if not isinstance(exp, int | float):
+            return None
+        return self._clock() + (exp - time.time())
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._claims),
+        }
+
+    def clear(self) -> None:
+        self._claims.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+def _token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+token_cache = TokenCache(maxsize=settings.token_cache_max_entries)
+
+
+def decode_access_token(token: str) -> dict[str, Any]:
+    if settings.token_cache_enabled:
+        return token_cache.decode(token)
+    return jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
@@ -0,0 +1,172 @@
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import pool_wait
+
+logger = logging.getLogger(__name__)
+
+_QUERY_START_KEY = "sql_instrumentation_query_start"
+
+
+@dataclass
+class SqlStats:
+    statements: int = 0
+    db_seconds: float = 0.0
+    pool_wait_seconds: float = 0.0
+
+
+_current_stats: ContextVar[SqlStats | None] = ContextVar(
+    "sql_stats",
+    default=None,
+)
+
+
+@contextmanager
+def track_sql() -> Iterator[SqlStats]:
+    """Aggregate statements run in the current context into ``SqlStats``.
+
+    The stats object is shared with threadpool workers and ``run_sync``
+    greenlets, since both inherit a copy of the calling context.
+    """
+    stats = SqlStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    if _current_stats.get() is not None:
+        conn.info.setdefault(_QUERY_START_KEY, []).append(perf_counter())
+
+
+def _finish_statement(conn) -> None:
+    stats = _current_stats.get()
+    starts = conn.info.get(_QUERY_START_KEY)
+    if stats is None or not starts:
+        return
+    stats.db_seconds += perf_counter() - starts.pop()
+    stats.statements += 1
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    _finish_statement(conn)
+
+
+def _handle_error(exception_context) -> None:
+    if exception_context.connection is not None:
+        _finish_statement(exception_context.connection)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Count statements and DB time for requests run against ``engine``.
+
+    Pass ``AsyncEngine.sync_engine`` for async engines.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class PoolWaitTimerMixin:
+    """Record time spent waiting for a pooled connection."""
+
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = perf_counter() - start
+            pool_wait.observe(waited)
+            stats = _current_stats.get()
+            if stats is not None:
+                stats.pool_wait_seconds += waited
+
+
+class TimedQueuePool(PoolWaitTimerMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(PoolWaitTimerMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def server_timing(stats: SqlStats, total_seconds: float) -> str:
+    return (
+        f"db;dur={stats.db_seconds * 1000:.2f};"
+        f'desc="{stats.statements} queries", '
+        f"db-pool;dur={stats.pool_wait_seconds * 1000:.2f}, "
+        f"total;dur={total_seconds * 1000:.2f}"
+    )
+
+
+class SqlTimingMiddleware:
+    """Expose per-request SQL totals as ``Server-Timing`` and a log line.
+
+    The header carries what ran before the response started; the log line,
+    written once the body is sent, also covers streamed responses.
+    """
+
+    def __init__(self, app: ASGIApp, *, emit_header: bool = True) -> None:
+        self.app = app
+        self.emit_header = emit_header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = perf_counter()
+        status_code = 500
+
+        with track_sql() as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    if self.emit_header:
+                        headers = MutableHeaders(scope=message)
+                        headers.append(
+                            "Server-Timing",
+                            server_timing(stats, perf_counter() - start),
+                        )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                _log_request(scope, status_code, stats, perf_counter() - start)
+
+
+def _log_request(
+    scope: Scope,
+    status_code: int,
+    stats: SqlStats,
+    total_seconds: float,
+) -> None:
+    fields = {
+        "method": scope["method"],
+        "path": scope["path"],
+        "status_code": status_code,
+        "db_statements": stats.statements,
+        "db_ms": round(stats.db_seconds * 1000, 3),
+        "db_pool_wait_ms": round(stats.pool_wait_seconds * 1000, 3),
+        "total_ms": round(total_seconds * 1000, 3),
+    }
+    logger.info(
+        " ".join(f"{key}=%s" for key in fields),
+        *fields.values(),
+        extra=fields,
+    )
@@ -1,4 +1,6 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
 from app.api.v1.application_events import router as timeline_router
 from app.api.v1.applications import router as applications_router
@@ -7,8 +9,46 @@ from app.api.v1.applications_analytics import (
 )
 from app.api.v1.auth import router as auth_router
 from app.core.config import settings
+from app.core.database import ReadYourWritesMiddleware, async_engine, engine
+from app.core.metrics import (
+    CONTENT_TYPE,
+    MetricsMiddleware,
+    register_pool_metrics,
+    registry,
+)
+from app.core.rate_limiter import rate_limit_rejections
+from app.core.security import password_hasher
+from app.core.sql_instrumentation import SqlTimingMiddleware
 
 app = FastAPI(title=settings.app_name)
+app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(
+    SqlTimingMiddleware,
+    emit_header=settings.server_timing_enabled,
+)
+app.add_middleware(MetricsMiddleware)
+
+register_pool_metrics(async_engine.sync_engine if async_engine else engine)
+registry.counter(
+    "rate_limit_rejections_total",
+    "Requests rejected by the rate limiter.",
+    rate_limit_rejections,
+)
+registry.gauge(
+    "password_hash_pending",
+    "Password hashes queued or running on the hasher executor.",
+    lambda: password_hasher.pending,
+)
+
+
+@app.exception_handler(PoolTimeoutError)
+async def database_busy(request: Request, exc: PoolTimeoutError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Database is busy, please retry"},
+        headers={"Retry-After": str(settings.db_retry_after_seconds)},
+    )
+
 
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(applications_router, prefix="/api/v1")
@@ -19,3 +59,10 @@ app.include_router(timeline_router, prefix="/api/v1")
 @app.get("/health")
 def health():
     return {"status": "ok"}
+
+
+if settings.metrics_enabled:
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        return Response(registry.render(), media_type=CONTENT_TYPE)
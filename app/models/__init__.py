@@ -1,3 +1,5 @@
 from app.models.application import Application as Application
 from app.models.application_event import ApplicationEvent as ApplicationEvent
+from app.models.application_search import applications_fts as applications_fts
 from app.models.user import User as User
+from app.models.user_status_count import UserStatusCount as UserStatusCount
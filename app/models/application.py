@@ -5,9 +5,12 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
+    Integer,
     String,
     UniqueConstraint,
     func,
+    literal_column,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -33,6 +36,7 @@ class Application(Base):
             name="uq_user_company_position",
         ),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
@@ -78,10 +82,42 @@ class Application(Base):
         DateTime(timezone=True),
         server_default=func.now(),
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+    version: Mapped[int] = mapped_column(
+        Integer,
+        default=1,
+        server_default="1",
+        onupdate=literal_column("version + 1"),
+    )
 
     user = relationship("User")
     events = relationship(
         "ApplicationEvent",
         back_populates="application",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
+
+
+Index(
+    "ix_applications_user_created_at",
+    Application.user_id,
+    Application.created_at,
+)
+Index("ix_applications_user_status", Application.user_id, Application.status)
+Index(
+    "ix_applications_user_follow_up_at",
+    Application.user_id,
+    Application.follow_up_at,
+    postgresql_where=Application.follow_up_at.is_not(None),
+    sqlite_where=Application.follow_up_at.is_not(None),
+)
+Index(
+    "ix_applications_user_recruiter_email",
+    Application.user_id,
+    func.lower(func.trim(Application.recruiter_email)),
+)
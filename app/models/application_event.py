@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Text, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.application import ApplicationStatus
@@ -17,6 +17,7 @@ class ApplicationEventType(enum.StrEnum):
 
 class ApplicationEvent(Base):
     __tablename__ = "application_events"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True)
     application_id: Mapped[int] = mapped_column(
@@ -54,3 +55,11 @@ class ApplicationEvent(Base):
 
     application = relationship("Application", back_populates="events")
     user = relationship("User")
+
+
+Index(
+    "ix_application_events_timeline",
+    ApplicationEvent.application_id,
+    ApplicationEvent.created_at.desc(),
+    ApplicationEvent.id.desc(),
+)
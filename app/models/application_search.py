@@ -0,0 +1,115 @@
+from sqlalchemy import DDL, Index, column, event, table
+
+from app.models.application import Application
+
+SQLITE_TRIGRAM_MIN_VERSION = (3, 34, 0)
+TRIGRAM_INDEXED_COLUMNS = ["company_name", "position", "recruiter_email"]
+
+applications_fts = table(
+    "applications_fts",
+    column("rowid"),
+    column("company_name"),
+    column("position"),
+    column("recruiter_email"),
+)
+
+SQLITE_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS applications_fts USING fts5(
+        company_name,
+        position,
+        recruiter_email,
+        content='applications',
+        content_rowid='id',
+        tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_ai
+    AFTER INSERT ON applications BEGIN
+        INSERT INTO applications_fts(
+            rowid, company_name, position, recruiter_email
+        )
+        VALUES (
+            new.id, new.company_name, new.position, new.recruiter_email
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_ad
+    AFTER DELETE ON applications BEGIN
+        INSERT INTO applications_fts(
+            applications_fts, rowid, company_name, position, recruiter_email
+        )
+        VALUES (
+            'delete',
+            old.id,
+            old.company_name,
+            old.position,
+            old.recruiter_email
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_au
+    AFTER UPDATE OF company_name, position, recruiter_email ON applications
+    BEGIN
+        INSERT INTO applications_fts(
+            applications_fts, rowid, company_name, position, recruiter_email
+        )
+        VALUES (
+            'delete',
+            old.id,
+            old.company_name,
+            old.position,
+            old.recruiter_email
+        );
+        INSERT INTO applications_fts(
+            rowid, company_name, position, recruiter_email
+        )
+        VALUES (
+            new.id, new.company_name, new.position, new.recruiter_email
+        );
+    END
+    """,
+]
+
+
+for column_name in TRIGRAM_INDEXED_COLUMNS:
+    Index(
+        f"ix_applications_{column_name}_trgm",
+        getattr(Application, column_name),
+        postgresql_using="gin",
+        postgresql_ops={column_name: "gin_trgm_ops"},
+    ).ddl_if(dialect="postgresql")
+
+event.listen(
+    Application.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(
+        dialect="postgresql"
+    ),
+)
+
+
+def sqlite_supports_trigram_fts(dialect) -> bool:
+    version = dialect.server_version_info or ()
+    return dialect.name == "sqlite" and version >= SQLITE_TRIGRAM_MIN_VERSION
+
+
+def _should_create_fts(ddl, target, bind, **kw) -> bool:
+    return sqlite_supports_trigram_fts(bind.dialect)
+
+
+for statement in SQLITE_FTS_DDL:
+    event.listen(
+        Application.__table__,
+        "after_create",
+        DDL(statement).execute_if(callable_=_should_create_fts),
+    )
+
+event.listen(
+    Application.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS applications_fts").execute_if(dialect="sqlite"),
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import String
+from sqlalchemy import Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -8,5 +8,16 @@ class User(Base):
     __tablename__ = "users"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    # Load the old email before a change so the principal cache can evict it.
+    email: Mapped[str] = mapped_column(
+        String(255),
+        unique=True,
+        index=True,
+        active_history=True,
+    )
     hashed_password: Mapped[str] = mapped_column(String(255))
+    data_version: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+    )
@@ -0,0 +1,19 @@
+from sqlalchemy import Enum, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.application import ApplicationStatus
+from app.models.base import Base
+
+
+class UserStatusCount(Base):
+    __tablename__ = "user_status_counts"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    status: Mapped[ApplicationStatus] = mapped_column(
+        Enum(ApplicationStatus, name="applicationstatus", create_type=False),
+        primary_key=True,
+    )
+    count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
@@ -1,3 +1,4 @@
+import enum
 from datetime import datetime
 
 from pydantic import BaseModel
@@ -60,3 +61,21 @@ class RecruiterPerformanceV2ItemOut(BaseModel):
 
 class RecruiterPerformanceV2Out(BaseModel):
     recruiters: list[RecruiterPerformanceV2ItemOut]
+
+
+class DashboardSection(enum.StrEnum):
+    summary = "summary"
+    funnel = "funnel"
+    time_to_status = "time_to_status"
+    status_duration = "status_duration"
+    recruiter_performance = "recruiter_performance"
+    recruiter_performance_v2 = "recruiter_performance_v2"
+
+
+class AnalyticsDashboardOut(BaseModel):
+    summary: ApplicationsSummaryOut | None = None
+    funnel: ApplicationsFunnelOut | None = None
+    time_to_status: TimeToStatusOut | None = None
+    status_duration: StatusDurationOut | None = None
+    recruiter_performance: RecruiterPerformanceOut | None = None
+    recruiter_performance_v2: RecruiterPerformanceV2Out | None = None
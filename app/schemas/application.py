@@ -1,10 +1,18 @@
-from datetime import datetime
+from datetime import UTC, datetime
+from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from app.models.application import ApplicationStatus
 
 
+def _to_utc(value: datetime | None) -> datetime | None:
+    """Store aware datetimes in UTC; SQLite drops the offset, not converts."""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(UTC)
+    return value
+
+
 class ApplicationBase(BaseModel):
     company_name: str
     position: str
@@ -15,6 +23,8 @@ class ApplicationBase(BaseModel):
     location: str | None = None
     follow_up_at: datetime | None = None
 
+    _follow_up_at_utc = field_validator("follow_up_at")(_to_utc)
+
 
 class ApplicationCreate(ApplicationBase):
     status: ApplicationStatus = ApplicationStatus.applied
@@ -29,18 +39,70 @@ class ApplicationUpdate(BaseModel):
     location: str | None = None
     follow_up_at: datetime | None = None
 
+    _follow_up_at_utc = field_validator("follow_up_at")(_to_utc)
+
 
 class ApplicationOut(ApplicationBase):
     id: int
     status: ApplicationStatus
     status_updated_at: datetime | None = None
     created_at: datetime
+    updated_at: datetime
+    version: int
 
     model_config = {"from_attributes": True}
 
 
 class PaginatedApplications(BaseModel):
     items: list[ApplicationOut]
-    total: int
+    total: int | None
     page: int
     page_size: int
+
+
+class CursorPaginatedApplications(BaseModel):
+    items: list[ApplicationOut]
+    next_cursor: str | None
+    page_size: int
+
+
+class ApplicationImportRowError(BaseModel):
+    line: int
+    reason: Literal["invalid", "conflict"]
+    detail: str
+
+
+class ApplicationImportResult(BaseModel):
+    inserted: int
+    conflicts: int
+    invalid: int
+    errors: list[ApplicationImportRowError]
+    errors_truncated: bool
+
+
+class ApplicationBulkFilter(BaseModel):
+    status: ApplicationStatus | None = None
+    company: str | None = None
+    q: str | None = None
+
+
+class ApplicationBulkUpdate(BaseModel):
+    ids: list[int] | None = Field(default=None, min_length=1)
+    filter: ApplicationBulkFilter | None = None
+    update: ApplicationUpdate
+
+    @model_validator(mode="after")
+    def check_target(self) -> "ApplicationBulkUpdate":
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of ids or filter")
+        return self
+
+
+class ApplicationBulkUpdateItem(BaseModel):
+    id: int
+    result: Literal["updated", "unchanged", "not_found", "invalid_transition"]
+
+
+class ApplicationBulkUpdateResult(BaseModel):
+    updated: int
+    results: list[ApplicationBulkUpdateItem]
@@ -9,3 +9,10 @@ class RegisterIn(BaseModel):
 class TokenOut(BaseModel):
     access_token: str
     token_type: str = "bearer"
+
+
+class CurrentUser(BaseModel):
+    id: int
+    email: str
+
+    model_config = {"frozen": True}
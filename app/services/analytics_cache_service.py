@@ -0,0 +1,45 @@
+from collections.abc import Callable
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.etag import etag_matches, make_etag
+from app.services.data_version_service import get_data_version
+
+AnalyticsCacheKey = tuple[int, str, int]
+
+_analytics_cache: TTLCache[AnalyticsCacheKey, dict] = TTLCache(
+    maxsize=settings.analytics_cache_max_entries,
+    ttl_seconds=settings.analytics_cache_ttl_seconds,
+)
+
+
+def clear_analytics_cache() -> None:
+    _analytics_cache.clear()
+
+
+def get_cached_analytics(
+    *,
+    db: Session,
+    user_id: int,
+    key: str,
+    compute: Callable[..., dict],
+    if_none_match: str | None = None,
+) -> tuple[str, dict | None]:
+    """Return ``(etag, payload)`` for the user's current data version.
+
+    The payload is ``None`` when ``if_none_match`` already names the current
+    version, so the caller can answer 304 without computing anything.
+    """
+    version = get_data_version(db=db, user_id=user_id)
+    etag = make_etag(user_id, key, version)
+    if etag_matches(if_none_match, etag):
+        return etag, None
+
+    cache_key = (user_id, key, version)
+    payload = _analytics_cache.get(cache_key)
+    if payload is None:
+        payload = compute(db=db, user_id=user_id)
+        _analytics_cache.set(cache_key, payload)
+    return etag, payload
@@ -1,10 +1,12 @@
 from datetime import datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import Dialect, func, select
 from sqlalchemy.orm import Session
 
 from app.models.application import Application, ApplicationStatus
 from app.models.application_event import ApplicationEvent, ApplicationEventType
+from app.schemas.analytics import DashboardSection
+from app.services.status_rollup_service import get_status_counts
 
 FUNNEL_STEPS = [
     ApplicationStatus.applied,
@@ -32,14 +34,12 @@ def status_count_rows_to_dict(
 
 
 def get_applications_summary(*, db: Session, user_id: int) -> dict:
-    stmt = (
-        select(Application.status, func.count(Application.id))
-        .where(Application.user_id == user_id)
-        .group_by(Application.status)
-    )
-    rows = db.execute(stmt).all()
-    counts_by_status = status_count_rows_to_dict(rows)
+    return _summary_from_counts(get_status_counts(db=db, user_id=user_id))
+
 
+def _summary_from_counts(
+    counts_by_status: dict[ApplicationStatus, int],
+) -> dict:
     return {
         "total": sum(counts_by_status.values()),
         "by_status": [
@@ -89,74 +89,146 @@ def get_time_to_status(*, db: Session, user_id: int) -> dict:
     }
 
 
+SQLITE_WINDOW_FUNCTIONS_MIN_VERSION = (3, 25, 0)
+STATUS_DURATION_YIELD_PER = 1_000
+
+
+def supports_window_functions(dialect: Dialect) -> bool:
+    if dialect.name == "postgresql":
+        return True
+    version = dialect.server_version_info or ()
+    return (
+        dialect.name == "sqlite"
+        and version >= SQLITE_WINDOW_FUNCTIONS_MIN_VERSION
+    )
+
+
 def get_status_duration_metrics(*, db: Session, user_id: int) -> dict:
+    dialect = db.get_bind().dialect
+    if supports_window_functions(dialect):
+        avg_days_by_status = _status_durations_sql(
+            db=db,
+            user_id=user_id,
+            dialect=dialect,
+        )
+    else:
+        avg_days_by_status = _status_durations_streamed(db=db, user_id=user_id)
+
+    return {
+        "metrics": [
+            {
+                "status": status,
+                "avg_days": avg_days_by_status.get(status),
+            }
+            for status in ApplicationStatus
+        ]
+    }
+
+
+def _status_change_filters(user_id: int) -> tuple:
+    return (
+        ApplicationEvent.user_id == user_id,
+        ApplicationEvent.event_type == ApplicationEventType.status_change,
+        ApplicationEvent.to_status.is_not(None),
+    )
+
+
+def _days_between(dialect: Dialect, later, earlier):
+    if dialect.name == "sqlite":
+        return func.julianday(later) - func.julianday(earlier)
+    return func.extract("epoch", later - earlier) / 86400.0
+
+
+def _status_durations_sql(
+    *,
+    db: Session,
+    user_id: int,
+    dialect: Dialect,
+) -> dict[ApplicationStatus, float]:
+    window = {
+        "partition_by": ApplicationEvent.application_id,
+        "order_by": (ApplicationEvent.created_at, ApplicationEvent.id),
+    }
+    transitions = (
+        select(
+            func.lag(ApplicationEvent.to_status)
+            .over(**window)
+            .label("prev_status"),
+            func.lag(ApplicationEvent.created_at)
+            .over(**window)
+            .label("prev_created_at"),
+            ApplicationEvent.created_at,
+        )
+        .where(*_status_change_filters(user_id))
+        .subquery()
+    )
+    duration_days = _days_between(
+        dialect,
+        transitions.c.created_at,
+        transitions.c.prev_created_at,
+    )
+
+    stmt = (
+        select(transitions.c.prev_status, func.avg(duration_days))
+        .where(
+            transitions.c.prev_status.is_not(None),
+            duration_days >= 0,
+        )
+        .group_by(transitions.c.prev_status)
+    )
+    rows = db.execute(stmt).all()
+
+    return {
+        normalize_status(status_value): float(avg_days)
+        for status_value, avg_days in rows
+        if avg_days is not None
+    }
+
+
+def _status_durations_streamed(
+    *,
+    db: Session,
+    user_id: int,
+) -> dict[ApplicationStatus, float]:
     stmt = (
         select(
             ApplicationEvent.application_id,
             ApplicationEvent.to_status,
             ApplicationEvent.created_at,
         )
-        .where(
-            ApplicationEvent.user_id == user_id,
-            ApplicationEvent.event_type == ApplicationEventType.status_change,
-            ApplicationEvent.to_status.is_not(None),
-        )
+        .where(*_status_change_filters(user_id))
         .order_by(
             ApplicationEvent.application_id.asc(),
             ApplicationEvent.created_at.asc(),
             ApplicationEvent.id.asc(),
         )
+        .execution_options(yield_per=STATUS_DURATION_YIELD_PER)
     )
-    rows = db.execute(stmt).all()
 
-    durations_by_status: dict[ApplicationStatus, list[float]] = {
-        status: []
-        for status in ApplicationStatus
-    }
-    last_by_application: dict[int, tuple[ApplicationStatus, datetime]] = {}
+    totals: dict[ApplicationStatus, float] = {}
+    counts: dict[ApplicationStatus, int] = {}
+    last: tuple[int, ApplicationStatus, datetime] | None = None
 
-    for application_id, to_status_value, created_at in rows:
+    for application_id, to_status_value, created_at in db.execute(stmt):
         normalized_to_status = normalize_status(to_status_value)
-        if application_id in last_by_application:
-            prev_status, prev_created_at = last_by_application[application_id]
+        if last is not None and last[0] == application_id:
+            _, prev_status, prev_created_at = last
             delta_days = (
                 created_at - prev_created_at
             ).total_seconds() / 86400.0
             if delta_days >= 0:
-                durations_by_status[prev_status].append(delta_days)
-        last_by_application[application_id] = (
-            normalized_to_status,
-            created_at,
-        )
+                totals[prev_status] = totals.get(prev_status, 0.0) + delta_days
+                counts[prev_status] = counts.get(prev_status, 0) + 1
+        last = (application_id, normalized_to_status, created_at)
 
-    return {
-        "metrics": [
-            {
-                "status": status,
-                "avg_days": (
-                    sum(durations_by_status[status])
-                    / len(durations_by_status[status])
-                    if durations_by_status[status]
-                    else None
-                ),
-            }
-            for status in ApplicationStatus
-        ]
-    }
+    return {status: totals[status] / counts[status] for status in totals}
 
 
 def get_funnel(*, db: Session, user_id: int) -> dict:
-    stmt = (
-        select(Application.status, func.count(Application.id))
-        .where(
-            Application.user_id == user_id,
-            Application.status.in_(FUNNEL_STEPS),
-        )
-        .group_by(Application.status)
-    )
-    rows = db.execute(stmt).all()
-    exact_counts = status_count_rows_to_dict(rows)
+    return _funnel_from_counts(get_status_counts(db=db, user_id=user_id))
+
 
+def _funnel_from_counts(exact_counts: dict[ApplicationStatus, int]) -> dict:
     cumulative: dict[ApplicationStatus, int] = {}
     running_total = 0
     for status in reversed(FUNNEL_STEPS):
@@ -299,3 +371,54 @@ def get_recruiter_performance_v2(*, db: Session, user_id: int) -> dict:
             for recruiter_email, total in totals_rows
         ]
     }
+
+
+def get_analytics_dashboard(
+    *,
+    db: Session,
+    user_id: int,
+    sections: set[DashboardSection],
+) -> dict:
+    """Compute the requested dashboard sections in one session.
+
+    Summary and funnel share one status-count read, and both recruiter
+    sections come from the same per-recruiter status grouping.
+    """
+    result: dict = {}
+
+    if {DashboardSection.summary, DashboardSection.funnel} & sections:
+        counts_by_status = get_status_counts(db=db, user_id=user_id)
+        if DashboardSection.summary in sections:
+            result["summary"] = _summary_from_counts(counts_by_status)
+        if DashboardSection.funnel in sections:
+            result["funnel"] = _funnel_from_counts(counts_by_status)
+
+    if DashboardSection.time_to_status in sections:
+        result["time_to_status"] = get_time_to_status(db=db, user_id=user_id)
+
+    if DashboardSection.status_duration in sections:
+        result["status_duration"] = get_status_duration_metrics(
+            db=db,
+            user_id=user_id,
+        )
+
+    recruiter_sections = {
+        DashboardSection.recruiter_performance,
+        DashboardSection.recruiter_performance_v2,
+    }
+    if recruiter_sections & sections:
+        performance = get_recruiter_performance_v2(db=db, user_id=user_id)
+        if DashboardSection.recruiter_performance_v2 in sections:
+            result["recruiter_performance_v2"] = performance
+        if DashboardSection.recruiter_performance in sections:
+            result["recruiter_performance"] = {
+                "recruiters": [
+                    {
+                        "recruiter_email": recruiter["recruiter_email"],
+                        "count": recruiter["total"],
+                    }
+                    for recruiter in performance["recruiters"]
+                ]
+            }
+
+    return result
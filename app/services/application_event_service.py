@@ -1,8 +1,12 @@
-from sqlalchemy import select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.orm import Session
 
+from app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
 from app.models.application import Application, ApplicationStatus
 from app.models.application_event import ApplicationEvent, ApplicationEventType
+from app.services.data_version_service import bump_data_version
+
+FOLLOW_UP_NOTE = "Follow-up scheduled"
 
 
 def create_event(
@@ -20,7 +24,7 @@ def create_event(
         if application is None or application.follow_up_at is None:
             return None
         if note is None:
-            note = "Follow-up scheduled"
+            note = FOLLOW_UP_NOTE
 
     event = ApplicationEvent(
         user_id=user_id,
@@ -35,24 +39,96 @@ def create_event(
     return event
 
 
+def create_application_note(
+    *,
+    db: Session,
+    application: Application,
+    note: str,
+) -> ApplicationEvent:
+    event = create_event(
+        db=db,
+        user_id=application.user_id,
+        application_id=application.id,
+        event_type=ApplicationEventType.note,
+        note=note,
+    )
+
+    bump_data_version(db=db, user_id=application.user_id)
+    db.commit()
+    return event
+
+
+def get_timeline_version(
+    *,
+    db: Session,
+    user_id: int,
+    application_id: int,
+) -> int | None:
+    """Return the newest event id, 0 if none, or None if the app is missing."""
+    latest_event_id = (
+        select(func.max(ApplicationEvent.id))
+        .where(ApplicationEvent.application_id == Application.id)
+        .scalar_subquery()
+    )
+    stmt = select(func.coalesce(latest_event_id, 0)).where(
+        Application.id == application_id,
+        Application.user_id == user_id,
+    )
+    return db.scalar(stmt)
+
+
 def get_application_timeline(
     *,
     db: Session,
     user_id: int,
     application_id: int,
-) -> list[ApplicationEvent]:
-    stmt = (
-        select(ApplicationEvent)
-        .where(
-            ApplicationEvent.user_id == user_id,
-            ApplicationEvent.application_id == application_id,
+    limit: int | None = None,
+    before: str | None = None,
+) -> tuple[list[ApplicationEvent], str | None]:
+    """Return events newest first and the cursor for the next page.
+
+    Without ``limit`` every matching event is returned and the cursor is
+    ``None``.
+    """
+    stmt = select(ApplicationEvent).where(
+        ApplicationEvent.user_id == user_id,
+        ApplicationEvent.application_id == application_id,
+    )
+    if before is not None:
+        before_id = decode_cursor(before).get("id")
+        if not isinstance(before_id, int):
+            raise InvalidCursorError("Invalid cursor")
+        anchor_created_at = (
+            select(ApplicationEvent.created_at)
+            .where(
+                ApplicationEvent.id == before_id,
+                ApplicationEvent.application_id == application_id,
+            )
+            .scalar_subquery()
         )
-        .order_by(
-            ApplicationEvent.created_at.desc(),
-            ApplicationEvent.id.desc(),
+        stmt = stmt.where(
+            or_(
+                ApplicationEvent.created_at < anchor_created_at,
+                and_(
+                    ApplicationEvent.created_at == anchor_created_at,
+                    ApplicationEvent.id < before_id,
+                ),
+            )
         )
+
+    stmt = stmt.order_by(
+        ApplicationEvent.created_at.desc(),
+        ApplicationEvent.id.desc(),
     )
-    return list(db.scalars(stmt).all())
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    events = list(db.scalars(stmt).all())
+
+    next_cursor = None
+    if limit is not None and len(events) > limit:
+        events = events[:limit]
+        next_cursor = encode_cursor({"id": events[-1].id})
+    return events, next_cursor
 
 
 create_application_event = create_event
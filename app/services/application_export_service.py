@@ -0,0 +1,201 @@
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator, Iterator, Sequence
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import Row, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.application import Application
+from app.models.application_event import ApplicationEvent
+
+EXPORT_YIELD_PER = 1_000
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+APPLICATION_EXPORT_COLUMNS = [
+    Application.id,
+    Application.company_name,
+    Application.position,
+    Application.status,
+    Application.recruiter_name,
+    Application.recruiter_email,
+    Application.job_url,
+    Application.salary_range,
+    Application.location,
+    Application.follow_up_at,
+    Application.status_updated_at,
+    Application.created_at,
+    Application.updated_at,
+]
+EVENT_EXPORT_COLUMNS = [
+    ApplicationEvent.id,
+    ApplicationEvent.event_type,
+    ApplicationEvent.from_status,
+    ApplicationEvent.to_status,
+    ApplicationEvent.note,
+    ApplicationEvent.created_at,
+]
+APPLICATION_FIELDS = [column.key for column in APPLICATION_EXPORT_COLUMNS]
+EVENT_FIELDS = [column.key for column in EVENT_EXPORT_COLUMNS]
+
+
+def export_statement(user_id: int) -> Select:
+    """Applications with their events, one row per (application, event)."""
+    return (
+        select(
+            *APPLICATION_EXPORT_COLUMNS,
+            *(
+                column.label(f"event_{column.key}")
+                for column in EVENT_EXPORT_COLUMNS
+            ),
+        )
+        .outerjoin(
+            ApplicationEvent,
+            ApplicationEvent.application_id == Application.id,
+        )
+        .where(Application.user_id == user_id)
+        .order_by(
+            Application.id.asc(),
+            ApplicationEvent.created_at.asc(),
+            ApplicationEvent.id.asc(),
+        )
+        .execution_options(yield_per=EXPORT_YIELD_PER)
+    )
+
+
+def _plain(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class _CsvEncoder:
+    def __init__(self) -> None:
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+        self._writer.writerow(
+            APPLICATION_FIELDS + [f"event_{field}" for field in EVENT_FIELDS]
+        )
+
+    def encode(self, rows: Sequence[Row]) -> str:
+        self._writer.writerows(
+            [_plain(value) for value in row] for row in rows
+        )
+        return self._drain()
+
+    def finish(self) -> str:
+        return self._drain()
+
+    def _drain(self) -> str:
+        text = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return text
+
+
+class _NdjsonEncoder:
+    """One JSON object per application with its events nested in order."""
+
+    def __init__(self) -> None:
+        self._current: dict | None = None
+
+    def encode(self, rows: Sequence[Row]) -> str:
+        lines = []
+        width = len(APPLICATION_FIELDS)
+        for row in rows:
+            if self._current is None or self._current["id"] != row[0]:
+                if self._current is not None:
+                    lines.append(self._dump())
+                self._current = {
+                    field: _plain(value)
+                    for field, value in zip(
+                        APPLICATION_FIELDS,
+                        row[:width],
+                        strict=True,
+                    )
+                }
+                self._current["events"] = []
+            if row[width] is not None:
+                self._current["events"].append(
+                    {
+                        field: _plain(value)
+                        for field, value in zip(
+                            EVENT_FIELDS,
+                            row[width:],
+                            strict=True,
+                        )
+                    }
+                )
+        return "".join(lines)
+
+    def finish(self) -> str:
+        return self._dump() if self._current is not None else ""
+
+    def _dump(self) -> str:
+        return json.dumps(self._current, ensure_ascii=False) + "\n"
+
+
+class _ExportWriter:
+    def __init__(self, export_format: str, compress: bool) -> None:
+        self._encoder = (
+            _CsvEncoder() if export_format == "csv" else _NdjsonEncoder()
+        )
+        self._compressor = (
+            zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if compress else None
+        )
+
+    def write(self, rows: Sequence[Row]) -> bytes:
+        return self._bytes(self._encoder.encode(rows))
+
+    def finish(self) -> bytes:
+        data = self._bytes(self._encoder.finish())
+        if self._compressor is not None:
+            data += self._compressor.flush()
+        return data
+
+    def _bytes(self, text: str) -> bytes:
+        data = text.encode()
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+        return data
+
+
+def iter_export(
+    *,
+    db: Session,
+    user_id: int,
+    export_format: str,
+    compress: bool = False,
+) -> Iterator[bytes]:
+    writer = _ExportWriter(export_format, compress)
+    result = db.execute(export_statement(user_id))
+    for partition in result.partitions():
+        chunk = writer.write(partition)
+        if chunk:
+            yield chunk
+    yield writer.finish()
+
+
+async def aiter_export(
+    *,
+    db: AsyncSession,
+    user_id: int,
+    export_format: str,
+    compress: bool = False,
+) -> AsyncIterator[bytes]:
+    writer = _ExportWriter(export_format, compress)
+    result = await db.stream(export_statement(user_id))
+    async for partition in result.partitions():
+        chunk = writer.write(partition)
+        if chunk:
+            yield chunk
+    yield writer.finish()
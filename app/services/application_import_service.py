@@ -0,0 +1,330 @@
+import codecs
+import csv
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import DbSession, run_db
+from app.models.application import Application
+from app.schemas.application import ApplicationCreate
+from app.services.application_service import invalidate_application_counts
+from app.services.data_version_service import bump_data_version
+from app.services.status_rollup_service import (
+    UPSERT_INSERTS,
+    adjust_status_count,
+)
+
+ImportRecord = tuple[int, dict | None, str | None]
+
+IMPORT_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/jsonl": "jsonl",
+    "application/x-ndjson": "jsonl",
+}
+
+
+async def iter_lines(
+    chunks: AsyncIterator[bytes],
+    *,
+    max_chars: int,
+) -> AsyncIterator[str | None]:
+    """Decode a UTF-8 byte stream into lines, keeping line endings.
+
+    A line longer than ``max_chars`` is yielded as ``None`` as soon as it
+    overflows and the rest of it is discarded, so memory stays bounded.
+    Only newly decoded text is scanned for newlines.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    parts: list[str] = []
+    size = 0
+    skipping = False
+
+    async for chunk in chunks:
+        text = decoder.decode(chunk)
+        start = 0
+        while (end := text.find("\n", start)) >= 0:
+            piece = text[start : end + 1]
+            if skipping:
+                skipping = False
+            elif size + len(piece) > max_chars:
+                yield None
+            else:
+                yield "".join(parts) + piece
+            parts, size = [], 0
+            start = end + 1
+        rest = text[start:]
+        if rest and not skipping:
+            if size + len(rest) > max_chars:
+                parts, size, skipping = [], 0, True
+                yield None
+            else:
+                parts.append(rest)
+                size += len(rest)
+
+    rest = decoder.decode(b"", final=True)
+    if skipping:
+        return
+    if size + len(rest) > max_chars:
+        yield None
+    elif parts or rest:
+        yield "".join(parts) + rest
+
+
+def _ends_in_quoted_field(line: str, in_quotes: bool) -> bool:
+    """Return whether a quoted field is still open at the end of ``line``.
+
+    Follows the default ``csv`` dialect: a quote opens a quoted field only
+    as the first character of a field, ``""`` inside one is a literal
+    quote, and quotes anywhere else are ordinary characters.
+    """
+    if not in_quotes and '"' not in line:
+        return False
+    field_start = not in_quotes
+    i = 0
+    while i < len(line):
+        char = line[i]
+        if in_quotes:
+            if char == '"':
+                if line.startswith('"', i + 1):
+                    i += 1
+                else:
+                    in_quotes = False
+        elif char == '"' and field_start:
+            in_quotes = True
+        field_start = not in_quotes and char == ","
+        i += 1
+    return in_quotes
+
+
+async def iter_csv_records(
+    lines: AsyncIterator[str | None],
+) -> AsyncIterator[ImportRecord]:
+    """Yield ``(line_number, row, error)`` for each CSV record.
+
+    A record continues onto the next line while a quoted field is open, so
+    quoted values may contain newlines. Records longer than
+    ``import_max_record_chars`` are reported and skipped.
+    """
+    header: list[str] | None = None
+    record = ""
+    record_line = 0
+    line_number = 0
+    in_quotes = False
+
+    async for line in lines:
+        line_number += 1
+        if not record:
+            record_line = line_number
+        if line is None:
+            yield record_line, None, _line_too_long()
+            record, in_quotes = "", False
+            continue
+        record += line
+        in_quotes = _ends_in_quoted_field(line, in_quotes)
+        if len(record) > settings.import_max_record_chars:
+            yield record_line, None, (
+                f"Record exceeds {settings.import_max_record_chars} characters"
+            )
+            record, in_quotes = "", False
+            continue
+        if in_quotes:
+            continue
+
+        raw, record = record, ""
+        if not raw.strip():
+            continue
+        try:
+            values = next(csv.reader([raw]))
+        except csv.Error as err:
+            yield record_line, None, str(err)
+            continue
+
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield record_line, None, (
+                f"Expected {len(header)} columns, got {len(values)}"
+            )
+            continue
+        yield record_line, {
+            name: value if value != "" else None
+            for name, value in zip(header, values, strict=True)
+        }, None
+
+    if record.strip():
+        yield record_line, None, "Unterminated quoted value"
+
+
+async def iter_jsonl_records(
+    lines: AsyncIterator[str | None],
+) -> AsyncIterator[ImportRecord]:
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if line is None:
+            yield line_number, None, _line_too_long()
+            continue
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as err:
+            yield line_number, None, f"Invalid JSON: {err.msg}"
+            continue
+        if not isinstance(row, dict):
+            yield line_number, None, "Expected a JSON object"
+            continue
+        yield line_number, row, None
+
+
+def import_application_batch(
+    *,
+    db: Session,
+    user_id: int,
+    rows: list[tuple[int, ApplicationCreate]],
+) -> list[int]:
+    """Insert a batch in one transaction and return the conflicting lines.
+
+    Rows that collide with ``uq_user_company_position`` (including an
+    earlier row of the same batch) are skipped instead of failing the batch.
+    """
+    now = datetime.utcnow()
+    conflicts: list[int] = []
+    pending: dict[tuple[str, str], tuple[int, dict]] = {}
+    for line_number, payload in rows:
+        key = (payload.company_name, payload.position)
+        if key in pending:
+            conflicts.append(line_number)
+            continue
+        pending[key] = (
+            line_number,
+            {
+                "user_id": user_id,
+                "status_updated_at": now,
+                **payload.model_dump(),
+            },
+        )
+    if not pending:
+        return conflicts
+
+    values = [value for _, value in pending.values()]
+    dialect_insert = UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if dialect_insert is not None:
+        stmt = (
+            dialect_insert(Application)
+            .on_conflict_do_nothing(
+                index_elements=[
+                    Application.user_id,
+                    Application.company_name,
+                    Application.position,
+                ],
+            )
+            .returning(Application.company_name, Application.position)
+        )
+        inserted = {tuple(row) for row in db.execute(stmt, values)}
+    else:
+        inserted = set()
+        for value in values:
+            try:
+                with db.begin_nested():
+                    db.execute(insert(Application), [value])
+            except IntegrityError:
+                continue
+            inserted.add((value["company_name"], value["position"]))
+
+    added_by_status: dict = {}
+    for key, (line_number, value) in pending.items():
+        if key not in inserted:
+            conflicts.append(line_number)
+            continue
+        status = value["status"]
+        added_by_status[status] = added_by_status.get(status, 0) + 1
+
+    for status, count in added_by_status.items():
+        adjust_status_count(db=db, user_id=user_id, status=status, delta=count)
+    if inserted:
+        bump_data_version(db=db, user_id=user_id)
+    db.commit()
+    return sorted(conflicts)
+
+
+async def import_applications(
+    *,
+    db: DbSession,
+    user_id: int,
+    chunks: AsyncIterator[bytes],
+    import_format: str,
+) -> dict:
+    """Stream, validate and insert rows ``import_batch_size`` at a time."""
+    parse = iter_csv_records if import_format == "csv" else iter_jsonl_records
+    result = {
+        "inserted": 0,
+        "conflicts": 0,
+        "invalid": 0,
+        "errors": [],
+        "errors_truncated": False,
+    }
+
+    def report(line: int, reason: str, detail: str) -> None:
+        result["conflicts" if reason == "conflict" else "invalid"] += 1
+        if len(result["errors"]) < settings.import_max_reported_errors:
+            result["errors"].append(
+                {"line": line, "reason": reason, "detail": detail}
+            )
+        else:
+            result["errors_truncated"] = True
+
+    async def flush(batch: list[tuple[int, ApplicationCreate]]) -> None:
+        conflicts = await run_db(
+            db,
+            import_application_batch,
+            user_id=user_id,
+            rows=batch,
+        )
+        result["inserted"] += len(batch) - len(conflicts)
+        for line_number in conflicts:
+            report(line_number, "conflict", "Application already exists")
+
+    batch: list[tuple[int, ApplicationCreate]] = []
+    try:
+        lines = iter_lines(chunks, max_chars=settings.import_max_record_chars)
+        async for line_number, row, error in parse(lines):
+            if error is not None:
+                report(line_number, "invalid", error)
+                continue
+            try:
+                payload = ApplicationCreate.model_validate(row)
+            except ValidationError as err:
+                report(line_number, "invalid", _format_validation_error(err))
+                continue
+
+            batch.append((line_number, payload))
+            if len(batch) >= settings.import_batch_size:
+                await flush(batch)
+                batch = []
+
+        if batch:
+            await flush(batch)
+    finally:
+        if result["inserted"]:
+            invalidate_application_counts(user_id)
+
+    return result
+
+
+def _line_too_long() -> str:
+    return f"Line exceeds {settings.import_max_record_chars} characters"
+
+
+def _format_validation_error(err: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in err.errors()
+    )
@@ -0,0 +1,91 @@
+from sqlalchemy import ColumnElement, Dialect, Select, func, literal_column, or_, select
+
+from app.models.application import Application
+from app.models.application_search import (
+    applications_fts,
+    sqlite_supports_trigram_fts,
+)
+
+SEARCH_COLUMNS = ["company_name", "position", "recruiter_email"]
+TRIGRAM_MIN_LENGTH = 3
+
+
+def search_condition(
+    *,
+    dialect: Dialect,
+    term: str,
+    columns: list[str] = SEARCH_COLUMNS,
+) -> ColumnElement[bool]:
+    """Substring match of ``term`` in any of ``columns``.
+
+    On PostgreSQL the ``ILIKE`` is served by the ``pg_trgm`` GIN indexes. On
+    SQLite terms long enough to form a trigram go through the FTS5 trigram
+    table; shorter terms, and other dialects, fall back to ``ILIKE``.
+    """
+    if _uses_sqlite_fts(dialect, term):
+        return Application.id.in_(
+            select(applications_fts.c.rowid).where(
+                _fts_match(_fts_query(term, columns))
+            )
+        )
+
+    return or_(
+        *(getattr(Application, name).ilike(f"%{term}%") for name in columns)
+    )
+
+
+def order_by_relevance(
+    stmt: Select[tuple[Application]],
+    *,
+    dialect: Dialect,
+    term: str,
+) -> Select[tuple[Application]] | None:
+    """Order ``stmt`` by how well rows match ``term``, best first.
+
+    Returns ``None`` when the dialect has no ranking support for the term.
+    """
+    if dialect.name == "postgresql":
+        rank = func.greatest(
+            *(
+                func.word_similarity(
+                    term,
+                    func.coalesce(getattr(Application, name), ""),
+                )
+                for name in SEARCH_COLUMNS
+            )
+        )
+        return stmt.order_by(rank.desc(), Application.id.desc())
+
+    if _uses_sqlite_fts(dialect, term):
+        ranked = (
+            select(
+                applications_fts.c.rowid.label("id"),
+                func.bm25(literal_column(applications_fts.name)).label("rank"),
+            )
+            .where(_fts_match(_fts_query(term, SEARCH_COLUMNS)))
+            .subquery()
+        )
+        return stmt.join(ranked, ranked.c.id == Application.id).order_by(
+            ranked.c.rank.asc(),
+            Application.id.desc(),
+        )
+
+    return None
+
+
+def _uses_sqlite_fts(dialect: Dialect, term: str) -> bool:
+    return (
+        len(term) >= TRIGRAM_MIN_LENGTH
+        and sqlite_supports_trigram_fts(dialect)
+    )
+
+
+def _fts_match(query: str) -> ColumnElement[bool]:
+    return literal_column(applications_fts.name).op("MATCH")(query)
+
+
+def _fts_query(term: str, columns: list[str]) -> str:
+    phrase = '"' + term.replace('"', '""') + '"'
+    if columns == SEARCH_COLUMNS:
+        return phrase
+    return "{" + " ".join(columns) + "} : " + phrase
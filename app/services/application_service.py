@@ -1,13 +1,42 @@
 from datetime import UTC, datetime, timedelta
-
-from sqlalchemy import Select, func, or_, select
+from threading import Lock
+
+from sqlalchemy import (
+    Dialect,
+    Select,
+    and_,
+    case,
+    delete,
+    func,
+    insert,
+    nulls_last,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
 from app.models.application import Application, ApplicationStatus
-from app.models.application_event import ApplicationEventType
-from app.schemas.application import ApplicationCreate, ApplicationUpdate
-from app.services.application_event_service import create_application_event
+from app.models.application_event import ApplicationEvent, ApplicationEventType
+from app.schemas.application import (
+    ApplicationBulkFilter,
+    ApplicationCreate,
+    ApplicationUpdate,
+)
+from app.services.application_event_service import FOLLOW_UP_NOTE
+from app.services.application_search_service import (
+    order_by_relevance,
+    search_condition,
+)
+from app.services.data_version_service import bump_data_version
+from app.services.status_rollup_service import (
+    adjust_status_count,
+    adjust_status_counts,
+)
 
 STATUS_FLOW_ORDER = [
     ApplicationStatus.applied,
@@ -18,6 +47,41 @@ STATUS_FLOW_ORDER = [
 ]
 APPLICATION_UNIQUE_CONSTRAINT = "uq_user_company_position"
 APPLICATION_CONFLICT_FIELDS = ["company_name", "position"]
+COUNT_CACHE_FILTERS_PER_USER = 32
+APPLICATION_SORT_FIELDS = [
+    "id",
+    "company_name",
+    "position",
+    "status",
+    "recruiter_name",
+    "recruiter_email",
+    "job_url",
+    "salary_range",
+    "location",
+    "follow_up_at",
+    "status_updated_at",
+    "created_at",
+]
+
+CountCacheKey = tuple[str | None, str | None, str | None]
+
+# Each user's entry is replaced, never mutated. Invalidation installs a fresh
+# empty entry, so a count computed before it no longer matches the entry by
+# identity and is dropped instead of being written back.
+_count_cache: TTLCache[int, dict[CountCacheKey, int]] = TTLCache(
+    maxsize=settings.count_cache_max_users,
+    ttl_seconds=settings.count_cache_ttl_seconds,
+)
+_count_cache_lock = Lock()
+
+
+def invalidate_application_counts(user_id: int) -> None:
+    with _count_cache_lock:
+        _count_cache.set(user_id, {})
+
+
+def clear_application_count_cache() -> None:
+    _count_cache.clear()
 
 
 def apply_status_flow(
@@ -42,6 +106,20 @@ def apply_status_flow(
     raise ValueError("Invalid status transition")
 
 
+def allowed_previous_statuses(
+    new: ApplicationStatus,
+) -> frozenset[ApplicationStatus]:
+    """Statuses from which ``apply_status_flow`` accepts a move to ``new``."""
+    allowed = set()
+    for current in ApplicationStatus:
+        try:
+            apply_status_flow(current, new)
+        except ValueError:
+            continue
+        allowed.add(current)
+    return frozenset(allowed)
+
+
 def get_application_conflict_detail(
     error: IntegrityError,
 ) -> dict[str, str | list[str]] | None:
@@ -81,8 +159,10 @@ def create_application(
         **payload.model_dump(),
     )
     db.add(application)
+    adjust_status_count(db=db, user_id=user_id, status=payload.status, delta=1)
+    bump_data_version(db=db, user_id=user_id)
     db.commit()
-    db.refresh(application)
+    invalidate_application_counts(user_id)
     return application
 
 
@@ -91,22 +171,60 @@ def get_application_by_id(
     db: Session,
     user_id: int,
     app_id: int,
+    for_update: bool = False,
 ) -> Application | None:
+    """Load one application; ``for_update`` locks the row until commit.
+
+    Write paths lock the row so the status they adjust the rollup from
+    cannot change underneath them.
+    """
     stmt = select(Application).where(
         Application.id == app_id,
         Application.user_id == user_id,
     )
+    if for_update:
+        stmt = stmt.with_for_update().execution_options(populate_existing=True)
     return db.scalar(stmt)
 
 
+def get_application_version(
+    *,
+    db: Session,
+    user_id: int,
+    app_id: int,
+) -> tuple[int, datetime] | None:
+    """Return ``(version, updated_at)`` without loading the application."""
+    stmt = select(Application.version, Application.updated_at).where(
+        Application.id == app_id,
+        Application.user_id == user_id,
+    )
+    row = db.execute(stmt).first()
+    return tuple(row) if row is not None else None
+
+
 def delete_application(*, db: Session, application: Application) -> None:
+    user_id = application.user_id
+    adjust_status_count(
+        db=db,
+        user_id=user_id,
+        status=application.status,
+        delta=-1,
+    )
+    db.execute(
+        delete(ApplicationEvent).where(
+            ApplicationEvent.application_id == application.id,
+        )
+    )
     db.delete(application)
+    bump_data_version(db=db, user_id=user_id)
     db.commit()
+    invalidate_application_counts(user_id)
 
 
 def _apply_filters(
     *,
     stmt: Select[tuple[Application]],
+    dialect: Dialect,
     user_id: int,
     status: ApplicationStatus | None,
     company: str | None,
@@ -118,17 +236,17 @@ def _apply_filters(
         stmt = stmt.where(Application.status == status)
 
     if company:
-        stmt = stmt.where(Application.company_name.ilike(f"%{company}%"))
-
-    if q:
         stmt = stmt.where(
-            or_(
-                Application.company_name.ilike(f"%{q}%"),
-                Application.position.ilike(f"%{q}%"),
-                Application.recruiter_email.ilike(f"%{q}%"),
+            search_condition(
+                dialect=dialect,
+                term=company,
+                columns=["company_name"],
             )
         )
 
+    if q:
+        stmt = stmt.where(search_condition(dialect=dialect, term=q))
+
     return stmt
 
 
@@ -142,34 +260,263 @@ def get_user_applications(
     sort: str = "-created_at",
     page: int = 1,
     page_size: int = 20,
-) -> tuple[list[Application], int]:
+    include_total: bool = True,
+) -> tuple[list[Application], int | None]:
     base_stmt = _apply_filters(
         stmt=select(Application),
+        dialect=db.get_bind().dialect,
         user_id=user_id,
         status=status,
         company=company,
         q=q,
     )
 
-    total_stmt = select(func.count()).select_from(base_stmt.subquery())
-    total = db.scalar(total_stmt) or 0
-
-    descending = sort.startswith("-")
-    field_name = sort[1:] if descending else sort
+    total = None
+    if include_total:
+        total, _ = count_user_applications(
+            db=db,
+            user_id=user_id,
+            status=status,
+            company=company,
+            q=q,
+        )
 
-    if hasattr(Application, field_name):
-        order_column = getattr(Application, field_name)
-        base_stmt = base_stmt.order_by(
-            order_column.desc() if descending else order_column.asc()
+    ranked_stmt = None
+    if sort == "relevance" and q:
+        ranked_stmt = order_by_relevance(
+            base_stmt,
+            dialect=db.get_bind().dialect,
+            term=q,
         )
-    else:
-        base_stmt = base_stmt.order_by(Application.created_at.desc())
+    if ranked_stmt is None:
+        field_name, descending = _resolve_sort(sort)
+        ranked_stmt = base_stmt.order_by(*_sort_order(field_name, descending))
 
-    stmt = base_stmt.offset((page - 1) * page_size).limit(page_size)
+    stmt = ranked_stmt.offset((page - 1) * page_size).limit(page_size)
     items = list(db.scalars(stmt).all())
     return items, total
 
 
+def count_user_applications(
+    *,
+    db: Session,
+    user_id: int,
+    status: ApplicationStatus | None = None,
+    company: str | None = None,
+    q: str | None = None,
+    estimate: bool = False,
+) -> tuple[int, bool]:
+    """Return ``(total, is_estimate)`` for a listing filter.
+
+    Exact counts are cached per user under the normalized filter tuple until
+    the next write by that user. With ``estimate`` a ``q`` search is counted
+    over a bounded sample of the user's rows and scaled by their total.
+    """
+    if estimate and q:
+        return _estimate_user_applications(
+            db=db,
+            user_id=user_id,
+            status=status,
+            company=company,
+            q=q,
+        )
+
+    key: CountCacheKey = (
+        status.value if status is not None else None,
+        company.lower() if company else None,
+        q.lower() if q else None,
+    )
+    with _count_cache_lock:
+        counts = _count_cache.get(user_id)
+        if counts is None:
+            counts = {}
+            _count_cache.set(user_id, counts)
+        elif key in counts:
+            return counts[key], False
+
+    filtered = _apply_filters(
+        stmt=select(Application.id),
+        dialect=db.get_bind().dialect,
+        user_id=user_id,
+        status=status,
+        company=company,
+        q=q,
+    )
+    total = db.scalar(select(func.count()).select_from(filtered.subquery())) or 0
+
+    with _count_cache_lock:
+        if _count_cache.get(user_id) is counts:
+            updated = dict(counts)
+            if len(updated) >= COUNT_CACHE_FILTERS_PER_USER:
+                updated.pop(next(iter(updated)))
+            updated[key] = total
+            _count_cache.set(user_id, updated)
+    return total, False
+
+
+def _estimate_user_applications(
+    *,
+    db: Session,
+    user_id: int,
+    status: ApplicationStatus | None,
+    company: str | None,
+    q: str,
+) -> tuple[int, bool]:
+    sample_size = settings.count_estimate_sample_size
+    user_total, _ = count_user_applications(db=db, user_id=user_id)
+    if user_total <= sample_size:
+        return count_user_applications(
+            db=db,
+            user_id=user_id,
+            status=status,
+            company=company,
+            q=q,
+        )
+
+    # Systematic sample: every ``stride``-th of the user's rows by id, so old
+    # and new applications are represented alike.
+    stride = -(-user_total // sample_size)
+    numbered = (
+        select(
+            Application.id,
+            func.row_number().over(order_by=Application.id).label("position"),
+        )
+        .where(Application.user_id == user_id)
+        .subquery()
+    )
+    sample_ids = select(numbered.c.id).where(numbered.c.position % stride == 0)
+    filtered = _apply_filters(
+        stmt=select(Application.id).where(Application.id.in_(sample_ids)),
+        dialect=db.get_bind().dialect,
+        user_id=user_id,
+        status=status,
+        company=company,
+        q=q,
+    )
+    matches = (
+        db.scalar(select(func.count()).select_from(filtered.subquery())) or 0
+    )
+    return round(matches * user_total / (user_total // stride)), True
+
+
+def get_user_applications_by_cursor(
+    *,
+    db: Session,
+    user_id: int,
+    status: ApplicationStatus | None = None,
+    company: str | None = None,
+    q: str | None = None,
+    sort: str = "-created_at",
+    cursor: str | None = None,
+    page_size: int = 20,
+) -> tuple[list[Application], str | None]:
+    field_name, descending = _resolve_sort(sort)
+    sort_key = f"-{field_name}" if descending else field_name
+
+    stmt = _apply_filters(
+        stmt=select(Application),
+        dialect=db.get_bind().dialect,
+        user_id=user_id,
+        status=status,
+        company=company,
+        q=q,
+    )
+    if cursor is not None:
+        payload = decode_cursor(cursor)
+        if payload.get("s") != sort_key or not isinstance(
+            payload.get("id"),
+            int,
+        ):
+            raise InvalidCursorError("Invalid cursor")
+        stmt = stmt.where(
+            _keyset_condition(
+                user_id=user_id,
+                field_name=field_name,
+                descending=descending,
+                payload=payload,
+            )
+        )
+
+    stmt = stmt.order_by(*_sort_order(field_name, descending)).limit(
+        page_size + 1
+    )
+    items = list(db.scalars(stmt).all())
+
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        last = items[-1]
+        value = getattr(last, field_name)
+        next_cursor = encode_cursor(
+            {
+                "s": sort_key,
+                "id": last.id,
+                "v": value.isoformat() if isinstance(value, datetime) else value,
+            }
+        )
+    return items, next_cursor
+
+
+def _resolve_sort(sort: str) -> tuple[str, bool]:
+    descending = sort.startswith("-")
+    field_name = sort[1:] if descending else sort
+    if field_name not in APPLICATION_SORT_FIELDS:
+        return "created_at", True
+    return field_name, descending
+
+
+def _sort_order(field_name: str, descending: bool) -> list:
+    id_order = Application.id.desc() if descending else Application.id.asc()
+    if field_name == "id":
+        return [id_order]
+
+    column = getattr(Application, field_name)
+    order = column.desc() if descending else column.asc()
+    if Application.__table__.c[field_name].nullable:
+        order = nulls_last(order)
+    return [order, id_order]
+
+
+def _keyset_condition(
+    *,
+    user_id: int,
+    field_name: str,
+    descending: bool,
+    payload: dict,
+):
+    last_id = payload["id"]
+    after_id = Application.id < last_id if descending else Application.id > last_id
+    if field_name == "id":
+        return after_id
+
+    column = getattr(Application, field_name)
+    if payload.get("v") is None:
+        return and_(column.is_(None), after_id)
+
+    value = _decode_sort_value(field_name, payload["v"])
+    boundary = func.coalesce(
+        select(column)
+        .where(Application.id == last_id, Application.user_id == user_id)
+        .scalar_subquery(),
+        value,
+    )
+    after_value = column < boundary if descending else column > boundary
+    condition = or_(after_value, and_(column == boundary, after_id))
+    if Application.__table__.c[field_name].nullable:
+        condition = or_(condition, column.is_(None))
+    return condition
+
+
+def _decode_sort_value(field_name: str, raw_value):
+    python_type = Application.__table__.c[field_name].type.python_type
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(raw_value)
+        return python_type(raw_value)
+    except (TypeError, ValueError) as err:
+        raise InvalidCursorError("Invalid cursor") from err
+
+
 def get_due_followups(
     *,
     db: Session,
@@ -199,54 +546,204 @@ def update_application(
     payload: ApplicationUpdate,
 ) -> Application:
     data = payload.model_dump(exclude_unset=True)
-
-    old_status = application.status
-    old_follow_up_at = application.follow_up_at
-    old_recruiter_email = application.recruiter_email
-    old_recruiter_name = application.recruiter_name
+    previous = {
+        "id": application.id,
+        "status": application.status,
+        "follow_up_at": application.follow_up_at,
+        "recruiter_email": application.recruiter_email,
+        "recruiter_name": application.recruiter_name,
+    }
 
     if "status" in data:
         data["status"] = apply_status_flow(application.status, data["status"])
-        if data["status"] != old_status:
+        if data["status"] != previous["status"]:
             data["status_updated_at"] = datetime.utcnow()
 
     for key, value in data.items():
         setattr(application, key, value)
 
-    if "status" in data and data["status"] != old_status:
-        create_application_event(
-            db=db,
-            user_id=user_id,
-            application_id=application.id,
-            event_type=ApplicationEventType.status_change,
-            from_status=old_status,
-            to_status=data["status"],
-        )
+    _record_changes(db=db, user_id=user_id, data=data, previous=[previous])
+    bump_data_version(db=db, user_id=user_id)
+    db.commit()
+    invalidate_application_counts(user_id)
+    return application
 
-    if "follow_up_at" in data and data["follow_up_at"] != old_follow_up_at:
-        create_application_event(
-            db=db,
+
+BULK_UPDATE_COLUMNS = [
+    Application.id,
+    Application.status,
+    Application.recruiter_name,
+    Application.recruiter_email,
+    Application.job_url,
+    Application.salary_range,
+    Application.location,
+    Application.follow_up_at,
+]
+
+
+def bulk_update_applications(
+    *,
+    db: Session,
+    user_id: int,
+    payload: ApplicationUpdate,
+    ids: list[int] | None = None,
+    filters: ApplicationBulkFilter | None = None,
+) -> dict:
+    """Apply one update to many applications in a single transaction.
+
+    Targets are read as plain rows and locked until commit, transitions are
+    checked against the set of statuses allowed to move to the new one,
+    changed rows are written with one UPDATE and their events with one
+    multi-row INSERT.
+    """
+    max_items = settings.bulk_update_max_items
+    if ids is not None and len(set(ids)) > max_items:
+        raise ValueError(f"Bulk update targets more than {max_items} applications")
+    data = payload.model_dump(exclude_unset=True)
+    new_status = data.get("status")
+    if "status" in data and new_status is None:
+        raise ValueError("Invalid status transition")
+
+    stmt = select(*BULK_UPDATE_COLUMNS).where(Application.user_id == user_id)
+    if ids is not None:
+        stmt = stmt.where(Application.id.in_(ids))
+    else:
+        filters = filters or ApplicationBulkFilter()
+        stmt = _apply_filters(
+            stmt=stmt,
+            dialect=db.get_bind().dialect,
             user_id=user_id,
-            application_id=application.id,
-            event_type=ApplicationEventType.follow_up,
+            status=filters.status,
+            company=filters.company,
+            q=filters.q,
         )
-
-    recruiter_email_changed = (
-        "recruiter_email" in data
-        and data["recruiter_email"] != old_recruiter_email
-    )
-    recruiter_name_changed = (
-        "recruiter_name" in data
-        and data["recruiter_name"] != old_recruiter_name
+    stmt = (
+        stmt.order_by(Application.id)
+        .limit(max_items + 1)
+        .with_for_update(of=Application)
     )
-    if recruiter_email_changed or recruiter_name_changed:
-        create_application_event(
+    rows = {row.id: row for row in db.execute(stmt)}
+    if len(rows) > max_items:
+        raise ValueError(f"Bulk update matches more than {max_items} applications")
+
+    allowed = allowed_previous_statuses(new_status) if new_status else None
+    results: dict[int, str] = {}
+    changed = []
+    for app_id, row in rows.items():
+        if allowed is not None and row.status not in allowed:
+            results[app_id] = "invalid_transition"
+        elif any(
+            _comparable(getattr(row, key)) != _comparable(value)
+            for key, value in data.items()
+        ):
+            results[app_id] = "updated"
+            changed.append(row)
+        else:
+            results[app_id] = "unchanged"
+
+    if changed:
+        values = dict(data)
+        if new_status is not None:
+            values["status_updated_at"] = case(
+                (Application.status != new_status, datetime.utcnow()),
+                else_=Application.status_updated_at,
+            )
+        db.execute(
+            update(Application)
+            .where(
+                Application.user_id == user_id,
+                Application.id.in_([row.id for row in changed]),
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        _record_changes(
             db=db,
             user_id=user_id,
-            application_id=application.id,
-            event_type=ApplicationEventType.contact,
+            data=data,
+            previous=[row._asdict() for row in changed],
         )
-
+        bump_data_version(db=db, user_id=user_id)
     db.commit()
-    db.refresh(application)
-    return application
+    if changed:
+        invalidate_application_counts(user_id)
+
+    target_ids = ids if ids is not None else list(rows)
+    return {
+        "updated": len(changed),
+        "results": [
+            {"id": app_id, "result": results.get(app_id, "not_found")}
+            for app_id in dict.fromkeys(target_ids)
+        ],
+    }
+
+
+def _comparable(value):
+    """Return ``value`` with datetimes as naive UTC for change detection.
+
+    Payload datetimes are timezone-aware UTC while SQLite hands stored ones
+    back naive, so both sides are normalised before comparing.
+    """
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(UTC).replace(tzinfo=None)
+    return value
+
+
+def _record_changes(
+    *,
+    db: Session,
+    user_id: int,
+    data: dict,
+    previous: list[dict],
+) -> None:
+    """Write rollup deltas and events for updates applied to ``previous``.
+
+    All events go in with one multi-row INSERT and all rollup deltas with
+    one upsert, however many applications changed.
+    """
+    new_status = data.get("status")
+    deltas: dict[ApplicationStatus, int] = {}
+    events = []
+
+    def event(app_id: int, event_type: ApplicationEventType, **fields) -> dict:
+        return {
+            "user_id": user_id,
+            "application_id": app_id,
+            "event_type": event_type,
+            "from_status": None,
+            "to_status": None,
+            "note": None,
+            **fields,
+        }
+
+    for old in previous:
+        if new_status is not None and old["status"] != new_status:
+            deltas[old["status"]] = deltas.get(old["status"], 0) - 1
+            deltas[new_status] = deltas.get(new_status, 0) + 1
+            events.append(
+                event(
+                    old["id"],
+                    ApplicationEventType.status_change,
+                    from_status=old["status"],
+                    to_status=new_status,
+                )
+            )
+        if data.get("follow_up_at") is not None and _comparable(
+            data["follow_up_at"]
+        ) != _comparable(old["follow_up_at"]):
+            events.append(
+                event(
+                    old["id"],
+                    ApplicationEventType.follow_up,
+                    note=FOLLOW_UP_NOTE,
+                )
+            )
+        if any(
+            key in data and data[key] != old[key]
+            for key in ("recruiter_email", "recruiter_name")
+        ):
+            events.append(event(old["id"], ApplicationEventType.contact))
+
+    adjust_status_counts(db=db, user_id=user_id, deltas=deltas)
+    if events:
+        db.execute(insert(ApplicationEvent.__table__), events)
@@ -0,0 +1,24 @@
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.database import pin_to_primary
+from app.models.user import User
+
+
+def bump_data_version(*, db: Session, user_id: int) -> None:
+    """Mark the user's applications as changed in the current transaction.
+
+    Also pins the client's reads to the primary once the transaction commits.
+    """
+    db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(data_version=User.data_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    pin_to_primary(db)
+
+
+def get_data_version(*, db: Session, user_id: int) -> int:
+    version = db.scalar(select(User.data_version).where(User.id == user_id))
+    return version or 0
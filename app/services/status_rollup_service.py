@@ -0,0 +1,162 @@
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.application import Application, ApplicationStatus
+from app.models.user_status_count import UserStatusCount
+
+UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def adjust_status_count(
+    *,
+    db: Session,
+    user_id: int,
+    status: ApplicationStatus,
+    delta: int,
+) -> None:
+    """Apply ``delta`` to the user's rollup row in the current transaction."""
+    adjust_status_counts(db=db, user_id=user_id, deltas={status: delta})
+
+
+def adjust_status_counts(
+    *,
+    db: Session,
+    user_id: int,
+    deltas: dict[ApplicationStatus, int],
+) -> None:
+    """Apply several per-status deltas with one upsert where supported."""
+    deltas = {status: delta for status, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    dialect_insert = UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if dialect_insert is not None:
+        stmt = dialect_insert(UserStatusCount).values(
+            [
+                {"user_id": user_id, "status": status, "count": delta}
+                for status, delta in deltas.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserStatusCount.user_id, UserStatusCount.status],
+            set_={"count": UserStatusCount.count + stmt.excluded.count},
+        )
+        db.execute(stmt)
+        return
+
+    for status, delta in deltas.items():
+        result = db.execute(
+            update(UserStatusCount)
+            .where(
+                UserStatusCount.user_id == user_id,
+                UserStatusCount.status == status,
+            )
+            .values(count=UserStatusCount.count + delta)
+        )
+        if result.rowcount == 0:
+            db.execute(
+                insert(UserStatusCount).values(
+                    user_id=user_id,
+                    status=status,
+                    count=delta,
+                )
+            )
+
+
+def get_status_counts(
+    *,
+    db: Session,
+    user_id: int,
+) -> dict[ApplicationStatus, int]:
+    rows = db.execute(
+        select(UserStatusCount.status, UserStatusCount.count).where(
+            UserStatusCount.user_id == user_id
+        )
+    ).all()
+    return {
+        ApplicationStatus(status): int(count)
+        for status, count in rows
+        if count
+    }
+
+
+def _actual_status_counts(
+    *,
+    db: Session,
+    user_id: int | None,
+) -> dict[tuple[int, ApplicationStatus], int]:
+    stmt = select(
+        Application.user_id,
+        Application.status,
+        func.count(Application.id),
+    ).group_by(Application.user_id, Application.status)
+    if user_id is not None:
+        stmt = stmt.where(Application.user_id == user_id)
+    return {
+        (row_user_id, ApplicationStatus(status)): int(count)
+        for row_user_id, status, count in db.execute(stmt).all()
+    }
+
+
+def _stored_status_counts(
+    *,
+    db: Session,
+    user_id: int | None,
+) -> dict[tuple[int, ApplicationStatus], int]:
+    stmt = select(
+        UserStatusCount.user_id,
+        UserStatusCount.status,
+        UserStatusCount.count,
+    )
+    if user_id is not None:
+        stmt = stmt.where(UserStatusCount.user_id == user_id)
+    return {
+        (row_user_id, ApplicationStatus(status)): int(count)
+        for row_user_id, status, count in db.execute(stmt).all()
+        if count
+    }
+
+
+def check_status_rollup(
+    *,
+    db: Session,
+    user_id: int | None = None,
+) -> list[dict]:
+    """Return rollup rows that disagree with the applications table."""
+    actual = _actual_status_counts(db=db, user_id=user_id)
+    stored = _stored_status_counts(db=db, user_id=user_id)
+
+    return [
+        {
+            "user_id": key[0],
+            "status": key[1],
+            "expected": actual.get(key, 0),
+            "stored": stored.get(key, 0),
+        }
+        for key in sorted(actual.keys() | stored.keys())
+        if actual.get(key, 0) != stored.get(key, 0)
+    ]
+
+
+def rebuild_status_rollup(*, db: Session, user_id: int | None = None) -> int:
+    """Recompute the rollup from ``applications``; returns rows written."""
+    clear_stmt = delete(UserStatusCount)
+    if user_id is not None:
+        clear_stmt = clear_stmt.where(UserStatusCount.user_id == user_id)
+    db.execute(clear_stmt)
+
+    actual = _actual_status_counts(db=db, user_id=user_id)
+    if actual:
+        db.execute(
+            insert(UserStatusCount),
+            [
+                {"user_id": row_user_id, "status": status, "count": count}
+                for (row_user_id, status), count in actual.items()
+            ],
+        )
+    db.commit()
+    return len(actual)
@@ -0,0 +1,89 @@
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session, object_session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.user import User
+from app.schemas.auth import CurrentUser
+
+_principal_cache: TTLCache[str, CurrentUser] = TTLCache(
+    maxsize=settings.principal_cache_max_entries,
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+)
+_STALE_PRINCIPALS_KEY = "stale_principals"
+
+
+def get_user_by_email(*, db: Session, email: str) -> User | None:
+    return db.scalar(select(User).where(User.email == email))
+
+
+def create_user(*, db: Session, email: str, hashed_password: str) -> User:
+    user = User(email=email, hashed_password=hashed_password)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def update_user_password_hash(
+    *,
+    db: Session,
+    user: User,
+    hashed_password: str,
+) -> None:
+    user.hashed_password = hashed_password
+    db.commit()
+
+
+def get_principal(*, db: Session, email: str) -> CurrentUser | None:
+    principal = _principal_cache.get(email)
+    if principal is not None:
+        return principal
+
+    user = get_user_by_email(db=db, email=email)
+    if user is None:
+        return None
+
+    principal = CurrentUser(id=user.id, email=user.email)
+    _principal_cache.set(email, principal)
+    return principal
+
+
+def get_cached_principal(email: str) -> CurrentUser | None:
+    return _principal_cache.get(email)
+
+
+def invalidate_principal(email: str) -> None:
+    _principal_cache.pop(email)
+
+
+def clear_principal_cache() -> None:
+    _principal_cache.clear()
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _collect_changed_user(mapper, connection, target: User) -> None:
+    """Remember the emails a flush changed; they are evicted on commit.
+
+    Evicting at flush would let a concurrent request re-cache the old row
+    before this transaction commits.
+    """
+    session = object_session(target)
+    emails = {target.email, *inspect(target).attrs.email.history.deleted}
+    if session is None:
+        for email in emails:
+            invalidate_principal(email)
+        return
+    session.info.setdefault(_STALE_PRINCIPALS_KEY, set()).update(emails)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    for email in session.info.pop(_STALE_PRINCIPALS_KEY, ()):
+        invalidate_principal(email)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session: Session) -> None:
+    session.info.pop(_STALE_PRINCIPALS_KEY, None)
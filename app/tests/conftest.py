@@ -1,12 +1,36 @@
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.core.database import get_db
+from app.core.rate_limiter import reset_rate_limits
+from app.core.security import token_cache
+from app.core.sql_instrumentation import instrument_engine
 from app.main import app
 from app.models.base import Base
+from app.services.analytics_cache_service import clear_analytics_cache
+from app.services.application_service import clear_application_count_cache
+from app.services.user_service import clear_principal_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    clear_application_count_cache()
+    clear_analytics_cache()
+    clear_principal_cache()
+    token_cache.clear()
+    reset_rate_limits()
+    yield
+    clear_application_count_cache()
+    clear_analytics_cache()
+    clear_principal_cache()
+    token_cache.clear()
+    reset_rate_limits()
 
 
 @pytest.fixture()
@@ -16,10 +40,12 @@ def client():
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+    instrument_engine(engine)
     TestingSessionLocal = sessionmaker(
         bind=engine,
         autoflush=False,
         autocommit=False,
+        expire_on_commit=False,
     )
 
     Base.metadata.create_all(bind=engine)
@@ -37,3 +63,94 @@ def client():
         yield c
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def async_client():
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        poolclass=StaticPool,
+    )
+    instrument_engine(engine.sync_engine)
+    TestingSessionLocal = async_sessionmaker(
+        bind=engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+    async def create_schema():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def override_get_db():
+        async with TestingSessionLocal() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    with TestClient(app) as c:
+        c.portal.call(create_schema)
+        yield c
+        c.portal.call(engine.dispose)
+
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def auth_headers():
+    """Register a user through ``client`` and return its bearer header."""
+
+    def register(client, email: str = "user@example.com") -> dict[str, str]:
+        r = client.post(
+            "/api/v1/auth/register",
+            json={"email": email, "password": "pass12345"},
+        )
+        assert r.status_code == 201, r.text
+        return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+    return register
+
+
+@pytest.fixture()
+def db_session(client):
+    """Session on the test database, closed by the dependency's own teardown."""
+    dependency = app.dependency_overrides[get_db]()
+    yield next(dependency)
+    dependency.close()
+
+
+@pytest.fixture()
+def capture_sql(db_session):
+    """Context manager collecting the SQL statements run on the test engine."""
+    bind = db_session.get_bind()
+
+    @contextmanager
+    def capture():
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(bind, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(bind, "before_cursor_execute", record)
+
+    return capture
+
+
+@pytest.fixture()
+def assert_max_queries(capture_sql):
+    """Fail if the block runs more than ``n`` SQL statements."""
+
+    @contextmanager
+    def check(n: int):
+        with capture_sql() as statements:
+            yield statements
+        assert len(statements) <= n, (
+            f"expected at most {n} queries, ran {len(statements)}:\n"
+            + "\n".join(statements)
+        )
+
+    return check
@@ -0,0 +1,124 @@
+from app.api.v1 import applications_analytics
+
+
+def _create(client, headers, company):
+    r = client.post(
+        "/api/v1/applications",
+        json={"company_name": company, "position": "Engineer"},
+        headers=headers,
+    )
+    assert r.status_code == 201, r.text
+    return r.json()["id"]
+
+
+def test_unchanged_analytics_answer_304(client, monkeypatch, auth_headers):
+    headers = auth_headers(client, "etag@example.com")
+    app_id = _create(client, headers, "ACME")
+
+    calls = []
+    original = applications_analytics.get_applications_summary
+
+    def counting_summary(**kwargs):
+        calls.append(kwargs["user_id"])
+        return original(**kwargs)
+
+    monkeypatch.setattr(
+        applications_analytics,
+        "get_applications_summary",
+        counting_summary,
+    )
+
+    r = client.get("/api/v1/applications/analytics/summary", headers=headers)
+    assert r.status_code == 200, r.text
+    etag = r.headers["ETag"]
+    assert r.headers["Cache-Control"] == "private, no-cache"
+
+    r = client.get(
+        "/api/v1/applications/analytics/summary",
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert r.status_code == 304
+    assert r.headers["ETag"] == etag
+    assert r.content == b""
+
+    r = client.get("/api/v1/applications/analytics/summary", headers=headers)
+    assert r.status_code == 200
+    assert r.headers["ETag"] == etag
+    assert len(calls) == 1
+
+    r = client.get("/api/v1/applications/analytics/funnel", headers=headers)
+    assert r.headers["ETag"] != etag
+
+    r = client.post(
+        f"/api/v1/applications/{app_id}/notes",
+        json={"note": "Called the recruiter"},
+        headers=headers,
+    )
+    assert r.status_code == 201, r.text
+
+    r = client.get(
+        "/api/v1/applications/analytics/summary",
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert r.status_code == 200
+    assert r.headers["ETag"] != etag
+    assert len(calls) == 2
+
+
+def test_writes_invalidate_cached_analytics(client, auth_headers):
+    headers = auth_headers(client, "etag@example.com")
+    app_id = _create(client, headers, "ACME")
+    paths = [
+        "/api/v1/applications/analytics/summary",
+        "/api/v1/applications/analytics/status-duration",
+        "/api/v1/applications/analytics/dashboard",
+    ]
+    etags = {
+        path: client.get(path, headers=headers).headers["ETag"]
+        for path in paths
+    }
+
+    r = client.patch(
+        f"/api/v1/applications/{app_id}",
+        json={"status": "screening"},
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+
+    for path in paths:
+        r = client.get(
+            path,
+            headers={**headers, "If-None-Match": etags[path]},
+        )
+        assert r.status_code == 200, path
+        etags[path] = r.headers["ETag"]
+
+    r = client.get(paths[0], headers=headers)
+    by_status = {item["status"]: item["count"] for item in r.json()["by_status"]}
+    assert by_status["screening"] == 1
+
+    _create(client, headers, "Globex")
+    r = client.get(paths[0], headers={**headers, "If-None-Match": etags[paths[0]]})
+    assert r.status_code == 200
+    assert r.json()["total"] == 2
+
+    r = client.delete(f"/api/v1/applications/{app_id}", headers=headers)
+    assert r.status_code == 204
+    r = client.get(paths[0], headers=headers)
+    assert r.json()["total"] == 1
+
+
+def test_dashboard_etag_depends_on_sections(client, auth_headers):
+    headers = auth_headers(client, "etag@example.com")
+    url = "/api/v1/applications/analytics/dashboard"
+
+    full = client.get(url, headers=headers)
+    partial = client.get(url, params={"sections": "summary"}, headers=headers)
+    assert full.headers["ETag"] != partial.headers["ETag"]
+
+    r = client.get(
+        url,
+        params={"sections": "summary"},
+        headers={**headers, "If-None-Match": f'W/{partial.headers["ETag"]}'},
+    )
+    assert r.status_code == 304
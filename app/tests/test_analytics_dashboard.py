@@ -0,0 +1,67 @@
+def test_dashboard_matches_individual_endpoints(client, auth_headers):
+    headers = auth_headers(client, "dashboard@example.com")
+
+    for company, recruiter in [
+        ("ACME", "Jane@Acme.io"),
+        ("Globex", " jane@acme.io"),
+        ("Initech", "bob@initech.io"),
+    ]:
+        r = client.post(
+            "/api/v1/applications",
+            json={
+                "company_name": company,
+                "position": "Engineer",
+                "recruiter_email": recruiter,
+            },
+            headers=headers,
+        )
+        assert r.status_code == 201, r.text
+        app_id = r.json()["id"]
+
+    r = client.patch(
+        f"/api/v1/applications/{app_id}",
+        json={"status": "screening"},
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+
+    r = client.get("/api/v1/applications/analytics/dashboard", headers=headers)
+    assert r.status_code == 200, r.text
+    dashboard = r.json()
+
+    for section, path in [
+        ("summary", "/api/v1/applications/analytics/summary"),
+        ("funnel", "/api/v1/applications/analytics/funnel"),
+        ("time_to_status", "/api/v1/applications/analytics/time-to-status"),
+        ("status_duration", "/api/v1/applications/analytics/status-duration"),
+        (
+            "recruiter_performance",
+            "/api/v1/applications/analytics/recruiter-performance",
+        ),
+        (
+            "recruiter_performance_v2",
+            "/api/v1/applications/analytics/recruiter-performance-v2",
+        ),
+    ]:
+        r = client.get(path, headers=headers)
+        assert r.status_code == 200, r.text
+        assert dashboard[section] == r.json(), section
+
+
+def test_dashboard_returns_only_requested_sections(client, auth_headers):
+    headers = auth_headers(client, "sections@example.com")
+
+    r = client.get(
+        "/api/v1/applications/analytics/dashboard",
+        params=[("sections", "summary"), ("sections", "funnel")],
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    assert set(r.json()) == {"summary", "funnel"}
+
+    r = client.get(
+        "/api/v1/applications/analytics/dashboard",
+        params={"sections": "unknown"},
+        headers=headers,
+    )
+    assert r.status_code == 422
@@ -0,0 +1,121 @@
+from sqlalchemy import event, select
+
+from app.core.config import settings
+from app.models.user import User
+from app.services.application_service import (
+    count_user_applications,
+    invalidate_application_counts,
+)
+
+
+def _create(client, headers, company, position):
+    r = client.post(
+        "/api/v1/applications",
+        json={"company_name": company, "position": position},
+        headers=headers,
+    )
+    assert r.status_code == 201, r.text
+    return r.json()["id"]
+
+
+def test_cached_total_is_invalidated_by_writes(client, auth_headers):
+    headers = auth_headers(client, "counts@example.com")
+    app_id = _create(client, headers, "ACME", "Backend")
+
+    r = client.get("/api/v1/applications?status=applied", headers=headers)
+    assert r.json()["total"] == 1
+
+    _create(client, headers, "Globex", "Frontend")
+    r = client.get("/api/v1/applications?status=applied", headers=headers)
+    assert r.json()["total"] == 2
+
+    r = client.patch(
+        f"/api/v1/applications/{app_id}",
+        json={"status": "screening"},
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    r = client.get("/api/v1/applications?status=applied", headers=headers)
+    assert r.json()["total"] == 1
+
+    r = client.delete(f"/api/v1/applications/{app_id}", headers=headers)
+    assert r.status_code == 204, r.text
+    r = client.get("/api/v1/applications", headers=headers)
+    assert r.json()["total"] == 1
+
+
+def test_total_can_be_skipped(client, auth_headers):
+    headers = auth_headers(client, "counts@example.com")
+    _create(client, headers, "ACME", "Backend")
+
+    r = client.get("/api/v1/applications?include_total=false", headers=headers)
+    assert r.status_code == 200, r.text
+    assert r.json()["total"] is None
+    assert len(r.json()["items"]) == 1
+
+
+def test_estimated_total_for_search(client, monkeypatch, auth_headers):
+    headers = auth_headers(client, "counts@example.com")
+    for i in range(4):
+        _create(client, headers, "ACME", f"Engineer {i}")
+    _create(client, headers, "Globex", "Manager")
+
+    r = client.get(
+        "/api/v1/applications?q=engineer&estimate_total=true",
+        headers=headers,
+    )
+    assert r.json()["total"] == 4
+    assert "X-Total-Estimated" not in r.headers
+
+    monkeypatch.setattr(settings, "count_estimate_sample_size", 2)
+    r = client.get(
+        "/api/v1/applications?q=engineer&estimate_total=true",
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    assert r.headers["X-Total-Estimated"] == "true"
+    assert r.json()["total"] == 5
+
+
+def test_estimate_samples_across_the_whole_id_range(client, monkeypatch, auth_headers):
+    headers = auth_headers(client, "counts@example.com")
+    for i in range(4):
+        _create(client, headers, "Globex", f"Manager {i}")
+    for i in range(4):
+        _create(client, headers, "ACME", f"Engineer {i}")
+
+    monkeypatch.setattr(settings, "count_estimate_sample_size", 4)
+    r = client.get(
+        "/api/v1/applications?q=engineer&estimate_total=true",
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    assert r.headers["X-Total-Estimated"] == "true"
+    assert r.json()["total"] == 4
+
+
+def test_count_finished_after_a_write_is_not_cached(
+    client, db_session, capture_sql, auth_headers
+):
+    headers = auth_headers(client, "counts@example.com")
+    _create(client, headers, "ACME", "Backend")
+    user_id = db_session.scalar(select(User.id))
+
+    def write_during_count(conn, cursor, statement, parameters, context, executemany):
+        if "count(" in statement.lower():
+            invalidate_application_counts(user_id)
+
+    bind = db_session.get_bind()
+    event.listen(bind, "after_cursor_execute", write_during_count)
+    try:
+        assert count_user_applications(db=db_session, user_id=user_id) == (1, False)
+    finally:
+        event.remove(bind, "after_cursor_execute", write_during_count)
+
+    with capture_sql() as statements:
+        assert count_user_applications(db=db_session, user_id=user_id) == (1, False)
+    assert len(statements) == 1
+
+    with capture_sql() as statements:
+        assert count_user_applications(db=db_session, user_id=user_id) == (1, False)
+    assert statements == []
@@ -0,0 +1,85 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from app.services import application_export_service
+
+
+def _seed(client, auth_headers):
+    headers = auth_headers(client, "export@example.com")
+    ids = []
+    for company in ["ACME", "Globex", "Initech"]:
+        r = client.post(
+            "/api/v1/applications",
+            json={"company_name": company, "position": "Engineer"},
+            headers=headers,
+        )
+        assert r.status_code == 201, r.text
+        ids.append(r.json()["id"])
+
+    r = client.patch(
+        f"/api/v1/applications/{ids[0]}",
+        json={"status": "screening"},
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    r = client.post(
+        f"/api/v1/applications/{ids[0]}/notes",
+        json={"note": 'Said "yes",\nfollow up'},
+        headers=headers,
+    )
+    assert r.status_code == 201, r.text
+    return headers, ids
+
+
+@pytest.mark.parametrize("fixture_name", ["client", "async_client"])
+def test_ndjson_export_nests_events(request, monkeypatch, fixture_name, auth_headers):
+    monkeypatch.setattr(application_export_service, "EXPORT_YIELD_PER", 2)
+    client = request.getfixturevalue(fixture_name)
+    headers, ids = _seed(client, auth_headers)
+
+    r = client.get("/api/v1/applications/export", headers=headers)
+    assert r.status_code == 200, r.text
+    assert r.headers["content-type"] == "application/x-ndjson"
+    records = [json.loads(line) for line in r.text.splitlines()]
+
+    assert [record["id"] for record in records] == ids
+    assert [event["event_type"] for event in records[0]["events"]] == [
+        "status_change",
+        "note",
+    ]
+    assert records[0]["events"][1]["note"] == 'Said "yes",\nfollow up'
+    assert records[0]["status"] == "screening"
+    assert records[1]["events"] == []
+
+
+def test_gzipped_csv_export(client, auth_headers):
+    headers, ids = _seed(client, auth_headers)
+
+    with client.stream(
+        "GET",
+        "/api/v1/applications/export",
+        params={"format": "csv", "gzip": "true"},
+        headers=headers,
+    ) as r:
+        assert r.status_code == 200
+        assert r.headers["content-encoding"] == "gzip"
+        assert "applications.csv" in r.headers["content-disposition"]
+        body = gzip.decompress(b"".join(r.iter_raw())).decode()
+
+    rows = list(csv.DictReader(io.StringIO(body)))
+    assert [int(row["id"]) for row in rows] == [ids[0], ids[0], ids[1], ids[2]]
+    assert rows[1]["event_note"] == 'Said "yes",\nfollow up'
+    assert rows[2]["event_id"] == ""
+
+
+def test_export_is_scoped_to_the_user(client, auth_headers):
+    _seed(client, auth_headers)
+    headers = auth_headers(client, "other@example.com")
+
+    r = client.get("/api/v1/applications/export", headers=headers)
+    assert r.status_code == 200
+    assert r.text == ""
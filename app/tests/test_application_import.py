@@ -0,0 +1,162 @@
+import asyncio
+import json
+
+from app.core.config import settings
+from app.services.application_import_service import iter_lines
+
+
+def test_csv_import_reports_conflicts_and_invalid_rows(client, monkeypatch, auth_headers):
+    monkeypatch.setattr(settings, "import_batch_size", 2)
+    headers = auth_headers(client, "import@example.com")
+    r = client.post(
+        "/api/v1/applications",
+        json={"company_name": "ACME", "position": "Engineer"},
+        headers=headers,
+    )
+    assert r.status_code == 201, r.text
+
+    body = (
+        "company_name,position,status,location\n"
+        "ACME,Engineer,applied,\n"
+        'Globex,"Platform\nEngineer",screening,"Berlin, DE"\n'
+        "Initech,Analyst,unknown,\n"
+        "Umbrella,Chemist,applied,Raccoon City\n"
+        "Umbrella,Chemist,applied,Raccoon City\n"
+        ",Missing company,applied,\n"
+        "Hooli,Engineer\n"
+    )
+    r = client.post(
+        "/api/v1/applications/import",
+        content=body.encode(),
+        headers={**headers, "Content-Type": "text/csv"},
+    )
+    assert r.status_code == 200, r.text
+    result = r.json()
+    assert result["inserted"] == 2
+    assert result["conflicts"] == 2
+    assert result["invalid"] == 3
+    assert {(e["line"], e["reason"]) for e in result["errors"]} == {
+        (2, "conflict"),
+        (5, "invalid"),
+        (7, "conflict"),
+        (8, "invalid"),
+        (9, "invalid"),
+    }
+
+    r = client.get(
+        "/api/v1/applications",
+        params={"company": "Globex"},
+        headers=headers,
+    )
+    item = r.json()["items"][0]
+    assert item["position"] == "Platform\nEngineer"
+    assert item["location"] == "Berlin, DE"
+
+    r = client.get("/api/v1/applications/analytics/summary", headers=headers)
+    by_status = {item["status"]: item["count"] for item in r.json()["by_status"]}
+    assert r.json()["total"] == 3
+    assert by_status["applied"] == 2
+    assert by_status["screening"] == 1
+
+    r = client.get("/api/v1/applications", headers=headers)
+    assert r.json()["total"] == 3
+
+
+def test_csv_stray_quote_in_unquoted_field_stays_on_its_line(
+    client,
+    monkeypatch,
+    auth_headers,
+):
+    monkeypatch.setattr(settings, "import_max_record_chars", 40)
+    headers = auth_headers(client, "import@example.com")
+    body = (
+        "company_name,position\n"
+        'ACME,27" monitor QA\n'
+        "Globex,Engineer\n"
+        '"Initech,' + "x" * 30 + "\n" + "y" * 30 + "\n"
+        "Hooli,Engineer\n"
+    )
+    r = client.post(
+        "/api/v1/applications/import",
+        content=body.encode(),
+        headers={**headers, "Content-Type": "text/csv"},
+    )
+    assert r.status_code == 200, r.text
+    result = r.json()
+    assert result["inserted"] == 3
+    assert result["errors"] == [
+        {"line": 4, "reason": "invalid", "detail": "Record exceeds 40 characters"},
+    ]
+
+    r = client.get(
+        "/api/v1/applications",
+        params={"company": "ACME"},
+        headers=headers,
+    )
+    assert r.json()["items"][0]["position"] == '27" monitor QA'
+
+
+def test_jsonl_import(client, auth_headers):
+    headers = auth_headers(client, "import@example.com")
+    lines = [
+        json.dumps({"company_name": f"Company {i}", "position": "Engineer"})
+        for i in range(25)
+    ]
+    lines.insert(3, "{not json")
+    lines.insert(5, "[]")
+
+    r = client.post(
+        "/api/v1/applications/import?format=jsonl",
+        content="\n".join(lines).encode(),
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    result = r.json()
+    assert result["inserted"] == 25
+    assert result["invalid"] == 2
+    assert [e["line"] for e in result["errors"]] == [4, 6]
+
+
+def test_overlong_lines_are_reported_and_skipped(client, monkeypatch, auth_headers):
+    monkeypatch.setattr(settings, "import_max_record_chars", 80)
+    headers = auth_headers(client, "import@example.com")
+    lines = [
+        json.dumps({"company_name": "ACME", "position": "Engineer"}),
+        json.dumps({"company_name": "x" * 200, "position": "Engineer"}),
+        json.dumps({"company_name": "Globex", "position": "Engineer"}),
+    ]
+
+    r = client.post(
+        "/api/v1/applications/import?format=jsonl",
+        content=iter(chunk.encode() for chunk in "\n".join(lines)),
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    assert r.json()["inserted"] == 2
+    assert r.json()["errors"] == [
+        {"line": 2, "reason": "invalid", "detail": "Line exceeds 80 characters"},
+    ]
+
+
+def test_iter_lines_bounds_a_line_without_newlines():
+    async def chunks():
+        yield b"a,b\n"
+        for _ in range(1_000):
+            yield b"x" * 100
+        yield b"\nc,d"
+
+    async def collect():
+        return [line async for line in iter_lines(chunks(), max_chars=10)]
+
+    assert asyncio.run(collect()) == ["a,b\n", None, "c,d"]
+
+
+def test_import_requires_known_format(client, auth_headers):
+    headers = auth_headers(client, "import@example.com")
+
+    r = client.post(
+        "/api/v1/applications/import",
+        content=b"company_name,position\n",
+        headers={**headers, "Content-Type": "application/octet-stream"},
+    )
+    assert r.status_code == 415
@@ -0,0 +1,62 @@
+from sqlalchemy.dialects import sqlite
+
+from app.services.application_search_service import search_condition
+
+
+def _create(client, headers, **payload):
+    r = client.post("/api/v1/applications", json=payload, headers=headers)
+    assert r.status_code == 201, r.text
+    return r.json()["id"]
+
+
+def _ids(client, headers, **params):
+    r = client.get("/api/v1/applications", params=params, headers=headers)
+    assert r.status_code == 200, r.text
+    return [item["id"] for item in r.json()["items"]]
+
+
+def test_search_uses_fts_index_and_tracks_updates(client, auth_headers):
+    headers = auth_headers(client, "search@example.com")
+    acme = _create(
+        client,
+        headers,
+        company_name="Acme Corp",
+        position="Acme Platform Engineer",
+    )
+    globex = _create(
+        client,
+        headers,
+        company_name="Globex",
+        position="Backend Engineer",
+        recruiter_email="jane@acme.io",
+    )
+    _create(client, headers, company_name="Initech", position="QA")
+
+    assert sorted(_ids(client, headers, q="ACME")) == [acme, globex]
+    assert _ids(client, headers, q="qa") != []
+    assert _ids(client, headers, company="acme") == [acme]
+    assert _ids(client, headers, q="acme", sort="relevance")[0] == acme
+
+    r = client.patch(
+        f"/api/v1/applications/{globex}",
+        json={"recruiter_email": "jane@globex.io"},
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    assert _ids(client, headers, q="acme") == [acme]
+
+    r = client.delete(f"/api/v1/applications/{acme}", headers=headers)
+    assert r.status_code == 204, r.text
+    assert _ids(client, headers, q="acme") == []
+
+
+def test_search_condition_picks_backend_by_term_length():
+    dialect = sqlite.dialect()
+    dialect.server_version_info = (3, 40, 0)
+
+    long_term = str(search_condition(dialect=dialect, term="engineer"))
+    short_term = str(search_condition(dialect=dialect, term="qa"))
+
+    assert "applications_fts MATCH" in long_term
+    assert "applications_fts" not in short_term
+    assert "lower" in short_term or "LIKE" in short_term.upper()
@@ -0,0 +1,64 @@
+def test_async_session_crud_and_analytics(async_client):
+    client = async_client
+
+    r = client.post(
+        "/api/v1/auth/register",
+        json={"email": "async@example.com", "password": "pass12345"},
+    )
+    assert r.status_code == 201, r.text
+    headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+    r = client.post(
+        "/api/v1/applications",
+        json={"company_name": "ACME", "position": "Backend Engineer"},
+        headers=headers,
+    )
+    assert r.status_code == 201, r.text
+    app_id = r.json()["id"]
+
+    r = client.post(
+        "/api/v1/applications",
+        json={"company_name": "ACME", "position": "Backend Engineer"},
+        headers=headers,
+    )
+    assert r.status_code == 409, r.text
+
+    r = client.patch(
+        f"/api/v1/applications/{app_id}",
+        json={"status": "offer"},
+        headers=headers,
+    )
+    assert r.status_code == 422, r.text
+
+    r = client.patch(
+        f"/api/v1/applications/{app_id}",
+        json={"status": "screening"},
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    assert r.json()["status"] == "screening"
+
+    r = client.post(
+        f"/api/v1/applications/{app_id}/notes",
+        json={"note": "Called back"},
+        headers=headers,
+    )
+    assert r.status_code == 201, r.text
+
+    r = client.get(f"/api/v1/applications/{app_id}/timeline", headers=headers)
+    assert r.status_code == 200, r.text
+    assert [item["event_type"] for item in r.json()] == [
+        "note",
+        "status_change",
+    ]
+
+    r = client.get("/api/v1/applications/analytics/summary", headers=headers)
+    assert r.status_code == 200, r.text
+    assert r.json()["total"] == 1
+
+    r = client.delete(f"/api/v1/applications/{app_id}", headers=headers)
+    assert r.status_code == 204, r.text
+
+    r = client.get("/api/v1/applications", headers=headers)
+    assert r.status_code == 200, r.text
+    assert r.json()["total"] == 0
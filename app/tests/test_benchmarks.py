@@ -0,0 +1,96 @@
+import argparse
+import json
+
+import pytest
+from sqlalchemy import create_engine, select, text
+
+from app.models.application import Application
+from app.models.application_event import ApplicationEvent
+from benchmarks.bench_api import compare, percentile_summary
+from benchmarks.datagen import Scale, _rows, seed_database
+
+
+def _results(p95_ms: float, throughput_rps: float) -> dict:
+    return {
+        "results": {
+            "2x10x3": {
+                "GET /api/v1/applications": {
+                    "p95_ms": p95_ms,
+                    "throughput_rps": throughput_rps,
+                }
+            }
+        }
+    }
+
+
+def _compare(tmp_path, baseline: dict, current: dict) -> None:
+    (tmp_path / "baseline.json").write_text(json.dumps(baseline))
+    (tmp_path / "current.json").write_text(json.dumps(current))
+    compare(
+        argparse.Namespace(
+            baseline=tmp_path / "baseline.json",
+            current=tmp_path / "current.json",
+            threshold=0.2,
+            min_delta_ms=1.0,
+        )
+    )
+
+
+def test_percentile_summary():
+    summary = percentile_summary([ms / 1000 for ms in range(1, 101)])
+    assert summary == {
+        "requests": 100,
+        "mean_ms": 50.5,
+        "p50_ms": 50.5,
+        "p95_ms": 95.05,
+        "p99_ms": 99.01,
+    }
+
+    single = percentile_summary([0.002])
+    assert single["p50_ms"] == single["p95_ms"] == single["p99_ms"] == 2.0
+
+
+def test_compare_exits_non_zero_on_a_regression(tmp_path, capsys):
+    with pytest.raises(SystemExit) as exc:
+        _compare(tmp_path, _results(10.0, 100.0), _results(15.0, 100.0))
+    assert exc.value.code == "1 regression(s) over 20%"
+    assert "REGRESSION" in capsys.readouterr().out
+
+    with pytest.raises(SystemExit):
+        _compare(tmp_path, _results(10.0, 100.0), _results(10.0, 70.0))
+
+
+def test_compare_ignores_p95_changes_below_the_minimum_delta(tmp_path, capsys):
+    _compare(tmp_path, _results(0.2, 100.0), _results(0.8, 100.0))
+    _compare(tmp_path, _results(10.0, 100.0), _results(11.0, 90.0))
+    assert "REGRESSION" not in capsys.readouterr().out
+
+
+def test_datagen_is_deterministic_per_seed(tmp_path):
+    scale = Scale.parse("2x10x3")
+    applications, events = _rows(scale, seed=7)
+    again_applications, again_events = _rows(scale, seed=7)
+    assert list(applications) == list(again_applications)
+    assert list(events) == list(again_events)
+
+    other_applications, _ = _rows(scale, seed=8)
+    assert list(_rows(scale, seed=7)[0]) != list(other_applications)
+
+    seeded = []
+    for name in ["a", "b"]:
+        engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+        seed_database(engine, scale, seed=7)
+        with engine.connect() as conn:
+            seeded.append(
+                (
+                    conn.execute(select(Application.__table__)).all(),
+                    conn.execute(select(ApplicationEvent.__table__)).all(),
+                    conn.scalar(text("SELECT count(*) FROM applications_fts")),
+                )
+            )
+        engine.dispose()
+
+    assert seeded[0] == seeded[1]
+    assert len(seeded[0][0]) == 20
+    assert len(seeded[0][1]) == 60
+    assert seeded[0][2] == 20
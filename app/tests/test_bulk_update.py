@@ -0,0 +1,175 @@
+from app.core.config import settings
+
+
+def _create(client, headers, company, status="applied"):
+    r = client.post(
+        "/api/v1/applications",
+        json={"company_name": company, "position": "Engineer", "status": status},
+        headers=headers,
+    )
+    assert r.status_code == 201, r.text
+    return r.json()["id"]
+
+
+def test_bulk_update_by_ids_reports_each_id(client, auth_headers):
+    headers = auth_headers(client, "bulk@example.com")
+    applied = _create(client, headers, "ACME")
+    screening = _create(client, headers, "Globex", status="screening")
+    already = _create(client, headers, "Initech", status="interview")
+
+    r = client.patch(
+        "/api/v1/applications",
+        json={
+            "ids": [applied, screening, already, 999999],
+            "update": {"status": "interview", "location": "Remote"},
+        },
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    assert r.json() == {
+        "updated": 2,
+        "results": [
+            {"id": applied, "result": "invalid_transition"},
+            {"id": screening, "result": "updated"},
+            {"id": already, "result": "updated"},
+            {"id": 999999, "result": "not_found"},
+        ],
+    }
+
+    r = client.get(f"/api/v1/applications/{screening}", headers=headers)
+    assert r.json()["status"] == "interview"
+    assert r.json()["location"] == "Remote"
+    assert r.json()["version"] == 2
+
+    r = client.get(f"/api/v1/applications/{screening}/timeline", headers=headers)
+    assert [(e["event_type"], e["from_status"]) for e in r.json()] == [
+        ("status_change", "screening"),
+    ]
+    r = client.get(f"/api/v1/applications/{already}/timeline", headers=headers)
+    assert r.json() == []
+
+    r = client.get("/api/v1/applications/analytics/summary", headers=headers)
+    by_status = {item["status"]: item["count"] for item in r.json()["by_status"]}
+    assert by_status == {
+        "applied": 1,
+        "screening": 0,
+        "interview": 2,
+        "offer": 0,
+        "accepted": 0,
+        "rejected": 0,
+    }
+
+
+def test_bulk_reject_by_filter_uses_one_update_and_one_event_insert(
+    client,
+    capture_sql,
+    auth_headers,
+):
+    headers = auth_headers(client, "bulk@example.com")
+    ids = [_create(client, headers, f"Company {i}") for i in range(5)]
+    _create(client, headers, "Keeper", status="screening")
+
+    with capture_sql() as captured:
+        r = client.patch(
+            "/api/v1/applications",
+            json={"filter": {"status": "applied"}, "update": {"status": "rejected"}},
+            headers=headers,
+        )
+    statements = [" ".join(statement.split()[:3]) for statement in captured]
+
+    assert r.status_code == 200, r.text
+    assert r.json()["updated"] == 5
+    assert [item["id"] for item in r.json()["results"]] == ids
+    assert statements.count("UPDATE applications SET") == 1
+    assert statements.count("INSERT INTO application_events") == 1
+    assert len(statements) == 5
+
+    r = client.get(
+        "/api/v1/applications",
+        params={"status": "rejected"},
+        headers=headers,
+    )
+    assert r.json()["total"] == 5
+
+
+def test_bulk_update_requires_exactly_one_target(client, auth_headers):
+    headers = auth_headers(client, "bulk@example.com")
+
+    r = client.patch(
+        "/api/v1/applications",
+        json={"update": {"status": "rejected"}},
+        headers=headers,
+    )
+    assert r.status_code == 422
+
+    r = client.patch(
+        "/api/v1/applications",
+        json={"ids": [1], "filter": {}, "update": {"status": "rejected"}},
+        headers=headers,
+    )
+    assert r.status_code == 422
+
+
+def test_bulk_update_limits_targets_to_the_configured_maximum(
+    client,
+    monkeypatch,
+    auth_headers,
+):
+    monkeypatch.setattr(settings, "bulk_update_max_items", 2)
+    headers = auth_headers(client, "bulk@example.com")
+    for i in range(3):
+        _create(client, headers, f"Company {i}")
+
+    r = client.patch(
+        "/api/v1/applications",
+        json={"ids": [1, 2, 3], "update": {"status": "rejected"}},
+        headers=headers,
+    )
+    assert r.status_code == 422
+    assert r.json()["detail"] == "Bulk update targets more than 2 applications"
+
+    r = client.patch(
+        "/api/v1/applications",
+        json={"filter": {}, "update": {"status": "rejected"}},
+        headers=headers,
+    )
+    assert r.status_code == 422
+    assert r.json()["detail"] == "Bulk update matches more than 2 applications"
+
+
+def test_bulk_update_rejects_null_status(client, auth_headers):
+    headers = auth_headers(client, "bulk@example.com")
+    app_id = _create(client, headers, "ACME")
+
+    r = client.patch(
+        "/api/v1/applications",
+        json={"ids": [app_id], "update": {"status": None}},
+        headers=headers,
+    )
+    assert r.status_code == 422
+    assert r.json()["detail"] == "Invalid status transition"
+
+
+def test_resending_the_same_follow_up_leaves_rows_unchanged(client, auth_headers):
+    headers = auth_headers(client, "bulk@example.com")
+    app_id = _create(client, headers, "ACME")
+
+    results = []
+    for follow_up_at in (
+        "2030-01-01T00:00:00Z",
+        "2030-01-01T00:00:00Z",
+        "2030-01-01T02:00:00+02:00",
+    ):
+        r = client.patch(
+            "/api/v1/applications",
+            json={"ids": [app_id], "update": {"follow_up_at": follow_up_at}},
+            headers=headers,
+        )
+        assert r.status_code == 200, r.text
+        results.append(r.json()["results"][0]["result"])
+
+    assert results == ["updated", "unchanged", "unchanged"]
+    r = client.get(f"/api/v1/applications/{app_id}", headers=headers)
+    assert r.json()["version"] == 2
+    r = client.get(f"/api/v1/applications/{app_id}/timeline", headers=headers)
+    assert [e["event_type"] for e in r.json()] == ["follow_up"]
@@ -0,0 +1,84 @@
+def _create(client, headers):
+    r = client.post(
+        "/api/v1/applications",
+        json={"company_name": "ACME", "position": "Engineer"},
+        headers=headers,
+    )
+    assert r.status_code == 201, r.text
+    return r.json()
+
+
+def test_application_detail_revalidates_on_row_version(client, capture_sql, auth_headers):
+    headers = auth_headers(client, "conditional@example.com")
+    created = _create(client, headers)
+    assert created["version"] == 1
+    url = f"/api/v1/applications/{created['id']}"
+
+    r = client.get(url, headers=headers)
+    assert r.status_code == 200
+    etag = r.headers["ETag"]
+    assert r.headers["Last-Modified"].endswith("GMT")
+
+    with capture_sql() as captured:
+        r = client.get(url, headers={**headers, "If-None-Match": etag})
+    statements = [
+        statement
+        for statement in captured
+        if statement.lstrip().upper().startswith("SELECT")
+    ]
+    assert r.status_code == 304
+    assert r.headers["ETag"] == etag
+    assert len(statements) == 1
+    assert "company_name" not in statements[0]
+
+    r = client.patch(url, json={"location": "Berlin"}, headers=headers)
+    assert r.status_code == 200, r.text
+    assert r.json()["version"] == 2
+    assert r.headers["ETag"] != etag
+    new_etag = r.headers["ETag"]
+
+    r = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.json()["location"] == "Berlin"
+    assert r.headers["ETag"] == new_etag
+
+    r = client.patch(url, json={"location": "Berlin"}, headers=headers)
+    assert r.json()["version"] == 2
+
+    r = client.get(
+        "/api/v1/applications/999999",
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert r.status_code == 404
+
+
+def test_timeline_revalidates_on_latest_event(client, auth_headers):
+    headers = auth_headers(client, "conditional@example.com")
+    app_id = _create(client, headers)["id"]
+    url = f"/api/v1/applications/{app_id}/timeline"
+
+    r = client.get(url, headers=headers)
+    assert r.status_code == 200
+    assert r.json() == []
+    etag = r.headers["ETag"]
+
+    r = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert r.status_code == 304
+
+    r = client.post(
+        f"/api/v1/applications/{app_id}/notes",
+        json={"note": "Sent portfolio"},
+        headers=headers,
+    )
+    assert r.status_code == 201, r.text
+
+    r = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert r.status_code == 200
+    assert len(r.json()) == 1
+    assert r.headers["ETag"] != etag
+
+    r = client.get(
+        "/api/v1/applications/999999/timeline",
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert r.status_code == 404
@@ -0,0 +1,77 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+
+def _seed(client, headers):
+    base = datetime.now(UTC)
+    for i, company in enumerate(["Zeta", "Acme", "Beta", "Acme", "Gamma"]):
+        payload = {"company_name": company, "position": f"Engineer {i}"}
+        if i % 2 == 0:
+            payload["follow_up_at"] = (base + timedelta(days=i)).isoformat()
+        r = client.post("/api/v1/applications", json=payload, headers=headers)
+        assert r.status_code == 201, r.text
+
+
+def _walk(client, headers, sort):
+    ids = []
+    cursor = None
+    while True:
+        params = {"pagination": "cursor", "sort": sort, "page_size": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        r = client.get("/api/v1/applications", params=params, headers=headers)
+        assert r.status_code == 200, r.text
+        data = r.json()
+        assert sorted(data.keys()) == ["items", "next_cursor", "page_size"]
+        ids.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.parametrize(
+    "sort",
+    ["-created_at", "created_at", "company_name", "-follow_up_at", "id"],
+)
+def test_cursor_pages_match_offset_order(client, sort, auth_headers):
+    headers = auth_headers(client, "cursor@example.com")
+    _seed(client, headers)
+
+    r = client.get(
+        "/api/v1/applications",
+        params={"sort": sort, "page_size": 100},
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    expected = [item["id"] for item in r.json()["items"]]
+
+    assert len(expected) == 5
+    assert _walk(client, headers, sort) == expected
+
+
+def test_cursor_rejects_tampered_or_mismatched_cursor(client, auth_headers):
+    headers = auth_headers(client, "cursor@example.com")
+    _seed(client, headers)
+
+    r = client.get(
+        "/api/v1/applications",
+        params={"pagination": "cursor", "page_size": 2},
+        headers=headers,
+    )
+    cursor = r.json()["next_cursor"]
+    assert cursor is not None
+
+    r = client.get(
+        "/api/v1/applications",
+        params={"cursor": cursor, "sort": "company_name"},
+        headers=headers,
+    )
+    assert r.status_code == 400, r.text
+
+    r = client.get(
+        "/api/v1/applications",
+        params={"cursor": "not-a-cursor"},
+        headers=headers,
+    )
+    assert r.status_code == 400, r.text
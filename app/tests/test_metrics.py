@@ -0,0 +1,104 @@
+import re
+import threading
+
+from app.core.metrics import Histogram, request_latency
+
+
+def _sample(text, name, **labels):
+    label_text = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    pattern = re.escape(f"{name}{{{label_text}}}" if labels else name)
+    match = re.search(rf"^{pattern} (\S+)$", text, re.MULTILINE)
+    return float(match.group(1)) if match else None
+
+
+def test_histogram_merges_thread_shards():
+    histogram = Histogram(
+        "test_seconds",
+        "Test.",
+        labelnames=("kind",),
+        buckets=(0.1, 1.0),
+    )
+
+    def observe(value):
+        for _ in range(100):
+            histogram.observe(value, ("a",))
+
+    threads = [
+        threading.Thread(target=observe, args=(value,))
+        for value in (0.05, 0.5, 5.0)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    text = "\n".join(histogram.render())
+    assert _sample(text, "test_seconds_bucket", kind="a", le="0.1") == 100
+    assert _sample(text, "test_seconds_bucket", kind="a", le="1.0") == 200
+    assert _sample(text, "test_seconds_bucket", kind="a", le="+Inf") == 300
+    assert _sample(text, "test_seconds_count", kind="a") == 300
+    assert _sample(text, "test_seconds_sum", kind="a") == 555.0
+
+
+def test_metrics_endpoint_reports_latency_by_route_template(client, auth_headers):
+    request_latency.clear()
+    headers = auth_headers(client, "metrics@example.com")
+    for app_id in (1, 2, 3):
+        client.get(f"/api/v1/applications/{app_id}", headers=headers)
+    client.get("/no/such/path")
+
+    r = client.get("/metrics")
+
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = r.text
+    assert "# TYPE http_request_duration_seconds histogram" in text
+    assert (
+        _sample(
+            text,
+            "http_request_duration_seconds_count",
+            method="GET",
+            route="/api/v1/applications/{app_id}",
+            status="404",
+        )
+        == 3
+    )
+    assert (
+        _sample(
+            text,
+            "http_request_duration_seconds_bucket",
+            method="POST",
+            route="/api/v1/auth/register",
+            status="201",
+            le="+Inf",
+        )
+        == 1
+    )
+    assert (
+        _sample(
+            text,
+            "http_request_duration_seconds_count",
+            method="GET",
+            route="unmatched",
+            status="404",
+        )
+        == 1
+    )
+    assert _sample(text, "http_requests_in_flight") == 1
+    assert _sample(text, "rate_limit_rejections_total") == 0
+    assert _sample(text, "password_hash_pending") == 0
+    assert "# TYPE db_pool_wait_seconds histogram" in text
+
+
+def test_rate_limit_rejections_are_counted(client):
+    for _ in range(25):
+        r = client.post(
+            "/api/v1/auth/login",
+            data={"username": "nobody@example.com", "password": "wrong"},
+        )
+        if r.status_code == 429:
+            break
+    assert r.status_code == 429
+
+    text = client.get("/metrics").text
+    assert _sample(text, "rate_limit_rejections_total") >= 1
@@ -0,0 +1,44 @@
+from sqlalchemy import select
+
+from app.core.security import password_hasher, pwd_context
+from app.models.user import User
+
+
+def _stored_hash(db, email):
+    return db.scalar(select(User.hashed_password).where(User.email == email))
+
+
+def test_login_rehashes_when_cost_changes(client, db_session):
+    r = client.post(
+        "/api/v1/auth/register",
+        json={"email": "rehash@example.com", "password": "pass12345"},
+    )
+    assert r.status_code == 201, r.text
+    original = _stored_hash(db_session, "rehash@example.com")
+    rounds = pwd_context.to_dict()["bcrypt__rounds"]
+
+    pwd_context.update(bcrypt__rounds=4)
+    try:
+        form = {"username": "rehash@example.com", "password": "pass12345"}
+        r = client.post("/api/v1/auth/login", data=form)
+        assert r.status_code == 200, r.text
+        rehashed = _stored_hash(db_session, "rehash@example.com")
+        assert rehashed != original
+        assert rehashed.startswith("$2b$04$")
+
+        r = client.post("/api/v1/auth/login", data=form)
+        assert r.status_code == 200, r.text
+        assert _stored_hash(db_session, "rehash@example.com") == rehashed
+    finally:
+        pwd_context.update(bcrypt__rounds=rounds)
+
+
+def test_saturated_hasher_returns_503(client, monkeypatch):
+    monkeypatch.setattr(password_hasher, "max_pending", 0)
+
+    r = client.post(
+        "/api/v1/auth/register",
+        json={"email": "busy@example.com", "password": "pass12345"},
+    )
+    assert r.status_code == 503, r.text
+    assert r.headers["Retry-After"] == "1"
@@ -0,0 +1,58 @@
+from sqlalchemy import select, text
+
+from app.core.config import settings
+from app.models.user import User
+from app.services.user_service import get_cached_principal
+
+
+def test_principal_is_cached_and_invalidated_on_user_change(client, db_session, auth_headers):
+    headers = auth_headers(client, "cached@example.com")
+    assert get_cached_principal("cached@example.com") is None
+
+    r = client.get("/api/v1/applications", headers=headers)
+    assert r.status_code == 200, r.text
+    principal = get_cached_principal("cached@example.com")
+    assert principal is not None
+    assert principal.email == "cached@example.com"
+
+    user = db_session.scalar(select(User).where(User.email == "cached@example.com"))
+    user.email = "renamed@example.com"
+    db_session.commit()
+
+    assert get_cached_principal("cached@example.com") is None
+    r = client.get("/api/v1/applications", headers=headers)
+    assert r.status_code == 401, r.text
+
+
+def test_token_user_id_claim_skips_lookup(client, db_session, monkeypatch, auth_headers):
+    headers = auth_headers(client, "claims@example.com")
+    monkeypatch.setattr(settings, "auth_trust_token_user_id", True)
+
+    db_session.execute(text("DELETE FROM users"))
+    db_session.commit()
+
+    r = client.get("/api/v1/applications", headers=headers)
+    assert r.status_code == 200, r.text
+    assert get_cached_principal("claims@example.com") is None
+
+    monkeypatch.setattr(settings, "auth_trust_token_user_id", False)
+    r = client.get("/api/v1/applications", headers=headers)
+    assert r.status_code == 401, r.text
+
+
+def test_principal_is_evicted_on_commit_not_flush(client, db_session, auth_headers):
+    headers = auth_headers(client, "flushed@example.com")
+    r = client.get("/api/v1/applications", headers=headers)
+    assert r.status_code == 200, r.text
+
+    user = db_session.scalar(select(User).where(User.email == "flushed@example.com"))
+    user.email = "pending@example.com"
+    db_session.flush()
+    assert get_cached_principal("flushed@example.com") is not None
+
+    db_session.rollback()
+    assert get_cached_principal("flushed@example.com") is not None
+
+    user.email = "committed@example.com"
+    db_session.commit()
+    assert get_cached_principal("flushed@example.com") is None
@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy import event
+
+from app.models.application import ApplicationStatus
+from app.models.user import User
+from app.services.application_analytics_service import (
+    get_recruiter_performance,
+    get_recruiter_performance_v2,
+    get_time_to_status,
+)
+from app.services.application_service import (
+    count_user_applications,
+    get_due_followups,
+    get_user_applications,
+)
+
+HOT_QUERIES = [
+    (
+        "ix_applications_user_created_at",
+        lambda db, user_id: get_user_applications(
+            db=db,
+            user_id=user_id,
+            page=1,
+            page_size=20,
+            include_total=False,
+        ),
+    ),
+    (
+        "ix_applications_user_status",
+        lambda db, user_id: count_user_applications(
+            db=db,
+            user_id=user_id,
+            status=ApplicationStatus.applied,
+        ),
+    ),
+    (
+        "ix_applications_user_status",
+        lambda db, user_id: get_time_to_status(db=db, user_id=user_id),
+    ),
+    (
+        "ix_applications_user_follow_up_at",
+        lambda db, user_id: get_due_followups(db=db, user_id=user_id),
+    ),
+    (
+        "ix_applications_user_recruiter_email",
+        lambda db, user_id: get_recruiter_performance(db=db, user_id=user_id),
+    ),
+    (
+        "ix_applications_user_recruiter_email",
+        lambda db, user_id: get_recruiter_performance_v2(
+            db=db,
+            user_id=user_id,
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize(("index_name", "run_query"), HOT_QUERIES)
+def test_hot_queries_use_composite_indexes(db_session, index_name, run_query):
+    db = db_session
+    user = User(email="plans@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    user_id = user.id
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", record)
+    try:
+        run_query(db, user_id)
+    finally:
+        event.remove(bind, "before_cursor_execute", record)
+
+    assert statements
+    connection = db.connection()
+    for statement, parameters in statements:
+        plan = connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}",
+            parameters,
+        ).all()
+        details = " ".join(row[-1] for row in plan)
+        assert f"INDEX {index_name} " in details, details
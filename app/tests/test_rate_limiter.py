@@ -0,0 +1,224 @@
+import asyncio
+import hashlib
+import os
+import socketserver
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from app.core import rate_limiter
+
+try:
+    # Redis embeds Lua 5.1.
+    from lupa import lua51 as lupa
+except ImportError:  # pragma: no cover - resp_server skips without it
+    lupa = None
+from app.core.rate_limit_backends import RedisRateLimiter, SQLiteRateLimiter
+from app.core.rate_limiter import SlidingWindowRateLimiter
+
+
+def _clock(monkeypatch, start=960.0):
+    now = [start]
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_sliding_window_limits_and_recovers(monkeypatch):
+    now = _clock(monkeypatch)
+    limiter = SlidingWindowRateLimiter(shards=4)
+
+    assert all(limiter.allow("ip:1", 3, 60) for _ in range(3))
+    assert not limiter.allow("ip:1", 3, 60)
+    assert limiter.rejections == 1
+
+    now[0] += 60
+    assert not limiter.allow("ip:1", 3, 60)
+
+    now[0] += 50
+    assert limiter.allow("ip:1", 3, 60)
+
+    now[0] += 120
+    assert all(limiter.allow("ip:1", 3, 60) for _ in range(3))
+
+
+def test_idle_keys_are_swept_and_key_count_is_capped(monkeypatch):
+    now = _clock(monkeypatch)
+    limiter = SlidingWindowRateLimiter(
+        shards=2,
+        max_keys=10,
+        sweep_interval_seconds=30,
+    )
+
+    for i in range(100):
+        limiter.allow(f"ip:{i}", 5, 60)
+    assert limiter.tracked_keys() <= 10
+
+    now[0] += 180
+    for shard_key in ("ip:a", "ip:b", "ip:c", "ip:d"):
+        limiter.allow(shard_key, 5, 60)
+    assert limiter.tracked_keys() == 4
+
+
+def test_login_rate_limit_returns_429(client):
+    form = {"username": "nobody@example.com", "password": "wrong"}
+    codes = [
+        client.post("/api/v1/auth/login", data=form).status_code
+        for _ in range(21)
+    ]
+    assert codes[:20] == [401] * 20
+    assert codes[20] == 429
+
+
+def test_blocking_backends_run_off_the_event_loop(monkeypatch):
+    threads = []
+
+    class BlockingBackend:
+        rejections = 0
+
+        def allow(self, key, limit, window_seconds):
+            threads.append(threading.get_ident())
+            return False
+
+    monkeypatch.setattr(rate_limiter, "_limiter", BlockingBackend())
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(rate_limiter.rate_limit(key="ip:1", limit=1, window_seconds=60))
+
+    assert excinfo.value.status_code == 429
+    assert threads and threads[0] != threading.get_ident()
+
+
+class _RespStandIn(socketserver.ThreadingTCPServer):
+    """Tiny in-process server speaking enough RESP for the limiter.
+
+    Scripts run on an embedded Lua interpreter with a minimal ``redis.call``,
+    so the limiter's real script is what gets tested.
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _RespHandler)
+        self.store: dict[str, int] = {}
+        self.scripts: dict[str, str] = {}
+        self.commands: list[bytes] = []
+        self.lock = threading.Lock()
+
+    def call(self, name, key, *args):
+        name = name.upper()
+        if name == "GET":
+            value = self.store.get(key)
+            return False if value is None else str(value)
+        if name == "INCR":
+            self.store[key] = self.store.get(key, 0) + 1
+            return self.store[key]
+        if name == "EXPIRE":
+            return 1
+        raise ValueError(f"unsupported command {name}")
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        while True:
+            command = self._read_command()
+            if command is None:
+                return
+            self.wfile.write(self._execute(command))
+
+    def _execute(self, command):
+        name, *args = command
+        name = name.upper()
+        server = self.server
+        server.commands.append(name)
+        if name == b"EVAL":
+            script = args[0].decode()
+            server.scripts[hashlib.sha1(args[0]).hexdigest()] = script
+        elif name == b"EVALSHA":
+            script = server.scripts.get(args[0].decode())
+            if script is None:
+                return b"-NOSCRIPT No matching script.\r\n"
+        else:
+            return b"-ERR unknown command\r\n"
+
+        numkeys = int(args[1])
+        keys = [key.decode() for key in args[2 : 2 + numkeys]]
+        argv = [arg.decode() for arg in args[2 + numkeys :]]
+        with server.lock:
+            lua = lupa.LuaRuntime()
+            lua.globals().redis = lua.table(call=server.call)
+            lua.globals().KEYS = lua.table(*keys)
+            lua.globals().ARGV = lua.table(*argv)
+            result = lua.execute(script)
+        return b":%d\r\n" % int(result)
+
+    def _read_command(self):
+        header = self.rfile.readline()
+        if not header:
+            return None
+        parts = []
+        for _ in range(int(header[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            parts.append(self.rfile.read(length + 2)[:-2])
+        return parts
+
+
+@pytest.fixture()
+def resp_server():
+    pytest.importorskip("lupa.lua51")
+    server = _RespStandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_sqlite_backend_shares_limit_between_workers(tmp_path):
+    path = str(tmp_path / "limits.sqlite3")
+    worker_a = SQLiteRateLimiter(path)
+    worker_b = SQLiteRateLimiter(path)
+
+    assert worker_a.allow("ip:1", 3, 60)
+    assert worker_b.allow("ip:1", 3, 60)
+    assert worker_a.allow("ip:1", 3, 60)
+    assert not worker_b.allow("ip:1", 3, 60)
+    assert not worker_a.allow("ip:1", 3, 60)
+    assert worker_a.rejections + worker_b.rejections == 2
+    assert worker_a.allow("ip:2", 3, 60)
+
+
+def test_redis_backend_shares_limit_and_fails_open(resp_server):
+    host, port = resp_server.server_address
+    worker_a = RedisRateLimiter(f"redis://{host}:{port}/0")
+    worker_b = RedisRateLimiter(f"redis://{host}:{port}/0")
+
+    assert worker_a.allow("ip:1", 2, 60)
+    assert worker_b.allow("ip:1", 2, 60)
+    assert not worker_a.allow("ip:1", 2, 60)
+    assert not worker_b.allow("ip:1", 2, 60)
+    assert max(resp_server.store.values()) == 2
+    assert worker_a.rejections + worker_b.rejections == 2
+    # Only the first check ships the script; the server then has it by SHA.
+    assert resp_server.commands == [b"EVALSHA", b"EVAL", *[b"EVALSHA"] * 3]
+
+    resp_server.shutdown()
+    resp_server.server_close()
+    worker_c = RedisRateLimiter(f"redis://{host}:{port}/0", timeout=0.05)
+    assert worker_c.allow("ip:1", 2, 60)
+
+
+@pytest.mark.skipif(
+    not os.environ.get("TEST_REDIS_URL"),
+    reason="set TEST_REDIS_URL to run against a real Redis",
+)
+def test_redis_backend_against_real_server():
+    url = os.environ["TEST_REDIS_URL"]
+    key = f"test:{os.getpid()}:{time.time()}"
+    limiter = RedisRateLimiter(url)
+
+    assert limiter.allow(key, 2, 60)
+    assert limiter.allow(key, 2, 60)
+    assert not limiter.allow(key, 2, 60)
+    assert limiter.rejections == 1
@@ -0,0 +1,127 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import READ_YOUR_WRITES_COOKIE, get_db, get_replica_db
+from app.main import app
+from app.models.application import Application
+from app.models.base import Base
+
+
+@pytest.fixture()
+def replica_client(tmp_path):
+    """Primary and replica as two separate SQLite databases, not replicated."""
+    engines = {}
+    sessions = {}
+    for name in ("primary", "replica"):
+        engine = create_engine(
+            f"sqlite:///{tmp_path / name}.db",
+            connect_args={"check_same_thread": False},
+        )
+        Base.metadata.create_all(bind=engine)
+        engines[name] = engine
+        sessions[name] = sessionmaker(
+            bind=engine,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+
+    def override(name):
+        def get_session():
+            db = sessions[name]()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        return get_session
+
+    app.dependency_overrides[get_db] = override("primary")
+    app.dependency_overrides[get_replica_db] = override("replica")
+    with TestClient(app) as c:
+        yield c, engines
+    app.dependency_overrides.clear()
+    for engine in engines.values():
+        engine.dispose()
+
+
+def _companies(client, headers):
+    r = client.get("/api/v1/applications", headers=headers)
+    assert r.status_code == 200, r.text
+    return [item["company_name"] for item in r.json()["items"]]
+
+
+def test_reads_go_to_replica_outside_read_your_writes_window(replica_client, auth_headers):
+    client, engines = replica_client
+    headers = auth_headers(client, "replica@example.com")
+    r = client.post(
+        "/api/v1/applications",
+        json={"company_name": "Primary Co", "position": "Engineer"},
+        headers=headers,
+    )
+    app_id = r.json()["id"]
+    assert READ_YOUR_WRITES_COOKIE in r.cookies
+    with engines["replica"].begin() as conn:
+        conn.execute(
+            insert(Application),
+            {
+                "id": app_id + 1,
+                "user_id": 1,
+                "company_name": "Replica Co",
+                "position": "Engineer",
+            },
+        )
+
+    # The user just wrote, so reads stay on the primary.
+    assert _companies(client, headers) == ["Primary Co"]
+    r = client.get("/api/v1/applications/analytics/summary", headers=headers)
+    assert r.json()["total"] == 1
+
+    # Another worker would see the same cookie; without it reads go to the
+    # replica.
+    client.cookies.clear()
+
+    assert _companies(client, headers) == ["Replica Co"]
+    r = client.get(f"/api/v1/applications/{app_id}/timeline", headers=headers)
+    assert r.status_code == 404
+    r = client.get("/api/v1/applications/followups", headers=headers)
+    assert r.status_code == 200
+    # Single-row reads and writes always use the primary.
+    r = client.get(f"/api/v1/applications/{app_id}", headers=headers)
+    assert r.json()["company_name"] == "Primary Co"
+
+    r = client.patch(
+        f"/api/v1/applications/{app_id}",
+        json={"status": "offer"},
+        headers=headers,
+    )
+    assert r.status_code == 422
+    assert READ_YOUR_WRITES_COOKIE not in r.cookies
+    assert _companies(client, headers) == ["Replica Co"]
+
+    r = client.patch(
+        f"/api/v1/applications/{app_id}",
+        json={"location": "Remote"},
+        headers=headers,
+    )
+    assert r.status_code == 200
+    assert r.json()["location"] == "Remote"
+    assert READ_YOUR_WRITES_COOKIE in r.cookies
+    assert _companies(client, headers) == ["Primary Co"]
+    r = client.get("/api/v1/applications", headers=headers)
+    assert r.json()["items"][0]["location"] == "Remote"
+    r = client.get(f"/api/v1/applications/{app_id}/timeline", headers=headers)
+    assert r.status_code == 200
+
+
+def test_without_replica_reads_use_primary(client, auth_headers):
+    headers = auth_headers(client, "replica@example.com")
+    client.post(
+        "/api/v1/applications",
+        json={"company_name": "Primary Co", "position": "Engineer"},
+        headers=headers,
+    )
+    client.cookies.clear()
+
+    assert _companies(client, headers) == ["Primary Co"]
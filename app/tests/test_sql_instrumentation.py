@@ -0,0 +1,121 @@
+import logging
+import re
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.core.sql_instrumentation import (
+    TimedQueuePool,
+    instrument_engine,
+    track_sql,
+)
+
+SERVER_TIMING = re.compile(
+    r'db;dur=[\d.]+;desc="(\d+) queries", db-pool;dur=[\d.]+, total;dur=[\d.]+'
+)
+
+
+def _seed(client, headers, count):
+    ids = []
+    for i in range(count):
+        r = client.post(
+            "/api/v1/applications",
+            json={
+                "company_name": f"Company {i}",
+                "position": "Engineer",
+                "follow_up_at": "2030-01-01T09:00:00Z",
+            },
+            headers=headers,
+        )
+        assert r.status_code == 201, r.text
+        ids.append(r.json()["id"])
+    return ids
+
+
+@pytest.mark.parametrize("fixture", ["client", "async_client"])
+def test_server_timing_reports_statement_count(request, fixture, caplog, auth_headers):
+    client = request.getfixturevalue(fixture)
+    headers = auth_headers(client, "timing@example.com")
+    (app_id,) = _seed(client, headers, 1)
+    client.get("/api/v1/applications/followups", headers=headers)
+
+    with caplog.at_level(logging.INFO, logger="app.core.sql_instrumentation"):
+        r = client.get(f"/api/v1/applications/{app_id}", headers=headers)
+
+    assert r.status_code == 200
+    match = SERVER_TIMING.fullmatch(r.headers["server-timing"])
+    assert match is not None, r.headers["server-timing"]
+    assert match.group(1) == "1"
+
+    (record,) = caplog.records
+    assert record.path == f"/api/v1/applications/{app_id}"
+    assert record.method == "GET"
+    assert record.status_code == 200
+    assert record.db_statements == 1
+    assert record.db_ms >= 0
+    assert "db_statements=1" in record.getMessage()
+
+
+def test_requests_without_sql_report_zero_queries(client):
+    r = client.get("/health")
+    assert SERVER_TIMING.fullmatch(r.headers["server-timing"]).group(1) == "0"
+
+
+def test_pool_wait_is_timed_per_context():
+    engine = create_engine("sqlite://", poolclass=TimedQueuePool)
+    instrument_engine(engine)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    with track_sql() as stats:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+    engine.dispose()
+
+    assert stats.statements == 2
+    assert stats.db_seconds > 0
+    assert stats.pool_wait_seconds > 0
+
+
+def test_failed_statements_are_counted():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+
+    with track_sql() as stats:
+        with engine.connect() as conn, pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing"))
+
+    assert stats.statements == 1
+
+
+def test_list_endpoints_do_not_query_per_row(client, assert_max_queries, auth_headers):
+    headers = auth_headers(client, "timing@example.com")
+    (app_id, *_) = _seed(client, headers, 25)
+    for note in ("one", "two", "three"):
+        client.post(
+            f"/api/v1/applications/{app_id}/notes",
+            json={"note": note},
+            headers=headers,
+        )
+
+    for url in (
+        "/api/v1/applications?page_size=25",
+        "/api/v1/applications?pagination=cursor&page_size=25",
+        "/api/v1/applications/followups?days=30",
+        f"/api/v1/applications/{app_id}/timeline",
+        "/api/v1/applications/analytics/dashboard",
+    ):
+        with assert_max_queries(6):
+            r = client.get(url, headers=headers)
+        assert r.status_code == 200, (url, r.text)
+
+
+def test_assert_max_queries_fails_when_exceeded(client, assert_max_queries, auth_headers):
+    headers = auth_headers(client, "timing@example.com")
+
+    with pytest.raises(AssertionError, match="at most 0 queries"):
+        with assert_max_queries(0):
+            client.get("/api/v1/applications", headers=headers)
@@ -0,0 +1,68 @@
+def _setup(client, auth_headers):
+    headers = auth_headers(client, "statements@example.com")
+    r = client.get("/api/v1/applications/followups", headers=headers)
+    assert r.status_code == 200
+    return headers
+
+
+def test_write_path_statement_counts(client, capture_sql, auth_headers):
+    headers = _setup(client, auth_headers)
+
+    # INSERT ... RETURNING, rollup upsert, data version bump.
+    with capture_sql() as statements:
+        r = client.post(
+            "/api/v1/applications",
+            json={"company_name": "ACME", "position": "Engineer"},
+            headers=headers,
+        )
+    assert r.status_code == 201, r.text
+    assert r.json()["version"] == 1
+    assert len(statements) == 3, statements
+    app_id = r.json()["id"]
+
+    with capture_sql() as statements:
+        r = client.get(f"/api/v1/applications/{app_id}", headers=headers)
+    assert r.status_code == 200
+    assert len(statements) == 1, statements
+
+    # SELECT, one rollup upsert for both statuses, one multi-row event
+    # INSERT, data version bump, UPDATE ... RETURNING.
+    with capture_sql() as statements:
+        r = client.patch(
+            f"/api/v1/applications/{app_id}",
+            json={
+                "status": "screening",
+                "follow_up_at": "2030-01-01T09:00:00Z",
+                "recruiter_email": "jane@acme.io",
+            },
+            headers=headers,
+        )
+    assert r.status_code == 200, r.text
+    assert r.json()["version"] == 2
+    assert r.json()["updated_at"]
+    assert len(statements) == 5, statements
+
+    # SELECT, data version bump, INSERT ... RETURNING.
+    with capture_sql() as statements:
+        r = client.post(
+            f"/api/v1/applications/{app_id}/notes",
+            json={"note": "Phone screen booked"},
+            headers=headers,
+        )
+    assert r.status_code == 201, r.text
+    assert r.json()["created_at"]
+    assert len(statements) == 3, statements
+
+    r = client.get(f"/api/v1/applications/{app_id}/timeline", headers=headers)
+    assert [item["event_type"] for item in r.json()] == [
+        "note",
+        "contact",
+        "follow_up",
+        "status_change",
+    ]
+
+    # SELECT, rollup upsert, DELETE events, data version bump, DELETE.
+    with capture_sql() as statements:
+        r = client.delete(f"/api/v1/applications/{app_id}", headers=headers)
+    assert r.status_code == 204
+    assert len(statements) == 5, statements
@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.application import Application, ApplicationStatus
+from app.models.application_event import ApplicationEvent, ApplicationEventType
+from app.services import application_analytics_service
+from app.services.application_analytics_service import (
+    get_status_duration_metrics,
+)
+
+
+def _create(client, headers, company):
+    r = client.post(
+        "/api/v1/applications",
+        json={"company_name": company, "position": "Engineer"},
+        headers=headers,
+    )
+    assert r.status_code == 201, r.text
+    return r.json()["id"]
+
+
+def test_sql_and_streamed_status_durations_match(client, db_session, monkeypatch, auth_headers):
+    headers = auth_headers(client, "durations@example.com")
+    first = _create(client, headers, "ACME")
+    second = _create(client, headers, "Globex")
+    _create(client, headers, "Initech")
+
+    db = db_session
+    user_id = db.get(Application, first).user_id
+    start = datetime(2026, 1, 5, 9, 30, 15, 250000)
+    transitions = {
+        first: [
+            (ApplicationStatus.applied, timedelta(0)),
+            (ApplicationStatus.screening, timedelta(days=2, hours=5)),
+            (ApplicationStatus.interview, timedelta(days=9, minutes=17)),
+            (ApplicationStatus.offer, timedelta(days=20, seconds=3)),
+        ],
+        second: [
+            (ApplicationStatus.applied, timedelta(days=1)),
+            (ApplicationStatus.screening, timedelta(days=4, hours=12)),
+            (ApplicationStatus.rejected, timedelta(days=4, hours=12)),
+        ],
+    }
+    for application_id, steps in transitions.items():
+        for to_status, offset in steps:
+            db.add(
+                ApplicationEvent(
+                    application_id=application_id,
+                    user_id=user_id,
+                    event_type=ApplicationEventType.status_change,
+                    to_status=to_status,
+                    created_at=start + offset,
+                )
+            )
+    db.commit()
+
+    assert application_analytics_service.supports_window_functions(
+        db.get_bind().dialect,
+    )
+    in_sql = get_status_duration_metrics(db=db, user_id=user_id)
+
+    monkeypatch.setattr(
+        application_analytics_service,
+        "supports_window_functions",
+        lambda dialect: False,
+    )
+    streamed = get_status_duration_metrics(db=db, user_id=user_id)
+
+    by_status = {item["status"]: item["avg_days"] for item in streamed["metrics"]}
+    assert by_status[ApplicationStatus.applied] == pytest.approx(
+        ((2 + 5 / 24) + 3.5) / 2,
+    )
+    assert by_status[ApplicationStatus.offer] is None
+    assert [item["status"] for item in in_sql["metrics"]] == [
+        item["status"] for item in streamed["metrics"]
+    ]
+    for sql_item, streamed_item in zip(
+        in_sql["metrics"],
+        streamed["metrics"],
+        strict=True,
+    ):
+        if streamed_item["avg_days"] is None:
+            assert sql_item["avg_days"] is None
+        else:
+            assert sql_item["avg_days"] == pytest.approx(
+                streamed_item["avg_days"],
+                rel=1e-9,
+            )
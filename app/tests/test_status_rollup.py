@@ -0,0 +1,95 @@
+from sqlalchemy import update
+
+from app.api.v1 import applications as applications_api
+from app.models.application import ApplicationStatus
+from app.models.user_status_count import UserStatusCount
+from app.services.application_service import get_application_by_id
+from app.services.status_rollup_service import (
+    check_status_rollup,
+    rebuild_status_rollup,
+)
+
+
+def _create(client, headers, company):
+    r = client.post(
+        "/api/v1/applications",
+        json={"company_name": company, "position": "Engineer"},
+        headers=headers,
+    )
+    assert r.status_code == 201, r.text
+    return r.json()["id"]
+
+
+def test_rollup_follows_writes_and_can_be_rebuilt(client, db_session, auth_headers):
+    headers = auth_headers(client, "rollup@example.com")
+
+    first = _create(client, headers, "ACME")
+    second = _create(client, headers, "Globex")
+    _create(client, headers, "Initech")
+
+    r = client.patch(
+        f"/api/v1/applications/{first}",
+        json={"status": "screening"},
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    r = client.patch(
+        f"/api/v1/applications/{first}",
+        json={"status": "offer"},
+        headers=headers,
+    )
+    assert r.status_code == 422, r.text
+    r = client.delete(f"/api/v1/applications/{second}", headers=headers)
+    assert r.status_code == 204, r.text
+
+    r = client.get("/api/v1/applications/analytics/summary", headers=headers)
+    by_status = {item["status"]: item["count"] for item in r.json()["by_status"]}
+    assert r.json()["total"] == 2
+    assert by_status["applied"] == 1
+    assert by_status["screening"] == 1
+
+    r = client.get("/api/v1/applications/analytics/funnel", headers=headers)
+    steps = {item["step"]: item["count"] for item in r.json()["steps"]}
+    assert steps == {
+        "applied": 2,
+        "screening": 1,
+        "interview": 0,
+        "offer": 0,
+        "accepted": 0,
+    }
+
+    db = db_session
+    assert check_status_rollup(db=db) == []
+
+    db.execute(
+        update(UserStatusCount)
+        .where(UserStatusCount.status == ApplicationStatus.applied)
+        .values(count=7)
+    )
+    db.commit()
+    mismatches = check_status_rollup(db=db)
+    assert [(m["expected"], m["stored"]) for m in mismatches] == [(1, 7)]
+
+    rebuild_status_rollup(db=db)
+    assert check_status_rollup(db=db) == []
+
+
+def test_write_paths_lock_the_application_row(client, auth_headers, monkeypatch):
+    headers = auth_headers(client, "locks@example.com")
+    app_id = _create(client, headers, "ACME")
+    calls = []
+
+    def spy(**kwargs):
+        calls.append(kwargs.get("for_update", False))
+        return get_application_by_id(**kwargs)
+
+    monkeypatch.setattr(applications_api, "get_application_by_id", spy)
+    client.get(f"/api/v1/applications/{app_id}", headers=headers)
+    client.patch(
+        f"/api/v1/applications/{app_id}",
+        json={"status": "screening"},
+        headers=headers,
+    )
+    client.delete(f"/api/v1/applications/{app_id}", headers=headers)
+
+    assert calls == [False, True, True]
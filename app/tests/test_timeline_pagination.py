@@ -0,0 +1,89 @@
+from sqlalchemy import event
+
+from app.models.application import Application
+from app.models.user import User
+from app.services.application_event_service import get_application_timeline
+
+
+def test_timeline_pages_with_before_cursor(client, auth_headers):
+    headers = auth_headers(client, "timeline@example.com")
+    r = client.post(
+        "/api/v1/applications",
+        json={"company_name": "ACME", "position": "Engineer"},
+        headers=headers,
+    )
+    app_id = r.json()["id"]
+    url = f"/api/v1/applications/{app_id}/timeline"
+
+    for i in range(5):
+        r = client.post(
+            f"/api/v1/applications/{app_id}/notes",
+            json={"note": f"note {i}"},
+            headers=headers,
+        )
+        assert r.status_code == 201, r.text
+
+    notes = []
+    before = None
+    while True:
+        params = {"limit": 2}
+        if before is not None:
+            params["before"] = before
+        r = client.get(url, params=params, headers=headers)
+        assert r.status_code == 200, r.text
+        assert len(r.json()) <= 2
+        notes.extend(item["note"] for item in r.json())
+        before = r.headers.get("X-Next-Cursor")
+        if before is None:
+            break
+
+    assert notes == [f"note {i}" for i in reversed(range(5))]
+
+    r = client.get(url, headers=headers)
+    assert r.status_code == 200, r.text
+    assert [item["note"] for item in r.json()] == notes
+    assert "X-Next-Cursor" not in r.headers
+
+    r = client.get(url, params={"before": "not-a-cursor"}, headers=headers)
+    assert r.status_code == 400
+
+
+def test_timeline_page_uses_composite_index(db_session):
+    db = db_session
+    user = User(email="timeline-plan@example.com", hashed_password="x")
+    db.add(user)
+    db.flush()
+    application = Application(
+        user_id=user.id,
+        company_name="ACME",
+        position="Engineer",
+    )
+    db.add(application)
+    db.commit()
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", record)
+    try:
+        get_application_timeline(
+            db=db,
+            user_id=user.id,
+            application_id=application.id,
+            limit=50,
+        )
+    finally:
+        event.remove(bind, "before_cursor_execute", record)
+
+    ((statement, parameters),) = statements
+    plan = db.connection().exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}",
+        parameters,
+    )
+    details = " ".join(row[-1] for row in plan)
+
+    assert "INDEX ix_application_events_timeline " in details
+    assert "TEMP B-TREE" not in details
@@ -0,0 +1,55 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from jose import ExpiredSignatureError, jwt
+
+from app.core.config import settings
+from app.core.security import (
+    ALGORITHM,
+    TokenCache,
+    token_cache,
+)
+
+
+def test_repeated_requests_hit_the_token_cache(client):
+    r = client.post(
+        "/api/v1/auth/register",
+        json={"email": "tokens@example.com", "password": "pass12345"},
+    )
+    token = r.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    for _ in range(3):
+        r = client.get("/api/v1/applications/analytics/summary", headers=headers)
+        assert r.status_code == 200, r.text
+
+    assert token_cache.stats()["misses"] == 1
+    assert token_cache.stats()["hits"] == 2
+
+
+def test_cached_claims_expire_with_the_token(monkeypatch):
+    now = [1_000.0]
+    cache = TokenCache(maxsize=10, clock=lambda: now[0])
+    issued_at = datetime.now(UTC)
+    token = jwt.encode(
+        {"sub": "soon@example.com", "exp": int(issued_at.timestamp()) + 60},
+        settings.secret_key,
+        algorithm=ALGORITHM,
+    )
+
+    assert cache.decode(token)["sub"] == "soon@example.com"
+    now[0] += 30
+    assert cache.decode(token)["sub"] == "soon@example.com"
+    assert cache.stats()["hits"] == 1
+
+    class _Later(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return issued_at + timedelta(seconds=62)
+
+    now[0] += 32
+    monkeypatch.setattr(jwt, "datetime", _Later)
+    with pytest.raises(ExpiredSignatureError):
+        cache.decode(token)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
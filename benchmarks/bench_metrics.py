@@ -0,0 +1,90 @@
+"""Per-request overhead of ``MetricsMiddleware``.
+
+Drives a minimal ASGI app that routes like FastAPI (sets ``scope["route"]``
+and ``path_params``) directly, with and without the metrics middleware, and
+reports the added cost per request. Exits non-zero if it exceeds the budget.
+
+    python -m benchmarks.bench_metrics --requests 200000 --budget-us 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+from fastapi.routing import APIRoute
+
+from app.core.metrics import MetricsMiddleware, registry, request_latency
+
+ROUTE = APIRoute("/applications/{app_id}", lambda app_id: None, methods=["GET"])
+START = {"type": "http.response.start", "status": 200, "headers": []}
+BODY = {"type": "http.response.body", "body": b"{}"}
+
+
+async def routed_app(scope, receive, send) -> None:
+    scope["route"] = ROUTE
+    scope["path_params"] = {"app_id": 42}
+    await send(START)
+    await send(BODY)
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message) -> None:
+    pass
+
+
+def scope() -> dict:
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/applications/42",
+        "headers": [],
+    }
+
+
+async def time_per_request_us(app, requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(scope(), receive, send)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+async def run(requests: int, repeat: int) -> float:
+    wrapped = MetricsMiddleware(routed_app)
+    overheads = []
+    for _ in range(repeat):
+        bare = await time_per_request_us(routed_app, requests)
+        instrumented = await time_per_request_us(wrapped, requests)
+        overheads.append(instrumented - bare)
+
+    start = time.perf_counter()
+    registry.render()
+    render_ms = (time.perf_counter() - start) * 1000
+
+    print(f"requests per run:       {requests}")
+    print(f"bare app:               {bare:6.2f} us/request")
+    print(f"with MetricsMiddleware: {instrumented:6.2f} us/request")
+    print(f"median overhead:        {statistics.median(overheads):6.2f} us/request")
+    print(f"/metrics render:        {render_ms:6.2f} ms")
+    request_latency.clear()
+    return statistics.median(overheads)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-us", type=float, default=20.0)
+    args = parser.parse_args()
+    overhead = asyncio.run(run(args.requests, args.repeat))
+    if overhead > args.budget_us:
+        print(f"over budget: {overhead:.2f} us > {args.budget_us:.2f} us")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Sliding-window limiter vs the previous per-key deque limiter.
+
+Measures single-thread and multi-thread ``allow()`` throughput on hot keys and
+the memory retained after a scan from many distinct IPs, then the per-check
+latency of the shared backends.
+
+    python -m benchmarks.bench_rate_limiter --calls 200000 --keys 200000
+    python -m benchmarks.bench_rate_limiter --redis-url redis://localhost:6379/0
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from app.core.rate_limit_backends import RedisRateLimiter, SQLiteRateLimiter
+from app.core.rate_limiter import SlidingWindowRateLimiter
+
+
+class DequeRateLimiter:
+    """The original limiter: a timestamp deque per key behind one lock."""
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, deque[float]] = {}
+        self._lock = Lock()
+
+    def allow(self, key: str, limit: int, window_seconds: int) -> bool:
+        now = time.time()
+        cutoff = now - window_seconds
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = deque()
+                self._buckets[key] = bucket
+
+            while bucket and bucket[0] < cutoff:
+                bucket.popleft()
+
+            if len(bucket) >= limit:
+                return False
+
+            bucket.append(now)
+            return True
+
+
+def throughput(limiter, calls: int, threads: int) -> float:
+    keys = [f"ip:10.0.0.{i}:login" for i in range(64)]
+    per_thread = calls // threads
+
+    def worker(offset: int) -> None:
+        for i in range(per_thread):
+            limiter.allow(keys[(i + offset) % len(keys)], 1_000, 60)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, range(threads)))
+    return calls / (time.perf_counter() - start)
+
+
+def scan_memory(limiter, keys: int) -> float:
+    tracemalloc.start()
+    for i in range(keys):
+        limiter.allow(f"ip:{i}:login", 20, 60)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / 1024 / 1024
+
+
+def latency_us(limiter, calls: int) -> tuple[float, float]:
+    samples = []
+    for i in range(calls):
+        start = time.perf_counter()
+        limiter.allow(f"ip:{i % 256}:login", 1_000_000, 60)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99)]
+
+
+def run(calls: int, keys: int, redis_url: str | None) -> None:
+    limiters = {
+        "deque": DequeRateLimiter,
+        "sliding": lambda: SlidingWindowRateLimiter(max_keys=50_000),
+    }
+    print(f"{'limiter':>8} {'1 thr/s':>12} {'8 thr/s':>12} {'scan MiB':>10}")
+    for name, factory in limiters.items():
+        single = throughput(factory(), calls, 1)
+        multi = throughput(factory(), calls, 8)
+        memory = scan_memory(factory(), keys)
+        print(f"{name:>8} {single:>12,.0f} {multi:>12,.0f} {memory:>10.1f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        backends = {"sqlite": SQLiteRateLimiter(f"{tmp}/limits.sqlite3")}
+        if redis_url:
+            backends["redis"] = RedisRateLimiter(redis_url)
+
+        print(f"\n{'backend':>8} {'p50 us':>10} {'p99 us':>10}")
+        for name, limiter in backends.items():
+            p50, p99 = latency_us(limiter, min(calls, 20_000))
+            print(f"{name:>8} {p50:>10.1f} {p99:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--keys", type=int, default=200_000)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+    run(args.calls, args.keys, args.redis_url)
+
+
+if __name__ == "__main__":
+    main()
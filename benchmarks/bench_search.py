@@ -0,0 +1,137 @@
+"""Search latency as the applications table grows.
+
+Seeds a file-backed SQLite database at several sizes and times the ``q``
+filter through the FTS5 trigram backend against the plain ``ILIKE`` scan.
+
+    python -m benchmarks.bench_search --sizes 1000 10000 100000
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.application import Application, ApplicationStatus
+from app.models.base import Base
+from app.models.user import User
+from app.services.application_service import (
+    clear_application_count_cache,
+    get_user_applications,
+)
+
+WORDS = [
+    "platform",
+    "backend",
+    "frontend",
+    "data",
+    "infra",
+    "mobile",
+    "security",
+    "growth",
+    "payments",
+    "search",
+]
+USERS = 50
+NEEDLE = "zyxcorp"
+BENCH_USER_ID = 1
+
+
+def seed(engine, size: int) -> None:
+    rng = random.Random(size)
+    with Session(engine) as db:
+        db.execute(
+            insert(User),
+            [
+                {"email": f"user{i}@example.com", "hashed_password": "x"}
+                for i in range(USERS)
+            ],
+        )
+        rows = []
+        for i in range(size):
+            company = f"{rng.choice(WORDS).title()} {rng.randrange(10_000)}"
+            if i % 1000 == 0:
+                company = f"{NEEDLE} {i}"
+            rows.append(
+                {
+                    "user_id": i % USERS + 1,
+                    "company_name": company,
+                    "position": f"{rng.choice(WORDS)} engineer {i}",
+                    "recruiter_email": f"r{i}@{rng.choice(WORDS)}.io",
+                    "status": ApplicationStatus.applied,
+                }
+            )
+        db.execute(insert(Application), rows)
+        db.commit()
+
+
+def time_call(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def indexed_search(db: Session) -> list[Application]:
+    clear_application_count_cache()
+    items, _ = get_user_applications(db=db, user_id=BENCH_USER_ID, q=NEEDLE)
+    return items
+
+
+def ilike_scan(db: Session) -> list[Application]:
+    stmt = (
+        select(Application)
+        .where(
+            Application.user_id == BENCH_USER_ID,
+            or_(
+                Application.company_name.ilike(f"%{NEEDLE}%"),
+                Application.position.ilike(f"%{NEEDLE}%"),
+                Application.recruiter_email.ilike(f"%{NEEDLE}%"),
+            ),
+        )
+        .order_by(Application.created_at.desc())
+        .limit(20)
+    )
+    items = list(db.scalars(stmt).all())
+    db.scalar(select(func.count()).select_from(stmt.subquery()))
+    return items
+
+
+def run(sizes: list[int], repeat: int) -> None:
+    print(f"{'rows':>10} {'fts ms':>10} {'ilike ms':>10}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+            Base.metadata.create_all(engine)
+            seed(engine, size)
+
+            with Session(engine) as db:
+                fts_ms = time_call(partial(indexed_search, db), repeat)
+                ilike_ms = time_call(partial(ilike_scan, db), repeat)
+            engine.dispose()
+
+        print(f"{size:>10} {fts_ms:>10.2f} {ilike_ms:>10.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
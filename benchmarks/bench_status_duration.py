@@ -0,0 +1,118 @@
+"""Status-duration cost: window-function SQL vs the streamed Python walk.
+
+Seeds one user with N applications, each with a short chain of status_change
+events, in a file-backed SQLite database and times both implementations
+behind ``get_status_duration_metrics``.
+
+    python -m benchmarks.bench_status_duration --applications 20000
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.models.application import Application, ApplicationStatus
+from app.models.application_event import ApplicationEvent, ApplicationEventType
+from app.models.base import Base
+from app.models.user import User
+from app.services import application_analytics_service
+
+BENCH_USER_ID = 1
+STATUS_CHAIN = [
+    ApplicationStatus.applied,
+    ApplicationStatus.screening,
+    ApplicationStatus.interview,
+    ApplicationStatus.offer,
+]
+
+
+def seed(db: Session, applications: int) -> int:
+    rng = random.Random(applications)
+    db.execute(insert(User), [{"email": "bench@example.com", "hashed_password": "x"}])
+    db.execute(
+        insert(Application),
+        [
+            {
+                "user_id": BENCH_USER_ID,
+                "company_name": f"Company {i}",
+                "position": "Engineer",
+            }
+            for i in range(applications)
+        ],
+    )
+    start = datetime(2026, 1, 1)
+    events = []
+    for application_id in range(1, applications + 1):
+        created_at = start + timedelta(minutes=rng.randrange(500_000))
+        for status in STATUS_CHAIN[: rng.randint(1, len(STATUS_CHAIN))]:
+            events.append(
+                {
+                    "application_id": application_id,
+                    "user_id": BENCH_USER_ID,
+                    "event_type": ApplicationEventType.status_change,
+                    "to_status": status,
+                    "created_at": created_at,
+                }
+            )
+            created_at += timedelta(hours=rng.randrange(1, 400))
+    db.execute(insert(ApplicationEvent), events)
+    db.commit()
+    return len(events)
+
+
+def in_sql(db: Session) -> dict:
+    return application_analytics_service._status_durations_sql(
+        db=db,
+        user_id=BENCH_USER_ID,
+        dialect=db.get_bind().dialect,
+    )
+
+
+def streamed(db: Session) -> dict:
+    return application_analytics_service._status_durations_streamed(
+        db=db,
+        user_id=BENCH_USER_ID,
+    )
+
+
+def time_ms(fn, db: Session, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(db)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def run(applications: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            events = seed(db, applications)
+            sql_ms = time_ms(in_sql, db, repeat)
+            streamed_ms = time_ms(streamed, db, repeat)
+        engine.dispose()
+
+    print(f"applications: {applications}, status_change events: {events}")
+    print(f"LAG() in SQL:       {sql_ms:8.2f} ms")
+    print(f"streamed yield_per: {streamed_ms:8.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--applications", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.applications, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Summary and funnel cost: GROUP BY scan vs the status rollup table.
+
+Seeds one user with N applications in a file-backed SQLite database and times
+the old per-request ``GROUP BY status`` against the rollup reads now used by
+``get_applications_summary`` and ``get_funnel``.
+
+    python -m benchmarks.bench_status_rollup --applications 100000
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.application import Application, ApplicationStatus
+from app.models.base import Base
+from app.models.user import User
+from app.services.application_analytics_service import (
+    get_applications_summary,
+    get_funnel,
+)
+from app.services.status_rollup_service import rebuild_status_rollup
+
+BENCH_USER_ID = 1
+
+
+def seed(db: Session, applications: int) -> None:
+    rng = random.Random(applications)
+    statuses = list(ApplicationStatus)
+    db.execute(insert(User), [{"email": "bench@example.com", "hashed_password": "x"}])
+    db.execute(
+        insert(Application),
+        [
+            {
+                "user_id": BENCH_USER_ID,
+                "company_name": f"Company {i}",
+                "position": "Engineer",
+                "status": rng.choice(statuses),
+            }
+            for i in range(applications)
+        ],
+    )
+    db.commit()
+    rebuild_status_rollup(db=db)
+
+
+def group_by_scan(db: Session) -> None:
+    stmt = (
+        select(Application.status, func.count(Application.id))
+        .where(Application.user_id == BENCH_USER_ID)
+        .group_by(Application.status)
+    )
+    db.execute(stmt).all()
+    db.execute(stmt.where(Application.status != ApplicationStatus.rejected)).all()
+
+
+def rollup_reads(db: Session) -> None:
+    get_applications_summary(db=db, user_id=BENCH_USER_ID)
+    get_funnel(db=db, user_id=BENCH_USER_ID)
+
+
+def time_ms(fn, db: Session, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(db)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def run(applications: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            seed(db, applications)
+            scan = time_ms(group_by_scan, db, repeat)
+            rollup = time_ms(rollup_reads, db, repeat)
+        engine.dispose()
+
+    print(f"applications per user: {applications}")
+    print(f"GROUP BY summary+funnel: {scan:8.2f} ms")
+    print(f"rollup summary+funnel:   {rollup:8.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--applications", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.applications, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
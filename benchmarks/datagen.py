@@ -0,0 +1,181 @@
+"""Deterministic synthetic data for the benchmark suite.
+
+Seeds N users x M applications x K events into an empty schema with batched
+Core inserts. The same ``seed`` always produces the same application and
+event rows, so runs at a given scale are comparable across commits. The
+schema is built from the model metadata rather than the Alembic
+migrations (see ``benchmarks.bench_api`` for what that leaves out).
+
+    python -m benchmarks.datagen --database-url sqlite:////tmp/bench.db \\
+        --users 10 --applications 1000 --events 5
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import Engine, create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.core.security import hash_password
+from app.models.application import Application, ApplicationStatus
+from app.models.application_event import ApplicationEvent, ApplicationEventType
+from app.models.base import Base
+from app.models.user import User
+from app.services.status_rollup_service import rebuild_status_rollup
+
+BATCH_SIZE = 5_000
+PASSWORD = "bench-password"
+EPOCH = datetime(2024, 1, 1, tzinfo=UTC)
+STATUS_CHAIN = [
+    ApplicationStatus.applied,
+    ApplicationStatus.screening,
+    ApplicationStatus.interview,
+    ApplicationStatus.offer,
+    ApplicationStatus.accepted,
+]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne"]
+POSITIONS = ["Engineer", "Senior Engineer", "Staff Engineer", "Manager"]
+LOCATIONS = ["Remote", "Berlin", "London", "New York", None]
+
+
+@dataclass(frozen=True)
+class Scale:
+    users: int
+    applications: int
+    events: int
+
+    @classmethod
+    def parse(cls, value: str) -> "Scale":
+        """Parse ``USERSxAPPLICATIONSxEVENTS``, e.g. ``10x1000x5``."""
+        users, applications, events = (int(part) for part in value.split("x"))
+        return cls(users, applications, events)
+
+    def __str__(self) -> str:
+        return f"{self.users}x{self.applications}x{self.events}"
+
+
+def user_email(user_id: int) -> str:
+    return f"bench-{user_id}@example.com"
+
+
+def _batched(rows: Iterator[dict]) -> Iterator[list[dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _status_path(final: ApplicationStatus) -> list[ApplicationStatus]:
+    if final == ApplicationStatus.rejected:
+        return [ApplicationStatus.applied, ApplicationStatus.rejected]
+    return STATUS_CHAIN[: STATUS_CHAIN.index(final) + 1]
+
+
+def _rows(scale: Scale, seed: int) -> tuple[Iterator[dict], Iterator[dict]]:
+    """Yield application and event rows; ids are assigned from 1."""
+    rng = random.Random(seed)
+    plans = []
+    for user_id in range(1, scale.users + 1):
+        for i in range(scale.applications):
+            created_at = EPOCH + timedelta(minutes=rng.randrange(365 * 24 * 60))
+            status = rng.choice(list(ApplicationStatus))
+            plans.append((user_id, i, created_at, status, rng.random()))
+
+    def applications() -> Iterator[dict]:
+        for user_id, i, created_at, status, roll in plans:
+            yield {
+                "user_id": user_id,
+                "company_name": f"{COMPANIES[i % len(COMPANIES)]} {i}",
+                "position": POSITIONS[i % len(POSITIONS)],
+                "status": status,
+                "location": LOCATIONS[i % len(LOCATIONS)],
+                "recruiter_email": (
+                    f"recruiter{i % 50}@example.com" if roll < 0.5 else None
+                ),
+                "follow_up_at": (
+                    created_at + timedelta(days=14) if roll < 0.2 else None
+                ),
+                "created_at": created_at,
+                "status_updated_at": created_at,
+                "updated_at": created_at,
+            }
+
+    def events() -> Iterator[dict]:
+        for app_id, (user_id, _, created_at, status, _) in enumerate(plans, 1):
+            path = _status_path(status)
+            for j in range(scale.events):
+                at = created_at + timedelta(days=j + 1)
+                if j + 1 < len(path):
+                    yield {
+                        "user_id": user_id,
+                        "application_id": app_id,
+                        "event_type": ApplicationEventType.status_change,
+                        "from_status": path[j],
+                        "to_status": path[j + 1],
+                        "note": None,
+                        "created_at": at,
+                    }
+                else:
+                    yield {
+                        "user_id": user_id,
+                        "application_id": app_id,
+                        "event_type": ApplicationEventType.note,
+                        "from_status": None,
+                        "to_status": None,
+                        "note": f"Note {j}",
+                        "created_at": at,
+                    }
+
+    return applications(), events()
+
+
+def seed_database(engine: Engine, scale: Scale, *, seed: int = 0) -> None:
+    """Recreate the schema on ``engine`` and fill it for ``scale``."""
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    hashed_password = hash_password(PASSWORD)
+    applications, events = _rows(scale, seed)
+
+    with Session(engine) as db:
+        db.execute(
+            insert(User),
+            [
+                {"email": user_email(user_id), "hashed_password": hashed_password}
+                for user_id in range(1, scale.users + 1)
+            ],
+        )
+        for batch in _batched(applications):
+            db.execute(insert(Application.__table__), batch)
+        for batch in _batched(events):
+            db.execute(insert(ApplicationEvent.__table__), batch)
+        db.commit()
+        rebuild_status_rollup(db=db)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--applications", type=int, default=1_000)
+    parser.add_argument("--events", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    scale = Scale(args.users, args.applications, args.events)
+    engine = create_engine(args.database_url)
+    start = time.perf_counter()
+    seed_database(engine, scale, seed=args.seed)
+    engine.dispose()
+    print(f"seeded {scale} in {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
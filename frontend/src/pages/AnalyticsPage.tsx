@@ -14,12 +14,7 @@ import {
 } from "recharts";
 
 import { apiFetch, getErrorMessage } from "../api/client";
-import {
-  ApplicationsFunnelOut,
-  ApplicationsSummaryOut,
-  RecruiterPerformanceOut,
-  StatusDurationOut,
-} from "../types/api";
+import { AnalyticsDashboardOut } from "../types/api";
 
 const COLORS = [
   "#2563eb",
@@ -31,48 +26,24 @@ const COLORS = [
 ];
 
 export function AnalyticsPage(): JSX.Element {
-  const summaryQuery = useQuery({
-    queryKey: ["analytics", "summary"],
-    queryFn: async (): Promise<ApplicationsSummaryOut> => {
-      return apiFetch<ApplicationsSummaryOut>(
-        "/v1/applications/analytics/summary",
-      );
-    },
-  });
-
-  const funnelQuery = useQuery({
-    queryKey: ["analytics", "funnel"],
-    queryFn: async (): Promise<ApplicationsFunnelOut> => {
-      return apiFetch<ApplicationsFunnelOut>(
-        "/v1/applications/analytics/funnel",
-      );
-    },
-  });
-
-  const recruiterQuery = useQuery({
-    queryKey: ["analytics", "recruiter-performance"],
-    queryFn: async (): Promise<RecruiterPerformanceOut> => {
-      return apiFetch<RecruiterPerformanceOut>(
-        "/v1/applications/analytics/recruiter-performance",
-      );
-    },
-  });
-
-  const statusDurationQuery = useQuery({
-    queryKey: ["analytics", "status-duration"],
-    queryFn: async (): Promise<StatusDurationOut> => {
-      return apiFetch<StatusDurationOut>(
-        "/v1/applications/analytics/status-duration",
+  const dashboardQuery = useQuery({
+    queryKey: ["analytics", "dashboard"],
+    queryFn: async (): Promise<AnalyticsDashboardOut> => {
+      return apiFetch<AnalyticsDashboardOut>(
+        "/v1/applications/analytics/dashboard?sections=summary&sections=funnel" +
+          "&sections=status_duration&sections=recruiter_performance",
       );
     },
   });
 
+  const dashboard = dashboardQuery.data;
   const summaryData =
-    summaryQuery.data?.by_status.filter((item) => item.count > 0) ?? [];
-  const funnelData = funnelQuery.data?.steps ?? [];
-  const recruiterData = recruiterQuery.data?.recruiters.slice(0, 10) ?? [];
+    dashboard?.summary?.by_status.filter((item) => item.count > 0) ?? [];
+  const funnelData = dashboard?.funnel?.steps ?? [];
+  const recruiterData =
+    dashboard?.recruiter_performance?.recruiters.slice(0, 10) ?? [];
   const statusDurationData =
-    statusDurationQuery.data?.metrics
+    dashboard?.status_duration?.metrics
       .filter((item) => item.avg_days !== null)
       .map((item) => ({
         status: item.status,
@@ -87,11 +58,11 @@ export function AnalyticsPage(): JSX.Element {
 
       <section className="card">
         <h2>Summary</h2>
-        {summaryQuery.isLoading ? <p>Loading...</p> : null}
-        {summaryQuery.isError ? (
-          <p className="error">{getErrorMessage(summaryQuery.error)}</p>
+        {dashboardQuery.isLoading ? <p>Loading...</p> : null}
+        {dashboardQuery.isError ? (
+          <p className="error">{getErrorMessage(dashboardQuery.error)}</p>
         ) : null}
-        {!summaryQuery.isLoading && !summaryQuery.isError ? (
+        {!dashboardQuery.isLoading && !dashboardQuery.isError ? (
           summaryData.length === 0 ? (
             <p>No data</p>
           ) : (
@@ -120,11 +91,11 @@ export function AnalyticsPage(): JSX.Element {
 
       <section className="card">
         <h2>Funnel</h2>
-        {funnelQuery.isLoading ? <p>Loading...</p> : null}
-        {funnelQuery.isError ? (
-          <p className="error">{getErrorMessage(funnelQuery.error)}</p>
+        {dashboardQuery.isLoading ? <p>Loading...</p> : null}
+        {dashboardQuery.isError ? (
+          <p className="error">{getErrorMessage(dashboardQuery.error)}</p>
         ) : null}
-        {!funnelQuery.isLoading && !funnelQuery.isError ? (
+        {!dashboardQuery.isLoading && !dashboardQuery.isError ? (
           funnelData.length === 0 ? (
             <p>No data</p>
           ) : (
@@ -143,11 +114,11 @@ export function AnalyticsPage(): JSX.Element {
 
       <section className="card">
         <h2>Status duration</h2>
-        {statusDurationQuery.isLoading ? <p>Loading...</p> : null}
-        {statusDurationQuery.isError ? (
-          <p className="error">{getErrorMessage(statusDurationQuery.error)}</p>
+        {dashboardQuery.isLoading ? <p>Loading...</p> : null}
+        {dashboardQuery.isError ? (
+          <p className="error">{getErrorMessage(dashboardQuery.error)}</p>
         ) : null}
-        {!statusDurationQuery.isLoading && !statusDurationQuery.isError ? (
+        {!dashboardQuery.isLoading && !dashboardQuery.isError ? (
           statusDurationData.length === 0 ? (
             <p>No data</p>
           ) : (
@@ -166,11 +137,11 @@ export function AnalyticsPage(): JSX.Element {
 
       <section className="card">
         <h2>Recruiter performance</h2>
-        {recruiterQuery.isLoading ? <p>Loading...</p> : null}
-        {recruiterQuery.isError ? (
-          <p className="error">{getErrorMessage(recruiterQuery.error)}</p>
+        {dashboardQuery.isLoading ? <p>Loading...</p> : null}
+        {dashboardQuery.isError ? (
+          <p className="error">{getErrorMessage(dashboardQuery.error)}</p>
         ) : null}
-        {!recruiterQuery.isLoading && !recruiterQuery.isError ? (
+        {!dashboardQuery.isLoading && !dashboardQuery.isError ? (
           recruiterData.length === 0 ? (
             <p>No data</p>
           ) : (
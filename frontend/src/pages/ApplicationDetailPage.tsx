@@ -52,9 +52,9 @@ export function ApplicationDetailPage(): JSX.Element {
         body: { status: statusValue },
       });
     },
-    onSuccess: () => {
+    onSuccess: (application) => {
       setActionError("");
-      void queryClient.invalidateQueries({ queryKey: ["application", appId] });
+      queryClient.setQueryData(["application", appId], application);
       void queryClient.invalidateQueries({ queryKey: ["applications"] });
       void queryClient.invalidateQueries({ queryKey: ["timeline", appId] });
     },
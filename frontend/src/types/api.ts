@@ -30,6 +30,8 @@ export interface ApplicationOut {
   follow_up_at: string | null;
   status_updated_at: string | null;
   created_at: string;
+  updated_at: string;
+  version: number;
 }
 
 export interface PaginatedApplications {
@@ -79,3 +81,10 @@ export interface StatusDurationOut {
     avg_days: number | null;
   }>;
 }
+
+export interface AnalyticsDashboardOut {
+  summary?: ApplicationsSummaryOut;
+  funnel?: ApplicationsFunnelOut;
+  status_duration?: StatusDurationOut;
+  recruiter_performance?: RecruiterPerformanceOut;
+}